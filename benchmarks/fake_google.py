@@ -0,0 +1,392 @@
+"""In-process stand-in for the Sheets, Forms and Drive endpoints used by the app.
+
+The fake mimics the googleapiclient call shape (`service.files().list(...).execute()`),
+so it can be plugged in through `service_factory.set_service_provider` and exercised by
+the real repository and form service code.
+"""
+import copy
+import json
+import random
+import re
+import threading
+import time
+from collections import Counter
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import httplib2
+from googleapiclient.errors import HttpError
+
+_A1_PART = re.compile(r"^([A-Z]+)?(\d+)?$")
+
+def _column_index(letters: str) -> int:
+    index = 0
+    for char in letters:
+        index = index * 26 + (ord(char) - ord("A") + 1)
+    return index - 1
+
+def _split_a1_part(part: str) -> Tuple[Optional[str], Optional[str]]:
+    """Splits "D40" into its column letters and row number; either may be missing."""
+    match = _A1_PART.match(part)
+    if match is None:
+        raise ValueError(f"Unsupported A1 reference: {part!r}")
+    return match.group(1), match.group(2)
+
+def _parse_a1(range_name: str) -> Tuple[str, int, Optional[int], int, Optional[int]]:
+    """Parses "'Sheet'!A2:D40" into (sheet, first_col, last_col, first_row, last_row), 0-based."""
+    sheet, _, cells = range_name.rpartition("!")
+    start, _, end = cells.partition(":")
+    start_col, start_row = _split_a1_part(start)
+    end_col, end_row = _split_a1_part(end or start)
+    return (
+        sheet.strip("'"),
+        _column_index(start_col) if start_col else 0,
+        _column_index(end_col) if end_col else None,
+        int(start_row) - 1 if start_row else 0,
+        int(end_row) - 1 if end_row else None,
+    )
+
+class CallRecorder:
+    """Counts calls and bytes transferred per endpoint."""
+
+    def __init__(self) -> None:
+        self.calls: Counter = Counter()
+        self.bytes_transferred = 0
+        self.errors_injected = 0
+        self._lock = threading.Lock()
+
+    def record(self, endpoint: str, size: int) -> None:
+        with self._lock:
+            self.calls[endpoint] += 1
+            self.bytes_transferred += size
+
+    def record_error(self, endpoint: str) -> None:
+        """Counts a call that the fake failed on purpose."""
+        with self._lock:
+            self.calls[endpoint] += 1
+            self.errors_injected += 1
+
+    @property
+    def total_calls(self) -> int:
+        return sum(self.calls.values())
+
+class FakeRequest:
+    """A deferred call, executed like googleapiclient's HttpRequest."""
+
+    def __init__(self, server: "FakeGoogleServer", endpoint: str, handler: Callable[[], Any], body: Any = None):
+        self.server = server
+        self.endpoint = endpoint
+        self.handler = handler
+        self.body = body
+
+    @property
+    def methodId(self) -> str:
+        return self.endpoint
+
+    def execute(self) -> Any:
+        return self.server.handle(self)
+
+class FakeGoogleServer:
+    """Holds the fake sheet, forms and Drive files, plus latency and error injection settings."""
+
+    def __init__(
+        self,
+        rows: List[List],
+        sheet_title: str = "QuizData",
+        latency_ms: float = 0.0,
+        error_rate: float = 0.0,
+        seed: int = 0
+    ):
+        self.rows = rows
+        self.sheet_title = sheet_title
+        self.sheet_version = 1
+        self.latency_ms = latency_ms
+        self.error_rate = error_rate
+        self.recorder = CallRecorder()
+        self.forms: Dict[str, Dict[str, Any]] = {}
+        self.files: Dict[str, Dict[str, Any]] = {}
+        self.responses: Dict[str, List[Dict[str, Any]]] = {}
+        # Rows written to each response spreadsheet
+        self.written_rows: Dict[str, List[List]] = {}
+        self._next_id = 0
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def new_id(self, prefix: str) -> str:
+        with self._lock:
+            self._next_id += 1
+            return f"{prefix}{self._next_id}"
+
+    def handle(self, request: FakeRequest) -> Any:
+        if self.latency_ms:
+            time.sleep(self.latency_ms / 1000.0)
+        with self._lock:
+            fail = self.error_rate and self._random.random() < self.error_rate
+        if fail:
+            self.recorder.record_error(request.endpoint)
+            # A quota rejection, which is never applied server-side, so every kind of call may retry it
+            raise HttpError(httplib2.Response({"status": 429}), b'{"error": "injected"}')
+
+        result = request.handler()
+        size = len(json.dumps(request.body or {}, ensure_ascii=False)) + len(json.dumps(result, ensure_ascii=False))
+        self.recorder.record(request.endpoint, size)
+        return result
+
+    def service(self, api: str, version: str, credentials: Any = None) -> Any:
+        """Provider for `service_factory.set_service_provider`."""
+        if api == "sheets":
+            return FakeSheetsService(self)
+        if api == "forms":
+            return FakeFormsService(self)
+        if api == "drive":
+            return FakeDriveService(self)
+        raise ValueError(f"The fake server does not implement {api} {version}.")
+
+    def add_responses(self, form_id: str, count: int, start_second: int = 0) -> None:
+        """Submits count synthetic responses to a form, answering every question."""
+        questions = [
+            item["questionItem"]["question"]["questionId"]
+            for item in self.forms[form_id]["items"] if "questionItem" in item
+        ]
+        submitted = self.responses.setdefault(form_id, [])
+        for i in range(count):
+            second = start_second + i
+            submitted.append({
+                "responseId": self.new_id("response"),
+                "respondentEmail": f"participant{i}@example.com",
+                "lastSubmittedTime": f"2026-01-01T{second // 3600:02d}:{second // 60 % 60:02d}:{second % 60:02d}.{i % 1000:03d}Z",
+                "answers": {
+                    question_id: {"questionId": question_id, "textAnswers": {"answers": [{"value": f"Answer {n}"}]}}
+                    for n, question_id in enumerate(questions, start=1)
+                },
+            })
+
+    def read_range(self, range_name: str) -> Dict[str, Any]:
+        _, first_col, last_col, first_row, last_row = _parse_a1(range_name)
+        return {"range": range_name, "values": self.read_cells(first_row, last_row, first_col, last_col)}
+
+    def read_data_filter(self, data_filter: Dict[str, Any]) -> Dict[str, Any]:
+        """Reads the cells matched by a gridRange or a1Range data filter."""
+        if "a1Range" in data_filter:
+            return {"valueRange": self.read_range(data_filter["a1Range"]), "dataFilters": [data_filter]}
+        grid = data_filter["gridRange"]
+        end_row, end_col = grid.get("endRowIndex"), grid.get("endColumnIndex")
+        values = self.read_cells(
+            grid.get("startRowIndex", 0),
+            None if end_row is None else end_row - 1,
+            grid.get("startColumnIndex", 0),
+            None if end_col is None else end_col - 1
+        )
+        return {"valueRange": {"values": values}, "dataFilters": [data_filter]}
+
+    def read_cells(self, first_row: int, last_row: Optional[int], first_col: int, last_col: Optional[int]) -> List[List]:
+        """Returns a block of cells (0-based, inclusive), trimmed like the Sheets API does."""
+        selected = self.rows[first_row:None if last_row is None else last_row + 1]
+        values = []
+        for row in selected:
+            cells = row[first_col:None if last_col is None else last_col + 1]
+            # Sheets trims trailing empty cells
+            while cells and cells[-1] == "":
+                cells = cells[:-1]
+            values.append(cells)
+        # ... and trailing empty rows
+        while values and not values[-1]:
+            values.pop()
+        return values
+
+class FakeSheetsService:
+    def __init__(self, server: FakeGoogleServer):
+        self.server = server
+
+    def spreadsheets(self) -> "FakeSheetsService":
+        return self
+
+    def values(self) -> "FakeSheetsService":
+        return self
+
+    def get(self, spreadsheetId: str, fields: Optional[str] = None, range: Optional[str] = None, **kwargs) -> FakeRequest:
+        if range is not None:
+            return FakeRequest(self.server, "sheets.values.get", lambda: self.server.read_range(range))
+        result = {"sheets": [{"properties": {"title": self.server.sheet_title, "sheetId": 0}}]}
+        return FakeRequest(self.server, "sheets.spreadsheets.get", lambda: result)
+
+    def batchGetByDataFilter(self, spreadsheetId: str, body: Dict[str, Any], **kwargs) -> FakeRequest:
+        def handler() -> Dict[str, Any]:
+            return {
+                "spreadsheetId": spreadsheetId,
+                "valueRanges": [self.server.read_data_filter(f) for f in body.get("dataFilters", [])]
+            }
+        return FakeRequest(self.server, "sheets.values.batchGetByDataFilter", handler, body)
+
+    def update(self, spreadsheetId: str, range: str, body: Dict[str, Any], **kwargs) -> FakeRequest:
+        def handler() -> Dict[str, Any]:
+            rows = self.server.written_rows.setdefault(spreadsheetId, [])
+            _, _, _, first_row, _ = _parse_a1(range)
+            for offset, values in enumerate(body.get("values", [])):
+                while len(rows) <= first_row + offset:
+                    rows.append([])
+                rows[first_row + offset] = values
+            return {"updatedRows": len(body.get("values", []))}
+        return FakeRequest(self.server, "sheets.values.update", handler, body)
+
+    def append(self, spreadsheetId: str, range: str, body: Dict[str, Any], **kwargs) -> FakeRequest:
+        def handler() -> Dict[str, Any]:
+            self.server.written_rows.setdefault(spreadsheetId, []).extend(body.get("values", []))
+            return {"updates": {"updatedRows": len(body.get("values", []))}}
+        return FakeRequest(self.server, "sheets.values.append", handler, body)
+
+class FakeFormsService:
+    def __init__(self, server: FakeGoogleServer):
+        self.server = server
+
+    def forms(self) -> "FakeFormsService":
+        return self
+
+    def create(self, body: Dict[str, Any]) -> FakeRequest:
+        def handler() -> Dict[str, Any]:
+            form_id = self.server.new_id("form")
+            form: Dict[str, Any] = {"formId": form_id, "info": dict(body.get("info", {})), "items": []}
+            self.server.forms[form_id] = form
+            self.server.files[form_id] = {"id": form_id, "name": form["info"].get("title", "")}
+            return {"formId": form_id, "info": form["info"]}
+        return FakeRequest(self.server, "forms.create", handler, body)
+
+    def responses(self) -> "FakeFormResponses":
+        return FakeFormResponses(self.server)
+
+    def get(self, formId: str, **kwargs) -> FakeRequest:
+        def handler() -> Dict[str, Any]:
+            if formId not in self.server.forms:
+                raise HttpError(httplib2.Response({"status": 404}), b'{"error": "not found"}')
+            return json.loads(json.dumps(self.server.forms[formId]))
+        return FakeRequest(self.server, "forms.get", handler)
+
+    def batchUpdate(self, formId: str, body: Dict[str, Any]) -> FakeRequest:
+        def handler() -> Dict[str, Any]:
+            form = self.server.forms[formId]
+            items = form["items"]
+            replies: List[Dict[str, Any]] = []
+            for request in body.get("requests", []):
+                reply: Dict[str, Any] = {}
+                if "createItem" in request:
+                    item = json.loads(json.dumps(request["createItem"]["item"]))
+                    item["itemId"] = self.server.new_id("item")
+                    reply = {"createItem": {"itemId": item["itemId"]}}
+                    if "questionItem" in item:
+                        item["questionItem"]["question"]["questionId"] = self.server.new_id("question")
+                        reply["createItem"]["questionId"] = [item["questionItem"]["question"]["questionId"]]
+                    items.insert(request["createItem"]["location"]["index"], item)
+                elif "updateItem" in request:
+                    index = request["updateItem"]["location"]["index"]
+                    items[index] = dict(request["updateItem"]["item"], itemId=items[index].get("itemId"))
+                elif "deleteItem" in request:
+                    del items[request["deleteItem"]["location"]["index"]]
+                elif "updateFormInfo" in request:
+                    form["info"].update(request["updateFormInfo"]["info"])
+                replies.append(reply)
+            return {"replies": replies}
+        return FakeRequest(self.server, "forms.batchUpdate", handler, body)
+
+_TIMESTAMP_FILTER = re.compile(r"timestamp > (\S+)")
+
+class FakeFormResponses:
+    def __init__(self, server: FakeGoogleServer):
+        self.server = server
+
+    def list(
+        self,
+        formId: str,
+        filter: Optional[str] = None,
+        pageSize: int = 5000,
+        pageToken: Optional[str] = None,
+        **kwargs
+    ) -> FakeRequest:
+        def handler() -> Dict[str, Any]:
+            responses = self.server.responses.get(formId, [])
+            match = _TIMESTAMP_FILTER.search(filter or "")
+            if match:
+                # The synthetic timestamps all have millisecond precision, so they compare as strings
+                responses = [r for r in responses if r["lastSubmittedTime"] > match.group(1)]
+            start = int(pageToken or 0)
+            result: Dict[str, Any] = {"responses": responses[start:start + pageSize]}
+            if start + pageSize < len(responses):
+                result["nextPageToken"] = str(start + pageSize)
+            return result
+        return FakeRequest(self.server, "forms.responses.list", handler)
+
+_NAME_QUERY = re.compile(r"name (=|contains) '((?:[^'\\]|\\.)*)'")
+
+class FakeDriveService:
+    def __init__(self, server: FakeGoogleServer):
+        self.server = server
+
+    def files(self) -> "FakeDriveService":
+        return self
+
+    def list(self, q: str = "", pageSize: int = 100, pageToken: Optional[str] = None, **kwargs) -> FakeRequest:
+        def handler() -> Dict[str, Any]:
+            match = _NAME_QUERY.search(q)
+            files = list(self.server.files.values())
+            if match:
+                operator, value = match.group(1), match.group(2).replace("\\'", "'")
+                if operator == "=":
+                    files = [f for f in files if f["name"] == value]
+                else:
+                    files = [f for f in files if f["name"].startswith(value)]
+            start = int(pageToken or 0)
+            result: Dict[str, Any] = {"files": files[start:start + pageSize]}
+            if start + pageSize < len(files):
+                result["nextPageToken"] = str(start + pageSize)
+            return result
+        return FakeRequest(self.server, "drive.files.list", handler)
+
+    def get(self, fileId: str, fields: Optional[str] = None, **kwargs) -> FakeRequest:
+        def handler() -> Dict[str, Any]:
+            if fileId in self.server.files:
+                return dict(self.server.files[fileId])
+            # Anything else is treated as the source spreadsheet
+            return {"version": str(self.server.sheet_version), "modifiedTime": f"2026-01-01T00:00:{self.server.sheet_version:02d}Z"}
+        return FakeRequest(self.server, "drive.files.get", handler)
+
+    def copy(self, fileId: str, body: Dict[str, Any], **kwargs) -> FakeRequest:
+        def handler() -> Dict[str, Any]:
+            form_id = self.server.new_id("form")
+            # A copy keeps the items of the form it was copied from
+            items = copy.deepcopy(self.server.forms.get(fileId, {}).get("items", []))
+            self.server.forms[form_id] = {"formId": form_id, "info": {"title": body.get("name", "")}, "items": items}
+            self.server.files[form_id] = {"id": form_id, "name": body.get("name", ""), "parents": list(body.get("parents", []))}
+            return {"id": form_id, "name": body.get("name", "")}
+        return FakeRequest(self.server, "drive.files.copy", handler, body)
+
+    def update(
+        self,
+        fileId: str,
+        body: Dict[str, Any],
+        addParents: Optional[str] = None,
+        removeParents: Optional[str] = None,
+        **kwargs
+    ) -> FakeRequest:
+        def handler() -> Dict[str, Any]:
+            if fileId not in self.server.files:
+                raise HttpError(httplib2.Response({"status": 404}), b'{"error": "not found"}')
+            file = self.server.files[fileId]
+            file.update(body)
+            parents = [p for p in file.get("parents", []) if p != removeParents]
+            file["parents"] = parents + ([addParents] if addParents else [])
+            return {"id": fileId}
+        return FakeRequest(self.server, "drive.files.update", handler, body)
+
+def make_synthetic_rows(row_count: int, questions_per_week: int = 10) -> List[List]:
+    """Builds a sheet with a header and row_count question rows, following docs/design/SHEET_SCHEMA.md."""
+    rows: List[List] = [[
+        "Q_id", "Week", "Dates", "Portion", "Order", "Tamil Question",
+        "Scripture (NKJV)", "Tamil Answer", "English Question (NKJV)", "English Answer"
+    ]]
+    for i in range(row_count):
+        week = i // questions_per_week + 1
+        order = i % questions_per_week + 1
+        rows.append([
+            f"Q{order}", str(week), f"Week {week} dates", f"Gen {week}", str(order),
+            f"கேள்வி {week}.{order}", f"Gen {week}:{order}", f"பதில் {order}",
+            f"Question {week}.{order}?", f"Answer {order}"
+        ])
+    return rows
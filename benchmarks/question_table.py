@@ -0,0 +1,96 @@
+"""Compares QuestionTable with one validated Pydantic Question per row, in memory and throughput.
+
+Usage (from the project root):
+    python -m benchmarks.question_table                     # default sheet sizes
+    python -m benchmarks.question_table --sizes 2000,50000
+"""
+import argparse
+import gc
+import sys
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List, Tuple
+
+from rich.console import Console
+from rich.table import Table
+
+from benchmarks.fake_google import make_synthetic_rows
+from src.domain.models import Language, Question, Quiz, QuizMetadata
+from src.domain.question_table import QuestionTable
+
+DEFAULT_SIZES = "2000,10000,50000"
+
+console = Console()
+
+def _load_models(rows: List[List]) -> Dict[Tuple[int, Language], List[Question]]:
+    """The previous approach: a validated Question for every row and language."""
+    questions: Dict[Tuple[int, Language], List[Question]] = {}
+    for row in rows[1:]:
+        week = int(row[1])
+        for lang, (text, answer) in ((Language.TAMIL, (5, 7)), (Language.ENGLISH, (8, 9))):
+            questions.setdefault((week, lang), []).append(Question(
+                id=row[0], week=week, text=row[text], answer=row[answer], scripture=row[6]
+            ))
+    return questions
+
+def _load_table(rows: List[List]) -> QuestionTable:
+    body = rows[1:]
+    return QuestionTable(
+        ids=[row[0] for row in body],
+        weeks=[int(row[1]) for row in body],
+        scriptures=[row[6] for row in body],
+        texts={Language.TAMIL: [row[5] for row in body], Language.ENGLISH: [row[8] for row in body]},
+        answers={Language.TAMIL: [row[7] for row in body], Language.ENGLISH: [row[9] for row in body]},
+    )
+
+def _measure(build: Callable[[], Any]) -> Tuple[Any, float, int]:
+    """Returns (result, seconds, bytes still allocated by the result)."""
+    gc.collect()
+    tracemalloc.start()
+    started = time.perf_counter()
+    result = build()
+    elapsed = time.perf_counter() - started
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, elapsed, retained
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", default=DEFAULT_SIZES, help="Comma-separated synthetic sheet sizes (rows)")
+    args = parser.parse_args()
+
+    metadata = QuizMetadata(week=1, dates="dates", portion="portion")
+
+    table = Table(title="Question Storage", show_header=True, header_style="bold magenta")
+    table.add_column("Rows", justify="right")
+    table.add_column("Approach")
+    table.add_column("Load (ms)", justify="right")
+    table.add_column("Memory (KiB)", justify="right")
+    table.add_column("Week quiz (µs)", justify="right")
+
+    for size in (int(s) for s in args.sizes.split(",")):
+        rows = make_synthetic_rows(size)
+        weeks = sorted({int(row[1]) for row in rows[1:]})
+
+        models, model_s, model_bytes = _measure(lambda: _load_models(rows))
+        started = time.perf_counter()
+        for week in weeks:
+            Quiz(metadata=metadata, language=Language.ENGLISH, questions=models[(week, Language.ENGLISH)])
+        model_quiz_us = (time.perf_counter() - started) / len(weeks) * 1_000_000
+        del models
+
+        question_table, table_s, table_bytes = _measure(lambda: _load_table(rows))
+        started = time.perf_counter()
+        for week in weeks:
+            Quiz.model_construct(metadata=metadata, language=Language.ENGLISH, questions=question_table.questions(week, Language.ENGLISH))
+        table_quiz_us = (time.perf_counter() - started) / len(weeks) * 1_000_000
+
+        table.add_row(f"{size:,}", "Pydantic per row", f"{model_s * 1000:.1f}", f"{model_bytes / 1024:,.0f}", f"{model_quiz_us:.1f}")
+        table.add_row("", "QuestionTable", f"{table_s * 1000:.1f}", f"{table_bytes / 1024:,.0f}", f"{table_quiz_us:.1f}")
+
+    console.print(table)
+    console.print("[dim]Week quiz: time to build one week's Quiz from the loaded questions (English).[/dim]")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,190 @@
+"""Benchmarks preview, single create, multi-week create and response ingestion against the local fake Google APIs.
+
+For the ingest scenario the size is the number of responses per form rather than sheet rows.
+
+Usage (from the project root):
+    python -m benchmarks.run_benchmarks                     # print the results table
+    python -m benchmarks.run_benchmarks --check             # fail if API call counts regress
+    python -m benchmarks.run_benchmarks --update-baseline   # accept the current call counts
+"""
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+from typing import Callable, Dict, List, Optional
+
+# Settings are required at import time; the fake does not care about the actual IDs
+for _name in ("SOURCE_SPREADSHEET_ID", "TAMIL_RESPONSE_SPREADSHEET_ID", "ENGLISH_RESPONSE_SPREADSHEET_ID"):
+    os.environ.setdefault(_name, "benchmark")
+
+from google.oauth2.credentials import Credentials
+from rich.console import Console
+from rich.table import Table
+
+from benchmarks.fake_google import CallRecorder, FakeGoogleServer, make_synthetic_rows
+from src.application.bulk_create_quiz import BulkCreateQuizUseCase
+from src.application.create_quiz import CreateQuizUseCase
+from src.application.ingest_responses import IngestResponsesUseCase
+from src.application.preview_quiz import PreviewQuizUseCase
+from src.infrastructure.config.settings import settings
+from src.infrastructure.google.execution import api_executor
+from src.infrastructure.google.forms import GoogleFormService
+from src.infrastructure.google.responses import GoogleResponseSheetWriter, GoogleResponseSource
+from src.infrastructure.google.service_factory import set_service_provider
+from src.infrastructure.google.sheets import GoogleSheetRepository
+from src.infrastructure.storage.ingestion_log import SqliteIngestionLog
+from src.infrastructure.storage.score_store import SqliteScoreStore
+
+BASELINE_PATH = os.path.join(os.path.dirname(__file__), "baseline.json")
+DEFAULT_SIZES = "50,500,2000,10000"
+BULK_WEEKS = list(range(1, 14))
+
+console = Console()
+
+# The fake ignores credentials; this only satisfies the services' constructors
+_CREDENTIALS = Credentials(token="benchmark")
+
+def _scenario_preview() -> None:
+    PreviewQuizUseCase(GoogleSheetRepository(_CREDENTIALS)).execute(1)
+
+def _scenario_create() -> None:
+    CreateQuizUseCase(GoogleSheetRepository(_CREDENTIALS), GoogleFormService(_CREDENTIALS)).execute(1)
+
+def _scenario_bulk_create() -> None:
+    use_case = BulkCreateQuizUseCase(
+        GoogleSheetRepository(_CREDENTIALS),
+        GoogleFormService(_CREDENTIALS),
+        max_workers=settings.BULK_MAX_WORKERS
+    )
+    use_case.execute(use_case.prepare(BULK_WEEKS))
+
+def _setup_ingest(server: FakeGoogleServer, size: int) -> None:
+    """Publishes week 1 and submits `size` responses to each of its forms."""
+    CreateQuizUseCase(GoogleSheetRepository(_CREDENTIALS), GoogleFormService(_CREDENTIALS)).execute(1)
+    for form_id in list(server.forms):
+        server.add_responses(form_id, size)
+
+def _scenario_ingest() -> None:
+    IngestResponsesUseCase(
+        GoogleResponseSource(_CREDENTIALS),
+        GoogleResponseSheetWriter(_CREDENTIALS),
+        SqliteIngestionLog(settings.LOCAL_STORE_PATH),
+        chunk_size=settings.RESPONSE_WRITE_CHUNK_SIZE,
+        sheet_repo=GoogleSheetRepository(_CREDENTIALS),
+        score_store=SqliteScoreStore(settings.LOCAL_STORE_PATH)
+    ).execute(settings.QUIZ_YEAR, [1])
+
+SCENARIOS: Dict[str, Callable[[], None]] = {
+    "preview": _scenario_preview,
+    "create": _scenario_create,
+    "bulk_create": _scenario_bulk_create,
+    "ingest": _scenario_ingest,
+}
+
+# Untimed preparation for a scenario; its API calls are not counted
+SETUPS: Dict[str, Callable[[FakeGoogleServer, int], None]] = {
+    "ingest": _setup_ingest,
+}
+
+def _percentile(samples: List[float], fraction: float) -> float:
+    ordered = sorted(samples)
+    return ordered[int(round((len(ordered) - 1) * fraction))]
+
+def run_scenario(name: str, row_count: int, iterations: int, latency_ms: float, error_rate: float) -> Dict:
+    """Runs one scenario cold (fresh fake server and local store) for each iteration."""
+    rows = make_synthetic_rows(row_count)
+    durations = []
+    server: Optional[FakeGoogleServer] = None
+    for _ in range(iterations):
+        server = FakeGoogleServer(rows, latency_ms=latency_ms, error_rate=error_rate)
+        set_service_provider(server.service)
+        with tempfile.TemporaryDirectory() as tmp:
+            settings.LOCAL_STORE_PATH = os.path.join(tmp, "quiz_store.db")
+            setup: Optional[Callable[[FakeGoogleServer, int], None]] = SETUPS.get(name)
+            if setup:
+                setup(server, row_count)
+                server.recorder = CallRecorder()
+            api_executor.reset_budget()
+            started = time.perf_counter()
+            SCENARIOS[name]()
+            durations.append(time.perf_counter() - started)
+    set_service_provider(None)
+    assert server is not None, "at least one iteration is needed"
+
+    return {
+        "calls": server.recorder.total_calls,
+        "calls_by_endpoint": dict(sorted(server.recorder.calls.items())),
+        "bytes": server.recorder.bytes_transferred,
+        "p50_ms": _percentile(durations, 0.5) * 1000,
+        "p95_ms": _percentile(durations, 0.95) * 1000,
+    }
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", default=DEFAULT_SIZES, help="Comma-separated synthetic sheet sizes (rows)")
+    parser.add_argument("--scenarios", default=",".join(SCENARIOS), help="Comma-separated scenarios to run")
+    parser.add_argument("--iterations", type=int, default=5, help="Cold runs per scenario and size")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="Simulated latency per API call")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of API calls that are rejected with a 429")
+    parser.add_argument("--json", dest="json_path", help="Also write the raw results to this file")
+    parser.add_argument("--check", action="store_true", help="Exit non-zero if call counts exceed the baseline")
+    parser.add_argument("--update-baseline", action="store_true", help="Store the current call counts as the baseline")
+    args = parser.parse_args()
+
+    # Measure our own behaviour, not the client-side throttling
+    settings.TEMPLATE_FORM_ID = settings.TEMPLATE_FORM_ID or "benchmark-template"
+    api_executor.buckets.clear()
+    api_executor.base_delay = 0.01
+
+    results: Dict[str, Dict] = {}
+    for name in args.scenarios.split(","):
+        for size in (int(s) for s in args.sizes.split(",")):
+            key = f"{name}@{size}"
+            with console.status(f"Running {key}..."):
+                results[key] = run_scenario(name, size, args.iterations, args.latency_ms, args.error_rate)
+
+    table = Table(title="Benchmark Results", show_header=True, header_style="bold magenta")
+    table.add_column("Scenario")
+    table.add_column("API Calls", justify="right")
+    table.add_column("Bytes", justify="right")
+    table.add_column("p50 (ms)", justify="right")
+    table.add_column("p95 (ms)", justify="right")
+    for key, result in results.items():
+        table.add_row(key, str(result["calls"]), f"{result['bytes']:,}", f"{result['p50_ms']:.1f}", f"{result['p95_ms']:.1f}")
+    console.print(table)
+
+    if args.json_path:
+        with open(args.json_path, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+
+    if args.update_baseline:
+        baseline = {key: {"calls": result["calls"]} for key, result in results.items()}
+        with open(BASELINE_PATH, "w", encoding="utf-8") as f:
+            json.dump(baseline, f, indent=2)
+            f.write("\n")
+        console.print(f"[bold green]Baseline updated:[/bold green] {BASELINE_PATH}")
+
+    if args.check:
+        if args.error_rate:
+            console.print("[yellow]Skipping the call count check: retries from --error-rate inflate the counts.[/yellow]")
+            return 0
+        with open(BASELINE_PATH, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = [
+            f"{key}: {result['calls']} calls (baseline {baseline[key]['calls']})"
+            for key, result in results.items()
+            if key in baseline and result["calls"] > baseline[key]["calls"]
+        ]
+        if regressions:
+            console.print("[bold red]API call count regressions:[/bold red]")
+            for line in regressions:
+                console.print(f"  • {line}")
+            return 1
+        console.print("[bold green]No API call count regressions.[/bold green]")
+
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,125 @@
+"""Measures CLI cold-start import time with `python -X importtime` and holds it to a budget.
+
+Usage (from the project root):
+    python -m benchmarks.startup                    # print the results table
+    python -m benchmarks.startup --check            # fail if over budget or a heavy module leaks in
+    python -m benchmarks.startup --update-budget    # store the current timings (+50% headroom) as the budget
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from typing import Dict, List, Set, Tuple
+
+from rich.console import Console
+from rich.table import Table
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BUDGET_PATH = os.path.join(os.path.dirname(__file__), "startup_budget.json")
+CLI_PATH = os.path.join("src", "interfaces", "cli", "main.py")
+
+# Each scenario is the command line to time and the top-level modules it must never import
+SCENARIOS: Dict[str, Tuple[List[str], Set[str]]] = {
+    "--help": (
+        [CLI_PATH, "--help"],
+        {"googleapiclient", "google_auth_oauthlib", "gradio", "pandas", "pydantic", "pydantic_settings"},
+    ),
+    # What the preview command loads before its first API call
+    "preview": (
+        ["-c", (
+            "import src.interfaces.cli.main, src.infrastructure.google.auth, "
+            "src.infrastructure.google.sheets, src.application.preview_quiz"
+        )],
+        {"gradio", "pandas"},
+    ),
+}
+
+console = Console()
+
+def measure(args: List[str]) -> Tuple[float, Set[str]]:
+    """Runs one cold start and returns (total import time in ms, top-level packages imported)."""
+    env = dict(os.environ, PYTHONPATH=PROJECT_ROOT)
+    # Settings are required at import time; the values do not matter here
+    for name in ("SOURCE_SPREADSHEET_ID", "TAMIL_RESPONSE_SPREADSHEET_ID", "ENGLISH_RESPONSE_SPREADSHEET_ID"):
+        env.setdefault(name, "benchmark")
+
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", *args],
+        cwd=PROJECT_ROOT,
+        env=env,
+        capture_output=True,
+        text=True
+    )
+
+    total_us = 0
+    packages = set()
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        if not cumulative.strip().isdigit():
+            continue # Header line
+        packages.add(name.strip().split(".")[0])
+        # Un-indented names are imported directly by the command; nested ones are already in their parent
+        if not name[1:].startswith(" "):
+            total_us += int(cumulative)
+    return total_us / 1000.0, packages
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5, help="Cold starts per scenario (the median is reported)")
+    parser.add_argument("--check", action="store_true", help="Exit non-zero if a scenario is over budget")
+    parser.add_argument("--update-budget", action="store_true", help="Store the current timings as the budget")
+    args = parser.parse_args()
+
+    budget: Dict[str, Dict[str, float]] = {}
+    if os.path.exists(BUDGET_PATH):
+        with open(BUDGET_PATH, "r", encoding="utf-8") as f:
+            budget = json.load(f)
+
+    table = Table(title="CLI Startup (python -X importtime)", show_header=True, header_style="bold magenta")
+    table.add_column("Scenario")
+    table.add_column("Median import (ms)", justify="right")
+    table.add_column("Budget (ms)", justify="right")
+    table.add_column("Forbidden modules loaded", style="red")
+
+    failures = []
+    results: Dict[str, float] = {}
+    for name, (command, forbidden) in SCENARIOS.items():
+        samples = []
+        leaked: Set[str] = set()
+        for _ in range(args.runs):
+            elapsed, packages = measure(command)
+            samples.append(elapsed)
+            leaked |= packages & forbidden
+        results[name] = statistics.median(samples)
+
+        limit = budget.get(name, {}).get("import_ms")
+        table.add_row(name, f"{results[name]:.0f}", f"{limit:.0f}" if limit else "-", ", ".join(sorted(leaked)))
+        if leaked:
+            failures.append(f"{name}: imports {', '.join(sorted(leaked))}")
+        if limit and results[name] > limit:
+            failures.append(f"{name}: {results[name]:.0f} ms (budget {limit:.0f} ms)")
+
+    console.print(table)
+
+    if args.update_budget:
+        with open(BUDGET_PATH, "w", encoding="utf-8") as f:
+            json.dump({name: {"import_ms": round(value * 1.5)} for name, value in results.items()}, f, indent=2)
+            f.write("\n")
+        console.print(f"[bold green]Budget updated:[/bold green] {BUDGET_PATH}")
+
+    if args.check:
+        if failures:
+            console.print("[bold red]Startup regressions:[/bold red]")
+            for line in failures:
+                console.print(f"  • {line}")
+            return 1
+        console.print("[bold green]Startup is within budget.[/bold green]")
+
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
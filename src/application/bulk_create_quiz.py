@@ -0,0 +1,78 @@
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextvars import copy_context
+from typing import Callable, List, Optional
+from pydantic import BaseModel
+
+from src.application.ports.interfaces import SheetRepository, FormService
+from src.application.preview_quiz import PreviewQuizUseCase, PreviewResult
+from src.domain.exceptions import PreviewChangedError
+from src.domain.models import Language, Quiz
+
+class BulkJobResult(BaseModel):
+    """Outcome of creating the form for one (week, language) pair."""
+    week: int
+    language: Language
+    form_url: Optional[str] = None
+    error: Optional[str] = None
+
+    @property
+    def succeeded(self) -> bool:
+        return self.form_url is not None
+
+class BulkCreateQuizResult(BaseModel):
+    """Container for the results of a multi-week creation run."""
+    jobs: List[BulkJobResult]
+
+    @property
+    def failed_jobs(self) -> List[BulkJobResult]:
+        return [job for job in self.jobs if not job.succeeded]
+
+class BulkCreateQuizUseCase:
+    """Use case to create the forms for many weeks at once using a bounded worker pool."""
+
+    def __init__(self, sheet_repo: SheetRepository, form_service: FormService, max_workers: int = 4):
+        self.preview_use_case = PreviewQuizUseCase(sheet_repo)
+        self.form_service = form_service
+        self.max_workers = max_workers
+
+    def prepare(self, weeks: List[int], language: Optional[Language] = None) -> List[PreviewResult]:
+        """Builds the quizzes for every requested week. Weeks without data are left out."""
+        # One read for the whole run instead of one per week
+        languages = [language] if language else list(Language)
+        self.preview_use_case.sheet_repo.prefetch(weeks, languages)
+
+        previews = []
+        for week in weeks:
+            result = self.preview_use_case.execute(week, language=language)
+            if result:
+                previews.append(result)
+        return previews
+
+    def _create_one(self, quiz: Quiz) -> BulkJobResult:
+        try:
+            form_url = self.form_service.create_form(quiz.validated())
+            return BulkJobResult(week=quiz.metadata.week, language=quiz.language, form_url=form_url)
+        except Exception as e:
+            return BulkJobResult(week=quiz.metadata.week, language=quiz.language, error=str(e))
+
+    def execute(
+        self,
+        previews: List[PreviewResult],
+        on_progress: Optional[Callable[[BulkJobResult], None]] = None
+    ) -> BulkCreateQuizResult:
+        """Creates forms for every prepared (week, language) pair, reporting each finished job to on_progress."""
+        if not all(preview.is_unchanged() for preview in previews):
+            raise PreviewChangedError()
+        quizzes = [quiz for preview in previews for quiz in preview.quizzes]
+
+        jobs = []
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            futures = [pool.submit(copy_context().run, self._create_one, quiz) for quiz in quizzes]
+            for future in as_completed(futures):
+                job = future.result()
+                jobs.append(job)
+                if on_progress:
+                    on_progress(job)
+
+        jobs.sort(key=lambda job: (job.week, job.language.value))
+        return BulkCreateQuizResult(jobs=jobs)
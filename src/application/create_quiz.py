@@ -1,14 +1,18 @@
-import os
-from typing import List, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
+from typing import Callable, List, Optional, Tuple
 from pydantic import BaseModel
 
 from src.application.ports.interfaces import SheetRepository, FormService
+from src.application.preview_quiz import PreviewQuizUseCase, PreviewResult
+from src.domain.exceptions import PreviewChangedError
 from src.domain.models import Language, Quiz, QuizMetadata
 
 class CreateQuizResult(BaseModel):
     """Container for the results of creating all language forms for a week."""
     metadata: QuizMetadata
     created_forms: List[Tuple[Language, str]] # (Language, Form URL)
+    failed_forms: List[Tuple[Language, str]] = [] # (Language, Error message)
 
 class CreateQuizUseCase:
     """Use case to fetch quiz data and create actual Google Forms."""
@@ -17,49 +21,57 @@ class CreateQuizUseCase:
         self.sheet_repo = sheet_repo
         self.form_service = form_service
 
-    def _get_custom_description(self, lang: Language, metadata: QuizMetadata) -> Optional[str]:
-        """Loads and formats the language-specific description from .md files."""
-        file_name = "English.md" if lang == Language.ENGLISH else "Tamil.md"
-        if not os.path.exists(file_name):
-            return None
-            
-        with open(file_name, "r", encoding="utf-8") as f:
-            lines = f.readlines()
-            
-        if not lines:
-            return None
-            
-        # The first line is replaced by our dynamic metadata
-        dynamic_header = f"Week {metadata.week} | {metadata.dates} | {metadata.portion}"
-        # Skip the first line and join the rest
-        body = "".join(lines[1:]).strip()
-        
-        return f"{dynamic_header}\n\n{body}"
-
     def execute(self, week: int, language: Optional[Language] = None) -> Optional[CreateQuizResult]:
         """Fetches metadata and questions, then creates forms for specific or all languages."""
-        metadata = self.sheet_repo.get_quiz_metadata(week)
-        if not metadata:
+        preview = PreviewQuizUseCase(self.sheet_repo).execute(week, language=language)
+        if not preview:
             return None
 
-        # Determine which languages to process
-        languages_to_process = [language] if language else [Language.ENGLISH, Language.TAMIL]
+        return self.publish(preview)
+
+    def _publish_one(self, quiz: Quiz, on_stage: Optional[Callable[[str], None]]) -> str:
+        # Validation is deferred to here, so previews of large sheets stay cheap
+        return self.form_service.create_form(quiz.validated(), on_stage)
+
+    def publish(
+        self,
+        preview: PreviewResult,
+        on_stage: Optional[Callable[[Language, str], None]] = None
+    ) -> CreateQuizResult:
+        """Creates forms for exactly the quizzes in a preview, without reading the sheet again.
 
+        Args:
+            preview (PreviewResult): The previewed quizzes to publish.
+            on_stage (Optional[Callable[[Language, str], None]]): Receives (language, stage) progress updates.
+
+        Returns:
+            CreateQuizResult: The created form URLs and any per-language errors.
+
+        Raises:
+            PreviewChangedError: If the quizzes were altered after the preview was built.
+        """
+        if not preview.is_unchanged():
+            raise PreviewChangedError()
+        quizzes = preview.quizzes
+
+        def stage_reporter(lang: Language) -> Optional[Callable[[str], None]]:
+            if not on_stage:
+                return None
+            return lambda stage: on_stage(lang, stage)
+
+        # Each form is network-bound, so build all languages at the same time
         created_forms = []
-        for lang in languages_to_process:
-            questions = self.sheet_repo.get_questions(week, lang)
-            if questions:
-                custom_desc = self._get_custom_description(lang, metadata)
-                quiz = Quiz(
-                    metadata=metadata,
-                    language=lang,
-                    questions=questions,
-                    custom_description=custom_desc
-                )
-                form_url = self.form_service.create_form(quiz)
-                created_forms.append((lang, form_url))
-        
-        if not created_forms:
-            return None
+        failed_forms = []
+        with ThreadPoolExecutor(max_workers=len(quizzes)) as pool:
+            futures = [
+                # Run each in a copy of this context so the caller's API call budget scope carries over
+                (quiz.language, pool.submit(copy_context().run, self._publish_one, quiz, stage_reporter(quiz.language)))
+                for quiz in quizzes
+            ]
+            for lang, future in futures:
+                try:
+                    created_forms.append((lang, future.result()))
+                except Exception as e:
+                    failed_forms.append((lang, str(e)))
 
-        return CreateQuizResult(metadata=metadata, created_forms=created_forms)
+        return CreateQuizResult(metadata=preview.metadata, created_forms=created_forms, failed_forms=failed_forms)
@@ -0,0 +1,50 @@
+from typing import Callable, List, Optional
+from pydantic import BaseModel
+
+from src.application.ports.interfaces import QuizExporter, SheetRepository
+from src.application.preview_quiz import PreviewQuizUseCase
+from src.domain.models import Language
+
+class ExportQuizResult(BaseModel):
+    """Summary of an export run."""
+    exported_weeks: List[int]
+    missing_weeks: List[int]
+    quiz_count: int
+
+class ExportQuizUseCase:
+    """Use case to write the quizzes of one or more weeks to an offline format, without any Forms or Drive calls.
+
+    Quizzes are handed to the exporter one week at a time, so memory use does not grow with the number of weeks.
+    """
+
+    def __init__(self, sheet_repo: SheetRepository, exporter: QuizExporter):
+        self.preview_use_case = PreviewQuizUseCase(sheet_repo)
+        self.exporter = exporter
+
+    def execute(
+        self,
+        weeks: List[int],
+        language: Optional[Language] = None,
+        on_progress: Optional[Callable[[int], None]] = None
+    ) -> ExportQuizResult:
+        """Exports every requested week in order, reporting each finished week to on_progress."""
+        # One read for the whole run instead of one per week
+        languages = [language] if language else list(Language)
+        self.preview_use_case.sheet_repo.prefetch(weeks, languages)
+
+        exported, missing, quiz_count = [], [], 0
+        self.exporter.begin()
+        for week in weeks:
+            preview = self.preview_use_case.execute(week, language=language)
+            if preview:
+                for quiz in preview.quizzes:
+                    self.exporter.write_quiz(quiz)
+                    quiz_count += 1
+                exported.append(week)
+            else:
+                missing.append(week)
+            if on_progress:
+                on_progress(week)
+        self.exporter.finish()
+
+        return ExportQuizResult(exported_weeks=exported, missing_weeks=missing, quiz_count=quiz_count)
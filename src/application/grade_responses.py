@@ -0,0 +1,36 @@
+from typing import List, Optional
+
+from src.application.ports.interfaces import ResponseSource, SheetRepository
+from src.application.preview_quiz import PreviewQuizUseCase
+from src.domain.grading import GradingResult, QuizGrader
+from src.domain.models import Language
+
+class GradeResponsesUseCase:
+    """Use case to grade every submission of a week's forms against the sheet's answer keys."""
+
+    def __init__(
+        self,
+        sheet_repo: SheetRepository,
+        response_source: ResponseSource,
+        match_threshold: float = 0.85,
+        review_threshold: float = 0.6
+    ):
+        self.preview_use_case = PreviewQuizUseCase(sheet_repo)
+        self.response_source = response_source
+        self.match_threshold = match_threshold
+        self.review_threshold = review_threshold
+
+    def execute(self, year: int, week: int, language: Optional[Language] = None) -> List[GradingResult]:
+        """Grades the responses of each language's form. Languages without a form are left out."""
+        preview = self.preview_use_case.execute(week, language=language)
+        if not preview:
+            return []
+
+        results = []
+        for quiz in preview.quizzes:
+            form_id = self.response_source.get_form_id(year, week, quiz.language)
+            if not form_id:
+                continue
+            grader = QuizGrader(quiz, self.match_threshold, self.review_threshold)
+            results.append(grader.grade(self.response_source.iter_responses(form_id, week, quiz.language)))
+        return results
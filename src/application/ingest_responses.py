@@ -0,0 +1,135 @@
+from itertools import islice
+from typing import Callable, List, Optional
+from pydantic import BaseModel
+
+from src.application.ports.interfaces import IngestionLog, ResponseSink, ResponseSource, ScoreStore, SheetRepository
+from src.application.preview_quiz import PreviewQuizUseCase
+from src.domain.grading import QuizGrader
+from src.domain.models import Language, timestamp_key
+
+class IngestJobResult(BaseModel):
+    """Outcome of ingesting the responses of one (week, language) form."""
+    week: int
+    language: Language
+    form_id: Optional[str] = None # None when no form was created for this week
+    ingested: int = 0
+    error: Optional[str] = None
+
+class IngestResponsesResult(BaseModel):
+    """Container for the results of an ingestion run."""
+    jobs: List[IngestJobResult]
+
+    @property
+    def total_ingested(self) -> int:
+        return sum(job.ingested for job in self.jobs)
+
+    @property
+    def failed_jobs(self) -> List[IngestJobResult]:
+        return [job for job in self.jobs if job.error]
+
+class IngestResponsesUseCase:
+    """Use case to copy new form submissions into the response spreadsheets, chunk by chunk.
+
+    When a sheet repository and score store are given, each new chunk is also graded
+    and folded into the season totals.
+    """
+
+    def __init__(
+        self,
+        response_source: ResponseSource,
+        response_sink: ResponseSink,
+        ingestion_log: IngestionLog,
+        chunk_size: int = 1000,
+        sheet_repo: Optional[SheetRepository] = None,
+        score_store: Optional[ScoreStore] = None,
+        match_threshold: float = 0.85,
+        review_threshold: float = 0.6
+    ):
+        self.response_source = response_source
+        self.response_sink = response_sink
+        self.ingestion_log = ingestion_log
+        self.chunk_size = chunk_size
+        self.preview_use_case = PreviewQuizUseCase(sheet_repo) if sheet_repo else None
+        self.score_store = score_store
+        self.match_threshold = match_threshold
+        self.review_threshold = review_threshold
+
+    def _get_grader(self, week: int, language: Language) -> Optional[QuizGrader]:
+        """Builds a grader from the sheet's answer keys, if scores are being kept."""
+        if not self.preview_use_case or not self.score_store:
+            return None
+        preview = self.preview_use_case.execute(week, language=language)
+        if not preview:
+            return None
+        return QuizGrader(preview.quizzes[0], self.match_threshold, self.review_threshold)
+
+    def _ingest_one(
+        self,
+        year: int,
+        week: int,
+        language: Language,
+        on_chunk: Optional[Callable[[IngestJobResult], None]]
+    ) -> IngestJobResult:
+        form_id = self.response_source.get_form_id(year, week, language)
+        job = IngestJobResult(week=week, language=language, form_id=form_id)
+        if not form_id:
+            return job
+
+        grader = self._get_grader(week, language)
+        since = self.ingestion_log.get_watermark(form_id)
+        latest = since
+        responses = self.response_source.iter_responses(form_id, week, language, since=since)
+
+        # Only one chunk is held in memory at a time
+        while True:
+            chunk = list(islice(responses, self.chunk_size))
+            if not chunk:
+                break
+            newest = max((r.submitted_at for r in chunk), key=timestamp_key)
+            if latest is None or timestamp_key(newest) > timestamp_key(latest):
+                latest = newest
+
+            # Responses written by an interrupted earlier run are skipped; edited ones come back with a newer time
+            new_responses = self.ingestion_log.filter_new(form_id, chunk)
+            if new_responses:
+                self.response_sink.append(language, new_responses)
+                if grader and self.score_store:
+                    self.score_store.record_grades(year, grader.grade(new_responses).responses)
+                self.ingestion_log.mark_ingested(form_id, new_responses)
+                job.ingested += len(new_responses)
+                if on_chunk:
+                    on_chunk(job)
+
+        # Pages are not ordered by time, so the watermark only moves once the whole form is read
+        if latest and latest != since:
+            self.ingestion_log.set_watermark(form_id, latest)
+        return job
+
+    def execute(
+        self,
+        year: int,
+        weeks: List[int],
+        language: Optional[Language] = None,
+        on_chunk: Optional[Callable[[IngestJobResult], None]] = None
+    ) -> IngestResponsesResult:
+        """Ingests the responses submitted since the last run for every requested week and language.
+
+        Args:
+            year (int): The quiz year the forms were created for.
+            weeks (List[int]): The weeks to ingest.
+            language (Optional[Language]): A single language, or all languages if omitted.
+            on_chunk (Optional[Callable[[IngestJobResult], None]]): Called after each chunk is written.
+
+        Returns:
+            IngestResponsesResult: The number of new responses per week and language.
+        """
+        languages = [language] if language else list(Language)
+
+        jobs = []
+        for week in weeks:
+            for lang in languages:
+                try:
+                    jobs.append(self._ingest_one(year, week, lang, on_chunk))
+                except Exception as e:
+                    jobs.append(IngestJobResult(week=week, language=lang, error=str(e)))
+        return IngestResponsesResult(jobs=jobs)
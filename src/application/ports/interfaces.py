@@ -1,6 +1,7 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
-from src.domain.models import Language, Question, QuizMetadata, Quiz
+from typing import Callable, Iterator, List, Optional
+from src.domain.grading import ResponseGrade
+from src.domain.models import Language, LeaderboardEntry, Question, QuizMetadata, Quiz, QuizResponse
 
 class SheetRepository(ABC):
     """Interface for reading quiz data from a spreadsheet."""
@@ -15,12 +16,23 @@ class SheetRepository(ABC):
         """Fetches all questions for a specific week and language."""
         pass
 
+    def prefetch(self, weeks: List[int], languages: List[Language]) -> None:
+        """Hints which weeks and languages are about to be read, so they can be fetched together.
+
+        Optional; repositories that read everything at once can ignore it.
+        """
+        pass
+
 class FormService(ABC):
     """Interface for creating and managing Google Forms."""
     
     @abstractmethod
-    def create_form(self, quiz: Quiz) -> str:
+    def create_form(self, quiz: Quiz, on_stage: Optional[Callable[[str], None]] = None) -> str:
         """Creates a Google Form from a Quiz object.
+
+        Args:
+            quiz (Quiz): The quiz to publish.
+            on_stage (Optional[Callable[[str], None]]): Called with a short description as each stage starts.
         
         Returns:
             str: The URL of the created form.
@@ -31,3 +43,91 @@ class FormService(ABC):
     def link_responses(self, form_id: str, spreadsheet_id: str) -> None:
         """Links the form to a specific response spreadsheet."""
         pass
+
+    def prepare(self) -> None:
+        """Hints that forms are about to be created, so slow setup can start in the background.
+
+        Optional; services with nothing to prepare can ignore it.
+        """
+        pass
+
+class QuizExporter(ABC):
+    """Interface for writing quizzes to an offline format, one quiz at a time."""
+
+    @abstractmethod
+    def begin(self) -> None:
+        """Writes anything that comes before the first quiz (headers, page start)."""
+        pass
+
+    @abstractmethod
+    def write_quiz(self, quiz: Quiz) -> None:
+        """Writes one quiz. Nothing is kept after the call returns."""
+        pass
+
+    @abstractmethod
+    def finish(self) -> None:
+        """Writes anything that comes after the last quiz."""
+        pass
+
+class ResponseSource(ABC):
+    """Interface for reading the submissions to published quiz forms."""
+
+    @abstractmethod
+    def get_form_id(self, year: int, week: int, language: Language) -> Optional[str]:
+        """Returns the ID of the form published for a week and language, if any."""
+        pass
+
+    @abstractmethod
+    def iter_responses(
+        self,
+        form_id: str,
+        week: int,
+        language: Language,
+        since: Optional[str] = None
+    ) -> Iterator[QuizResponse]:
+        """Yields the form's responses submitted after `since` (RFC 3339), one page at a time."""
+        pass
+
+class ResponseSink(ABC):
+    """Interface for storing ingested responses."""
+
+    @abstractmethod
+    def append(self, language: Language, responses: List[QuizResponse]) -> None:
+        """Appends a chunk of responses to the response spreadsheet for a language."""
+        pass
+
+class IngestionLog(ABC):
+    """Interface for remembering which responses have already been ingested."""
+
+    @abstractmethod
+    def get_watermark(self, form_id: str) -> Optional[str]:
+        """Returns the latest submission time fully ingested for a form."""
+        pass
+
+    @abstractmethod
+    def set_watermark(self, form_id: str, submitted_at: str) -> None:
+        """Records that every response up to submitted_at has been ingested."""
+        pass
+
+    @abstractmethod
+    def filter_new(self, form_id: str, responses: List[QuizResponse]) -> List[QuizResponse]:
+        """Drops responses that were already ingested."""
+        pass
+
+    @abstractmethod
+    def mark_ingested(self, form_id: str, responses: List[QuizResponse]) -> None:
+        """Records responses as ingested."""
+        pass
+
+class ScoreStore(ABC):
+    """Interface for the season's running score totals."""
+
+    @abstractmethod
+    def record_grades(self, year: int, grades: List[ResponseGrade]) -> None:
+        """Folds graded responses into the totals; a participant's latest score per week and language wins."""
+        pass
+
+    @abstractmethod
+    def get_leaderboard(self, year: int, language: Optional[Language] = None, limit: int = 20) -> List[LeaderboardEntry]:
+        """Returns the top participants, for one language or summed across all languages."""
+        pass
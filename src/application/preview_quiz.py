@@ -1,14 +1,49 @@
+import hashlib
 import os
-from typing import List, Optional, Tuple
-from pydantic import BaseModel
+from typing import Iterable, List, Optional, Tuple
+from pydantic import BaseModel, ConfigDict
 
 from src.application.ports.interfaces import SheetRepository
 from src.domain.models import Language, Quiz, QuizMetadata
 
 class PreviewResult(BaseModel):
-    """Container for the preview data of all languages for a week."""
+    """Container for the preview data of all languages for a week.
+
+    Immutable and fingerprinted when built (see `build`), so the create step can check it
+    publishes exactly what the user reviewed.
+    """
+    model_config = ConfigDict(frozen=True)
+
     metadata: QuizMetadata
-    quizzes: List[Quiz]
+    quizzes: Tuple[Quiz, ...]
+    content_hash: str
+
+    @staticmethod
+    def fingerprint(metadata: QuizMetadata, quizzes: Iterable[Quiz]) -> str:
+        """A fingerprint of the previewed content; identical previews share the same hash."""
+        digest = hashlib.sha256(metadata.model_dump_json().encode("utf-8"))
+        for quiz in quizzes:
+            digest.update(quiz.content_hash.encode("utf-8"))
+        return digest.hexdigest()
+
+    @classmethod
+    def build(cls, metadata: QuizMetadata, quizzes: Iterable[Quiz]) -> "PreviewResult":
+        """Creates a preview of the given quizzes, fingerprinted as they are now."""
+        quizzes = tuple(quizzes)
+        return cls(metadata=metadata, quizzes=quizzes, content_hash=cls.fingerprint(metadata, quizzes))
+
+    def is_unchanged(self) -> bool:
+        """Whether the quizzes still match the fingerprint taken when the preview was built."""
+        return self.fingerprint(self.metadata, self.quizzes) == self.content_hash
+
+    def select(self, language: Optional[Language]) -> Optional["PreviewResult"]:
+        """Returns the preview narrowed to one language (or unchanged for None), or None if it is not included."""
+        if language is None:
+            return self
+        quizzes = [quiz for quiz in self.quizzes if quiz.language == language]
+        if not quizzes:
+            return None
+        return PreviewResult.build(self.metadata, quizzes)
 
 class PreviewQuizUseCase:
     """Use case to fetch and prepare quiz data for preview."""
@@ -18,7 +53,7 @@ class PreviewQuizUseCase:
 
     def _get_custom_description(self, lang: Language, metadata: QuizMetadata) -> Optional[str]:
         """Loads and formats the language-specific description from .md files."""
-        file_name = "English.md" if lang == Language.ENGLISH else "Tamil.md"
+        file_name = f"{lang.display_name}.md"
         if not os.path.exists(file_name):
             return None
             
@@ -37,19 +72,21 @@ class PreviewQuizUseCase:
 
     def execute(self, week: int, language: Optional[Language] = None) -> Optional[PreviewResult]:
         """Fetches metadata and questions for specific or all languages for a specific week."""
+        # Determine which languages to process
+        languages_to_process = [language] if language else list(Language)
+
+        self.sheet_repo.prefetch([week], languages_to_process)
         metadata = self.sheet_repo.get_quiz_metadata(week)
         if not metadata:
             return None
 
-        # Determine which languages to process
-        languages_to_process = [language] if language else [Language.ENGLISH, Language.TAMIL]
-
         quizzes = []
         for lang in languages_to_process:
             questions = self.sheet_repo.get_questions(week, lang)
             if questions:
                 custom_desc = self._get_custom_description(lang, metadata)
-                quizzes.append(Quiz(
+                # Validated later, when the quiz is handed to a FormService (see Quiz.validated)
+                quizzes.append(Quiz.model_construct(
                     metadata=metadata,
                     language=lang,
                     questions=questions,
@@ -59,4 +96,4 @@ class PreviewQuizUseCase:
         if not quizzes:
             return None
 
-        return PreviewResult(metadata=metadata, quizzes=quizzes)
+        return PreviewResult.build(metadata, quizzes)
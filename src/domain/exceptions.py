@@ -0,0 +1,15 @@
+class BibleQuizError(Exception):
+    """Base class for all errors raised by the Bible Quiz application."""
+
+class QuotaBudgetExceededError(BibleQuizError):
+    """Raised when a run has used up its allowed number of Google API calls."""
+
+    def __init__(self, budget: int):
+        super().__init__(f"API call budget of {budget} requests for this run has been used up.")
+        self.budget = budget
+
+class PreviewChangedError(BibleQuizError):
+    """Raised when quizzes are published that no longer match what was previewed."""
+
+    def __init__(self) -> None:
+        super().__init__("The quizzes changed after they were previewed. Preview them again before creating forms.")
@@ -0,0 +1,246 @@
+import re
+import unicodedata
+from difflib import SequenceMatcher
+from enum import Enum
+from functools import lru_cache
+from typing import Dict, Iterable, List, Set, Tuple
+from pydantic import BaseModel, ConfigDict
+
+from src.domain.models import Language, Question, Quiz, QuizResponse
+
+# Invisible joiners that Tamil keyboards insert inconsistently
+_ZERO_WIDTH = dict.fromkeys(map(ord, "\u200b\u200c\u200d\u2060\ufeff"))
+_DIGIT_LETTER = re.compile(r"(?<=\d)(?=[^\W\d_])|(?<=[^\W\d_])(?=\d)")
+
+# Full book name -> the abbreviations participants commonly type. Numbered books
+# ("1 Sam") are covered by their base name once digits and letters are split apart.
+BOOK_ABBREVIATIONS: Dict[str, Tuple[str, ...]] = {
+    "genesis": ("gen", "ge", "gn"),
+    "exodus": ("exod", "exo", "ex"),
+    "leviticus": ("lev", "le", "lv"),
+    "numbers": ("num", "nu", "nm"),
+    "deuteronomy": ("deut", "deu", "dt"),
+    "joshua": ("josh", "jos"),
+    "judges": ("judg", "jdg"),
+    "ruth": ("rth", "ru"),
+    "samuel": ("sam", "sa", "sm"),
+    "kings": ("kgs", "kin", "ki"),
+    "chronicles": ("chron", "chr", "ch"),
+    "ezra": ("ezr",),
+    "nehemiah": ("neh", "ne"),
+    "esther": ("esth", "est"),
+    "job": ("jb",),
+    "psalms": ("psalm", "psa", "pss", "ps"),
+    "proverbs": ("prov", "pro", "prv"),
+    "ecclesiastes": ("eccles", "eccl", "ecc", "qoh"),
+    "song of solomon": ("sos", "sng"),
+    "isaiah": ("isa",),
+    "jeremiah": ("jer", "je"),
+    "lamentations": ("lam", "la"),
+    "ezekiel": ("ezek", "eze", "ezk"),
+    "daniel": ("dan", "da", "dn"),
+    "hosea": ("hos", "ho"),
+    "joel": ("jl",),
+    "amos": ("amo",),
+    "obadiah": ("obad", "ob"),
+    "jonah": ("jnh", "jon"),
+    "micah": ("mic", "mc"),
+    "nahum": ("nah", "na"),
+    "habakkuk": ("hab", "hb"),
+    "zephaniah": ("zeph", "zep", "zp"),
+    "haggai": ("hag", "hg"),
+    "zechariah": ("zech", "zec", "zc"),
+    "malachi": ("mal", "ml"),
+    "matthew": ("matt", "mat", "mt"),
+    "mark": ("mrk", "mk", "mr"),
+    "luke": ("luk", "lk"),
+    "john": ("jhn", "jn"),
+    "acts": ("act", "ac"),
+    "romans": ("rom", "ro", "rm"),
+    "corinthians": ("cor", "co"),
+    "galatians": ("gal", "ga"),
+    "ephesians": ("ephes", "eph"),
+    "philippians": ("phil", "php", "pp"),
+    "colossians": ("col",),
+    "thessalonians": ("thess", "thes", "th"),
+    "timothy": ("tim", "ti"),
+    "titus": ("tit",),
+    "philemon": ("philem", "phlm", "phm"),
+    "hebrews": ("heb",),
+    "james": ("jas", "jm"),
+    "peter": ("pet", "pe", "pt"),
+    "jude": ("jud", "jd"),
+    "revelation": ("revelations", "rev", "re", "rv"),
+}
+_BOOK_NAMES = {abbr: name for name, abbrs in BOOK_ABBREVIATIONS.items() for abbr in abbrs}
+_BOOK_WORDS = {word for name in BOOK_ABBREVIATIONS for word in name.split()} - {"of"}
+# Articles that do not change whether an answer is right ("the east" vs "east")
+_FILLER_WORDS = {"the", "a", "an"}
+
+@lru_cache(maxsize=65536)
+def normalize_answer(text: str) -> str:
+    """Folds an answer to a canonical form, so "Gen. 2:8 – East" and "genesis 2 8 east" compare equal.
+
+    Applies Unicode NFC, strips zero-width characters, casefolds, turns punctuation and symbols into
+    spaces, separates digits from letters ("1Sam" -> "1 sam") and expands book abbreviations that are
+    followed by a chapter number ("Mt 5" -> "matthew 5", but "Mt. Sinai" stays "mt sinai").
+    """
+    text = unicodedata.normalize("NFC", text).translate(_ZERO_WIDTH).casefold()
+    # Category P* is punctuation and S* symbols; Tamil vowel signs (M*) are kept
+    text = "".join(" " if unicodedata.category(char)[0] in "PS" else char for char in text)
+    tokens = _DIGIT_LETTER.sub(" ", text).split()
+    return " ".join(
+        _BOOK_NAMES.get(token, token) if index + 1 < len(tokens) and tokens[index + 1].isdigit() else token
+        for index, token in enumerate(tokens)
+    )
+
+def _reference_positions(tokens: List[str]) -> Set[int]:
+    """Indexes of the tokens that form scripture references: numbers, and book names directly followed by one.
+
+    A book word without a number ("Peter", "John") is an answer, not a reference.
+    """
+    positions = {index for index, token in enumerate(tokens) if token.isdigit()}
+    index = 0
+    while index < len(tokens):
+        if tokens[index] not in _BOOK_WORDS:
+            index += 1
+            continue
+        # A run of book words, allowing "of" inside a name ("song of solomon")
+        end = index + 1
+        while end < len(tokens):
+            if tokens[end] in _BOOK_WORDS:
+                end += 1
+            elif tokens[end] == "of" and tokens[end + 1:end + 2] and tokens[end + 1] in _BOOK_WORDS:
+                end += 2
+            else:
+                break
+        if end < len(tokens) and tokens[end].isdigit():
+            positions.update(range(index, end))
+        index = end
+    return positions
+
+def split_reference(normalized: str) -> Tuple[str, str]:
+    """Splits a normalized answer into its scripture reference (book names and numbers) and the remaining words."""
+    tokens = normalized.split()
+    positions = _reference_positions(tokens)
+    reference, rest = [], []
+    for index, token in enumerate(tokens):
+        if index in positions:
+            reference.append(token)
+        elif token not in _FILLER_WORDS:
+            rest.append(token)
+    return " ".join(reference), " ".join(rest)
+
+class GradeStatus(str, Enum):
+    CORRECT = "correct"
+    NEEDS_REVIEW = "needs_review"
+    INCORRECT = "incorrect"
+
+class QuestionGrade(BaseModel):
+    """The grade for one answer to one question."""
+    model_config = ConfigDict(frozen=True)
+
+    question_id: str
+    answer: str
+    status: GradeStatus
+    similarity: float # 0..1 between the answer wording and the key, ignoring the scripture reference
+    score: int # Points awarded; answers needing review score 0 until a person accepts them
+
+class ResponseGrade(BaseModel):
+    """All question grades for one participant's submission."""
+    model_config = ConfigDict(frozen=True)
+
+    response: QuizResponse
+    grades: List[QuestionGrade]
+
+    @property
+    def total_score(self) -> int:
+        return sum(grade.score for grade in self.grades)
+
+    @property
+    def needs_review(self) -> bool:
+        return any(grade.status == GradeStatus.NEEDS_REVIEW for grade in self.grades)
+
+class GradingResult(BaseModel):
+    """The grades for a batch of responses to one quiz."""
+    model_config = ConfigDict(frozen=True)
+
+    week: int
+    language: Language
+    responses: List[ResponseGrade]
+
+    @property
+    def needs_review(self) -> List[ResponseGrade]:
+        """Submissions with at least one answer that could not be graded automatically."""
+        return [response for response in self.responses if response.needs_review]
+
+class _AnswerKey:
+    """The normalized parts of a question's answer key, computed once per quiz."""
+
+    def __init__(self, question: Question):
+        self.question = question
+        self.full = normalize_answer(question.formatted_answer_key)
+        self.reference, self.rest = split_reference(self.full)
+
+class QuizGrader:
+    """Grades short-answer responses against a quiz's answer keys with fuzzy matching.
+
+    The scripture reference must match exactly once normalized; the rest of the answer
+    is compared fuzzily. An answer is correct if both hold (`match_threshold`), and needs
+    review if the reference is missing or wrong, or the wording is only somewhat close
+    (`review_threshold`).
+    """
+
+    def __init__(self, quiz: Quiz, match_threshold: float = 0.85, review_threshold: float = 0.6):
+        self.quiz = quiz
+        self.match_threshold = match_threshold
+        self.review_threshold = review_threshold
+        self._keys = {q.id: _AnswerKey(q) for q in quiz.questions}
+        # Many participants type the same answer, so each distinct (question, answer) is scored once
+        self._memo: Dict[Tuple[str, str], Tuple[GradeStatus, float]] = {}
+
+    def _match(self, key: _AnswerKey, answer: str) -> Tuple[GradeStatus, float]:
+        if not answer:
+            return GradeStatus.INCORRECT, 0.0
+        if answer == key.full:
+            return GradeStatus.CORRECT, 1.0
+
+        reference, rest = split_reference(answer)
+        # A bare reference cannot stand in for the words the key asks for
+        if key.rest and not rest:
+            return GradeStatus.INCORRECT, 0.0
+        similarity = SequenceMatcher(None, rest, key.rest, autojunk=False).ratio()
+        if similarity >= self.match_threshold and reference == key.reference:
+            return GradeStatus.CORRECT, similarity
+        if similarity >= self.review_threshold:
+            return GradeStatus.NEEDS_REVIEW, similarity
+        return GradeStatus.INCORRECT, similarity
+
+    def grade_answer(self, question_id: str, answer: str) -> QuestionGrade:
+        """Grades one answer to one question of the quiz."""
+        key = self._keys[question_id]
+        normalized = normalize_answer(answer)
+
+        memo_key = (question_id, normalized)
+        if memo_key not in self._memo:
+            self._memo[memo_key] = self._match(key, normalized)
+        status, similarity = self._memo[memo_key]
+
+        return QuestionGrade(
+            question_id=question_id,
+            answer=answer,
+            status=status,
+            similarity=round(similarity, 3),
+            score=key.question.points if status == GradeStatus.CORRECT else 0
+        )
+
+    def grade(self, responses: Iterable[QuizResponse]) -> GradingResult:
+        """Grades a batch of responses. Unanswered questions are graded as incorrect."""
+        graded = [
+            ResponseGrade(
+                response=response,
+                grades=[self.grade_answer(question_id, response.answers.get(question_id, "")) for question_id in self._keys]
+            )
+            for response in responses
+        ]
+        return GradingResult(week=self.quiz.metadata.week, language=self.quiz.language, responses=graded)
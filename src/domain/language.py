@@ -0,0 +1,12 @@
+from enum import Enum
+
+class Language(str, Enum):
+    ENGLISH = "EN"
+    TAMIL = "TA"
+    MALAYALAM = "ML"
+    TELUGU = "TE"
+
+    @property
+    def display_name(self) -> str:
+        """English, Tamil, ..."""
+        return self.name.title()
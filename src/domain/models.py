@@ -1,13 +1,14 @@
-from enum import Enum
-from typing import List, Optional
-from pydantic import BaseModel, Field
+import hashlib
+from typing import Dict, List, Optional
+from pydantic import BaseModel, ConfigDict, Field
 
-class Language(str, Enum):
-    ENGLISH = "EN"
-    TAMIL = "TA"
+# Language lives in its own dependency-free module so the CLI can import it cheaply
+from src.domain.language import Language
 
 class Question(BaseModel):
     """Represents a single quiz question in a specific language."""
+    model_config = ConfigDict(frozen=True)
+
     id: str = Field(..., description="Unique ID for the question (e.g., Q1)")
     week: int
     text: str = Field(..., description="The question text")
@@ -27,6 +28,8 @@ class Question(BaseModel):
 
 class QuizMetadata(BaseModel):
     """Metadata for the quiz common across all languages for a week."""
+    model_config = ConfigDict(frozen=True)
+
     week: int
     dates: str
     portion: str
@@ -34,6 +37,8 @@ class QuizMetadata(BaseModel):
 
 class Quiz(BaseModel):
     """The full quiz entity for a specific language."""
+    model_config = ConfigDict(frozen=True)
+
     metadata: QuizMetadata
     language: Language
     questions: List[Question]
@@ -41,7 +46,7 @@ class Quiz(BaseModel):
     
     @property
     def title(self) -> str:
-        lang_name = "English" if self.language == Language.ENGLISH else "Tamil"
+        lang_name = self.language.display_name
         return f"Week {self.metadata.week} - {lang_name} Bible Quiz | {self.metadata.year}"
 
     @property
@@ -49,3 +54,38 @@ class Quiz(BaseModel):
         if self.custom_description:
             return self.custom_description
         return f"Week {self.metadata.week} | {self.metadata.dates} | {self.metadata.portion}"
+
+    @property
+    def content_hash(self) -> str:
+        """A fingerprint of everything that ends up in the form; changes whenever the content does."""
+        return hashlib.sha256(self.model_dump_json().encode("utf-8")).hexdigest()
+
+    def validated(self) -> "Quiz":
+        """Returns a fully validated copy. Quizzes built with model_construct skip validation until publishing."""
+        return Quiz.model_validate(self.model_dump())
+
+def timestamp_key(timestamp: str) -> str:
+    """Makes RFC 3339 UTC times comparable as strings by padding the fractional seconds."""
+    seconds, _, fraction = timestamp.rstrip("Z").partition(".")
+    return f"{seconds}.{fraction:0<9}"
+
+class QuizResponse(BaseModel):
+    """One participant's submission to a quiz form."""
+    model_config = ConfigDict(frozen=True)
+
+    response_id: str
+    week: int
+    language: Language
+    submitted_at: str = Field(..., description="RFC 3339 UTC time of the last submission")
+    email: Optional[str] = None
+    answers: Dict[str, str] = Field(default_factory=dict, description="Answer text by question ID (e.g., Q1)")
+    total_score: Optional[float] = None
+
+class LeaderboardEntry(BaseModel):
+    """A participant's place in the season standings."""
+    model_config = ConfigDict(frozen=True)
+
+    rank: int
+    email: str
+    total_score: int
+    quizzes_taken: int
@@ -0,0 +1,66 @@
+from array import array
+from typing import Dict, Iterator, List, Mapping, Sequence, Tuple
+
+from src.domain.models import Language, Question
+
+class QuestionTable:
+    """All questions of the sheet, stored column-wise with one row per question.
+
+    Holding plain columns instead of one Pydantic model per row keeps several years of
+    questions cheap to load and index. `Question` models are only built for the week
+    being previewed or published.
+    """
+    __slots__ = ("ids", "weeks", "scriptures", "points", "texts", "answers", "_week_ranges")
+
+    def __init__(
+        self,
+        ids: Sequence[str],
+        weeks: Sequence[int],
+        scriptures: Sequence[str],
+        texts: Mapping[Language, Sequence[str]],
+        answers: Mapping[Language, Sequence[str]],
+        points: int = 2
+    ):
+        # Rows are kept grouped by week (in sheet order within a week) so a week is one contiguous slice
+        order = sorted(range(len(ids)), key=weeks.__getitem__)
+        self.ids: List[str] = [ids[i] for i in order]
+        self.weeks = array("i", (weeks[i] for i in order))
+        self.scriptures: List[str] = [scriptures[i] for i in order]
+        self.points = points
+        self.texts: Dict[Language, List[str]] = {lang: [col[i] for i in order] for lang, col in texts.items()}
+        self.answers: Dict[Language, List[str]] = {lang: [col[i] for i in order] for lang, col in answers.items()}
+
+        self._week_ranges: Dict[int, Tuple[int, int]] = {}
+        for index, week in enumerate(self.weeks):
+            start, _ = self._week_ranges.get(week, (index, index))
+            self._week_ranges[week] = (start, index + 1)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    @property
+    def languages(self) -> List[Language]:
+        return list(self.texts)
+
+    @property
+    def week_numbers(self) -> List[int]:
+        return list(self._week_ranges)
+
+    def week_slice(self, week: int) -> range:
+        """Row positions of a week's questions (empty if the week has none)."""
+        start, end = self._week_ranges.get(week, (0, 0))
+        return range(start, end)
+
+    def iter_rows(self, week: int, language: Language) -> Iterator[Tuple[str, str, str, str]]:
+        """Yields (id, text, answer, scripture) for the week's questions that have both text and answer."""
+        texts, answers = self.texts[language], self.answers[language]
+        for i in self.week_slice(week):
+            if texts[i].strip() and answers[i].strip():
+                yield self.ids[i], texts[i], answers[i], self.scriptures[i]
+
+    def questions(self, week: int, language: Language) -> List[Question]:
+        """Materializes a week's questions without re-running validation; the columns are already typed."""
+        return [
+            Question.model_construct(id=q_id, week=week, text=text, answer=answer, scripture=scripture, points=self.points)
+            for q_id, text, answer, scripture in self.iter_rows(week, language)
+        ]
@@ -11,13 +11,43 @@ class Settings(BaseSettings):
     SOURCE_SHEET_ID: Optional[int] = 0
     
     TEMPLATE_FORM_ID: Optional[str] = None # The ID of the form to use as a template
+    FORM_POOL_SIZE: int = 0 # Blank template copies kept ready in Drive (0 turns the pool off)
+    FORM_POOL_FOLDER_ID: Optional[str] = None # Drive folder for pooled copies (next to the template if unset)
     
     TAMIL_RESPONSE_SPREADSHEET_ID: str
     ENGLISH_RESPONSE_SPREADSHEET_ID: str
+    MALAYALAM_RESPONSE_SPREADSHEET_ID: Optional[str] = None
+    TELUGU_RESPONSE_SPREADSHEET_ID: Optional[str] = None
+    RESPONSE_SHEET_NAME: str = "Responses" # Tab that ingested responses are appended to
+    RESPONSE_PAGE_SIZE: int = 5000 # Responses per forms.responses.list page (API maximum)
+    RESPONSE_WRITE_CHUNK_SIZE: int = 1000 # Rows per append to the response spreadsheet
+    GRADING_MATCH_THRESHOLD: float = 0.85 # Answer similarity (0..1) accepted as correct
+    GRADING_REVIEW_THRESHOLD: float = 0.6 # Below the match threshold but above this, a person decides
     
     DEFAULT_POINTS: int = 2
     QUIZ_YEAR: int = 2026
 
+    CREDENTIAL_REFRESH_MARGIN_SECONDS: int = 300 # Refresh the OAuth token this long before it expires
+    SHEET_CACHE_TTL_SECONDS: int = 300 # How long fetched sheet rows are reused in-process
+    BULK_MAX_WORKERS: int = 4 # Parallel form creations in batch mode (keep low to respect API quotas)
+    FORM_BATCH_MAX_REQUESTS: int = 100 # Requests per forms.batchUpdate when building large quizzes
+    FORM_BATCH_MAX_BYTES: int = 256_000 # Approximate payload cap per forms.batchUpdate
+
+    # Google API quotas (requests per minute per user) and retry policy
+    SHEETS_REQUESTS_PER_MINUTE: int = 60
+    FORMS_REQUESTS_PER_MINUTE: int = 150
+    DRIVE_REQUESTS_PER_MINUTE: int = 600
+    API_MAX_RETRIES: int = 5
+    API_CALL_BUDGET: Optional[int] = None # Max API calls per run (unlimited if unset)
+    HTTP_TIMEOUT_SECONDS: int = 60
+
+    # Gradio request queue: pending requests allowed, and how many run at once per action
+    UI_QUEUE_MAX_SIZE: int = 64
+    UI_PREVIEW_CONCURRENCY: int = 8
+    UI_CREATE_CONCURRENCY: int = 2 # Form creation is quota-heavy; extra clicks wait their turn
+
+    LOCAL_STORE_PATH: str = ".quiz_cache/quiz_store.db" # Local SQLite store (sheet snapshots, etc.)
+
     class Config:
         env_file = ".env"
 
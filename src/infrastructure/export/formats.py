@@ -0,0 +1,8 @@
+from enum import Enum
+
+# Kept dependency-free so the CLI can use it as an option type without slowing down startup
+class ExportFormat(str, Enum):
+    JSON = "json"
+    CSV = "csv"
+    HTML = "html"
+    ANSWER_KEY = "answer-key"
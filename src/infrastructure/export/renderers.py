@@ -0,0 +1,146 @@
+import csv
+import json
+from html import escape
+from typing import Any, Callable, Dict, TextIO
+
+from src.application.ports.interfaces import QuizExporter
+from src.domain.models import Quiz
+from src.infrastructure.export.formats import ExportFormat
+
+class JsonQuizExporter(QuizExporter):
+    """Writes a JSON array with one object per quiz, streamed element by element."""
+
+    def __init__(self, stream: TextIO):
+        self.stream = stream
+        self._count = 0
+
+    def _to_dict(self, quiz: Quiz) -> Dict[str, Any]:
+        return {
+            "week": quiz.metadata.week,
+            "year": quiz.metadata.year,
+            "language": quiz.language.value,
+            "title": quiz.title,
+            "description": quiz.description,
+            "dates": quiz.metadata.dates,
+            "portion": quiz.metadata.portion,
+            "questions": [
+                {
+                    "id": q.id,
+                    "text": q.text,
+                    "answer": q.answer,
+                    "scripture": q.scripture,
+                    "points": q.points,
+                }
+                for q in quiz.questions
+            ],
+        }
+
+    def begin(self) -> None:
+        self._count = 0
+        self.stream.write("[")
+
+    def write_quiz(self, quiz: Quiz) -> None:
+        self.stream.write(",\n" if self._count else "\n")
+        json.dump(self._to_dict(quiz), self.stream, ensure_ascii=False, indent=2)
+        self._count += 1
+
+    def finish(self) -> None:
+        self.stream.write("\n]\n")
+
+class CsvQuizExporter(QuizExporter):
+    """Writes one CSV row per question."""
+
+    HEADER = ["Week", "Language", "Q_id", "Question", "Answer", "Scripture", "Points"]
+
+    def __init__(self, stream: TextIO):
+        self.stream = stream
+        self._writer = csv.writer(stream)
+
+    def begin(self) -> None:
+        self._writer.writerow(self.HEADER)
+
+    def write_quiz(self, quiz: Quiz) -> None:
+        self._writer.writerows(
+            [quiz.metadata.week, quiz.language.value, q.id, q.text, q.answer, q.scripture, q.points]
+            for q in quiz.questions
+        )
+
+    def finish(self) -> None:
+        pass
+
+_PAGE_STYLE = """
+body { font-family: "Noto Sans", "Noto Sans Tamil", Arial, sans-serif; margin: 2em auto; max-width: 50em; line-height: 1.5; }
+section { page-break-after: always; break-after: page; }
+section:last-of-type { page-break-after: auto; break-after: auto; }
+h1 { font-size: 1.4em; margin-bottom: 0.2em; }
+.description { white-space: pre-line; color: #444; margin-bottom: 1.5em; }
+.participant { margin-bottom: 1.5em; }
+.question { margin-bottom: 1.2em; page-break-inside: avoid; break-inside: avoid; }
+.answer-line { border-bottom: 1px solid #999; height: 1.8em; }
+table { border-collapse: collapse; width: 100%; }
+th, td { border: 1px solid #999; padding: 0.3em 0.6em; text-align: left; vertical-align: top; }
+@media print { body { margin: 0; max-width: none; } }
+"""
+
+class HtmlQuizExporter(QuizExporter):
+    """Writes a self-contained HTML page with one printable section per quiz and room for handwritten answers."""
+
+    page_title = "Bible Quiz"
+
+    def __init__(self, stream: TextIO):
+        self.stream = stream
+
+    def begin(self) -> None:
+        self.stream.write(
+            "<!DOCTYPE html>\n<html>\n<head>\n<meta charset=\"utf-8\">\n"
+            f"<title>{escape(self.page_title)}</title>\n<style>{_PAGE_STYLE}</style>\n</head>\n<body>\n"
+        )
+
+    def write_quiz(self, quiz: Quiz) -> None:
+        lines = [
+            f'<section lang="{quiz.language.value.lower()}">',
+            f"<h1>{escape(quiz.title)}</h1>",
+            f'<div class="description">{escape(quiz.description)}</div>',
+            '<div class="participant">Name: ______________________________</div>',
+        ]
+        for q in quiz.questions:
+            lines.append(
+                f'<div class="question"><div>{escape(q.formatted_title)} <em>({q.points} points)</em></div>'
+                '<div class="answer-line"></div></div>'
+            )
+        lines.append("</section>\n")
+        self.stream.write("\n".join(lines))
+
+    def finish(self) -> None:
+        self.stream.write("</body>\n</html>\n")
+
+class AnswerKeyExporter(HtmlQuizExporter):
+    """Writes a print-ready HTML answer key: one table per quiz with each question's scripture and answer."""
+
+    page_title = "Bible Quiz Answer Key"
+
+    def write_quiz(self, quiz: Quiz) -> None:
+        lines = [
+            f'<section lang="{quiz.language.value.lower()}">',
+            f"<h1>{escape(quiz.title)} — Answer Key</h1>",
+            "<table>",
+            "<tr><th>ID</th><th>Question</th><th>Answer Key</th><th>Points</th></tr>",
+        ]
+        for q in quiz.questions:
+            lines.append(
+                f"<tr><td>{escape(q.id)}</td><td>{escape(q.text)}</td>"
+                f"<td>{escape(q.formatted_answer_key)}</td><td>{q.points}</td></tr>"
+            )
+        lines.extend(["</table>", "</section>\n"])
+        self.stream.write("\n".join(lines))
+
+_EXPORTERS: Dict[ExportFormat, Callable[[TextIO], QuizExporter]] = {
+    ExportFormat.JSON: JsonQuizExporter,
+    ExportFormat.CSV: CsvQuizExporter,
+    ExportFormat.HTML: HtmlQuizExporter,
+    ExportFormat.ANSWER_KEY: AnswerKeyExporter,
+}
+
+def create_exporter(export_format: ExportFormat, stream: TextIO) -> QuizExporter:
+    """Returns the exporter that writes the given format to stream."""
+    return _EXPORTERS[export_format](stream)
@@ -1,54 +1,216 @@
-import os.path
-from typing import List
+import logging
+import os
+import tempfile
+import threading
+from datetime import datetime, timezone
+from typing import Dict, Optional, Tuple
 
+from google.auth.exceptions import RefreshError
 from google.auth.transport.requests import Request
 from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import InstalledAppFlow
 
+from src.infrastructure.config.settings import settings
+from src.infrastructure.profiling import profiler
+
 # If modifying these scopes, delete the file token.json.
 SCOPES = [
-    "https://www.googleapis.com/auth/spreadsheets.readonly",
+    "https://www.googleapis.com/auth/spreadsheets", # Write access for ingesting responses
     "https://www.googleapis.com/auth/forms.body",
+    "https://www.googleapis.com/auth/forms.responses.readonly",
     "https://www.googleapis.com/auth/drive",
 ]
 
-def get_google_credentials(credentials_path: str = "credentials.json", token_path: str = "token.json") -> Credentials:
-    """Gets valid user credentials from storage or runs the OAuth flow.
+logger = logging.getLogger(__name__)
 
-    Args:
-        credentials_path (str): Path to the credentials.json file.
-        token_path (str): Path to the token.json file for caching.
+# How long to wait before trying again after a background refresh fails
+_RETRY_SECONDS = 30.0
 
-    Returns:
-        Credentials: The Google OAuth2 credentials.
+class CredentialManager:
+    """Holds one set of OAuth credentials in memory for the whole process and keeps them fresh.
+
+    token.json is read once. A background timer refreshes the token shortly before it expires,
+    and every request checks it again first (see refresh_if_due), so the HTTP transport never
+    refreshes it on its own. Refreshes happen behind
+    a lock and update the same Credentials object in place, so every client built from it keeps
+    working. The refreshed token is written to token.json atomically.
     """
-    creds = None
-    if os.path.exists(token_path):
-        creds = Credentials.from_authorized_user_file(token_path, SCOPES)
-    
-    if not creds or not creds.valid:
-        if creds and creds.expired and creds.refresh_token:
+
+    def __init__(self, credentials_path: str, token_path: str, refresh_margin_seconds: float):
+        self.credentials_path = credentials_path
+        self.token_path = token_path
+        self.refresh_margin_seconds = refresh_margin_seconds
+        self._credentials: Optional[Credentials] = None
+        self._lock = threading.Lock()
+        self._timer: Optional[threading.Timer] = None
+        # Set when Google refused the refresh token in the background; retrying would not help
+        self._refresh_error: Optional[RefreshError] = None
+
+    def get(self) -> Credentials:
+        """Returns valid credentials, loading, refreshing or authorizing them on first use.
+
+        Raises:
+            RefreshError: If Google refused the refresh token, e.g. because access was revoked.
+        """
+        creds = self._credentials
+        if creds is not None and creds.valid and not self._refresh_due(creds) and self._refresh_error is None:
+            return creds
+
+        with self._lock:
+            if self._refresh_error is not None:
+                raise RefreshError(
+                    f"Google no longer accepts the saved sign-in ({self._refresh_error}). "
+                    f"Delete {self.token_path} and restart to sign in again."
+                ) from self._refresh_error
+            # Another thread may have loaded or refreshed them while we waited
+            creds = self._credentials
+            if creds is None or (not creds.valid and not creds.refresh_token):
+                creds = self._credentials = self._load()
+            elif not creds.valid or self._refresh_due(creds):
+                print("Refreshing expired Google credentials...")
+                self._refresh_locked(creds)
+            self._schedule_refresh()
+            return creds
+
+    def holds(self, credentials: Credentials) -> bool:
+        """Whether these are the credentials this manager keeps fresh."""
+        return self._credentials is credentials
+
+    def stop(self) -> None:
+        """Cancels the pending background refresh."""
+        with self._lock:
+            if self._timer:
+                self._timer.cancel()
+                self._timer = None
+
+    def _seconds_until_refresh(self, creds: Credentials) -> Optional[float]:
+        if not creds.expiry:
+            return None
+        now = datetime.now(timezone.utc).replace(tzinfo=None) # google-auth keeps expiry as naive UTC
+        return (creds.expiry - now).total_seconds() - self.refresh_margin_seconds
+
+    def _refresh_due(self, creds: Credentials) -> bool:
+        remaining = self._seconds_until_refresh(creds)
+        return remaining is not None and remaining <= 0 and bool(creds.refresh_token)
+
+    def _load(self) -> Credentials:
+        """Reads token.json, refreshing it if needed, or runs the OAuth flow."""
+        creds = None
+        if os.path.exists(self.token_path):
+            creds = Credentials.from_authorized_user_file(self.token_path, SCOPES)
+
+        if creds and creds.refresh_token and (not creds.valid or self._refresh_due(creds)):
             print("Refreshing expired Google credentials...")
             creds.refresh(Request())
-        else:
-            if not os.path.exists(credentials_path):
+            self._save(creds)
+        elif not creds or not creds.valid:
+            if not os.path.exists(self.credentials_path):
                 raise FileNotFoundError(
-                    f"'{credentials_path}' not found. Please follow the setup guide in docs/setup/google-cloud/CREDENTIALS_SETUP.md"
+                    f"'{self.credentials_path}' not found. Please follow the setup guide in docs/setup/google-cloud/CREDENTIALS_SETUP.md"
                 )
-            
+
             print("\nOpening your browser for Google Authentication...")
-            flow = InstalledAppFlow.from_client_secrets_file(credentials_path, SCOPES)
-            
-            # Using port=0 allows the OS to pick any available port, 
+            flow = InstalledAppFlow.from_client_secrets_file(self.credentials_path, SCOPES)
+
+            # Using port=0 allows the OS to pick any available port,
             # preventing "Address already in use" errors (WinError 10048).
             creds = flow.run_local_server(
-                port=0, 
+                port=0,
                 prompt='select_account',
                 open_browser=True
             )
-        
-        with open(token_path, "w") as token:
-            token.write(creds.to_json())
+            self._save(creds)
             print("Credentials saved to token.json")
 
-    return creds
+        return creds
+
+    def _refresh_locked(self, creds: Credentials) -> None:
+        """Refreshes the held credentials in place and persists them. The caller holds the lock."""
+        creds.refresh(Request())
+        self._save(creds)
+
+    def _save(self, creds: Credentials) -> None:
+        """Writes the token to a temporary file and swaps it in, so token.json is never half-written."""
+        directory = os.path.dirname(os.path.abspath(self.token_path))
+        fd, temp_path = tempfile.mkstemp(dir=directory, prefix=".token-", suffix=".json")
+        try:
+            with os.fdopen(fd, "w") as token:
+                token.write(creds.to_json())
+            os.replace(temp_path, self.token_path)
+        except BaseException:
+            os.remove(temp_path)
+            raise
+
+    def _schedule_refresh(self, delay: Optional[float] = None) -> None:
+        """(Re)arms the background refresh timer. The caller holds the lock."""
+        if self._timer:
+            self._timer.cancel()
+            self._timer = None
+        if delay is None:
+            creds = self._credentials
+            if creds is None or not creds.refresh_token:
+                return
+            delay = self._seconds_until_refresh(creds)
+            if delay is None:
+                return
+        self._timer = threading.Timer(max(delay, 0.0), self._refresh_in_background)
+        self._timer.daemon = True
+        self._timer.start()
+
+    def _refresh_in_background(self) -> None:
+        with self._lock:
+            creds = self._credentials
+            if creds is None:
+                return
+            try:
+                self._refresh_locked(creds)
+            except Exception as e:
+                if isinstance(e, RefreshError) and not e.retryable:
+                    # The refresh token was revoked or expired; the next get() reports it
+                    logger.error("Google refused to refresh the credentials: %s", e)
+                    self._refresh_error = e
+                    return
+                # The current token is usually still good for a few minutes; try again shortly
+                logger.warning("Could not refresh the Google credentials (%s). Retrying in %.0f s.", e, _RETRY_SECONDS)
+                self._schedule_refresh(_RETRY_SECONDS)
+                return
+            self._schedule_refresh()
+
+_MANAGERS: Dict[Tuple[str, str], CredentialManager] = {}
+_MANAGERS_LOCK = threading.Lock()
+
+def get_credential_manager(credentials_path: str = "credentials.json", token_path: str = "token.json") -> CredentialManager:
+    """Returns the process-wide manager for a token file."""
+    with _MANAGERS_LOCK:
+        key = (credentials_path, token_path)
+        if key not in _MANAGERS:
+            _MANAGERS[key] = CredentialManager(credentials_path, token_path, settings.CREDENTIAL_REFRESH_MARGIN_SECONDS)
+        return _MANAGERS[key]
+
+def refresh_if_due(credentials: Credentials) -> None:
+    """Refreshes credentials through their manager if they are expired or about to expire.
+
+    Called before every API request, so a token that lapsed while the machine slept is refreshed
+    under the manager's lock and saved, rather than by the HTTP transport on its own.
+    """
+    with _MANAGERS_LOCK:
+        managers = list(_MANAGERS.values())
+    for manager in managers:
+        if manager.holds(credentials):
+            manager.get()
+            return
+
+@profiler.profiled("auth.get_google_credentials")
+def get_google_credentials(credentials_path: str = "credentials.json", token_path: str = "token.json") -> Credentials:
+    """Gets valid user credentials from memory, storage or the OAuth flow.
+
+    Every call in a process returns the same Credentials object, kept fresh in the background.
+
+    Args:
+        credentials_path (str): Path to the credentials.json file.
+        token_path (str): Path to the token.json file for caching.
+
+    Returns:
+        Credentials: The Google OAuth2 credentials.
+    """
+    return get_credential_manager(credentials_path, token_path).get()
@@ -0,0 +1,178 @@
+import random
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, Optional
+
+from googleapiclient.errors import HttpError
+from googleapiclient.http import HttpRequest
+
+from src.domain.exceptions import QuotaBudgetExceededError
+from src.infrastructure.config.settings import settings
+from src.infrastructure.profiling import payload_size, profiler
+
+# HTTP statuses that are worth retrying after a pause
+RETRYABLE_STATUSES = {429, 500, 502, 503, 504}
+# Drive reports per-user throttling as a 403 with one of these reasons
+RATE_LIMIT_REASONS = ("rateLimitExceeded", "userRateLimitExceeded")
+
+class TokenBucket:
+    """Thread-safe token bucket that hands out at most rate_per_minute tokens per minute."""
+
+    def __init__(self, rate_per_minute: int):
+        self.rate_per_second = rate_per_minute / 60.0
+        # Allow a burst of roughly ten seconds' worth of calls
+        self.capacity = max(1.0, rate_per_minute / 6.0)
+        self._tokens = self.capacity
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Blocks until a token is available, then takes it."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated_at) * self.rate_per_second)
+                self._updated_at = now
+
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate_per_second
+
+            time.sleep(wait)
+
+class CallBudget:
+    """Thread-safe count of API calls made against an optional limit."""
+
+    def __init__(self, limit: Optional[int] = None):
+        self.limit = limit
+        self.calls_made = 0
+        self._lock = threading.Lock()
+
+    def take(self) -> None:
+        """Counts one call, or raises if the limit has been reached."""
+        with self._lock:
+            if self.limit is not None and self.calls_made >= self.limit:
+                raise QuotaBudgetExceededError(self.limit)
+            self.calls_made += 1
+
+# The budget of the request being served, when one was opened with ApiExecutor.budget_scope
+_SCOPED_BUDGET: ContextVar[Optional[CallBudget]] = ContextVar("api_call_budget", default=None)
+
+class ApiExecutor:
+    """Runs Google API requests through a per-API rate limiter, retry policy and per-run (or per-request) call budget."""
+
+    def __init__(
+        self,
+        requests_per_minute: Dict[str, int],
+        max_retries: int = 5,
+        base_delay: float = 1.0,
+        max_delay: float = 32.0,
+        budget: Optional[int] = None
+    ):
+        self.buckets = {api: TokenBucket(rate) for api, rate in requests_per_minute.items()}
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.budget = budget
+        # Counts calls made outside any budget_scope (a CLI run)
+        self._run_budget = CallBudget(budget)
+
+    @property
+    def calls_made(self) -> int:
+        return self._run_budget.calls_made
+
+    def reset_budget(self, budget: Optional[int] = None) -> None:
+        """Starts a new run, optionally with a different call budget."""
+        if budget is not None:
+            self.budget = budget
+        self._run_budget = CallBudget(self.budget)
+
+    @contextmanager
+    def budget_scope(self, budget: Optional[int] = None) -> Iterator[CallBudget]:
+        """Gives the calls made inside the block their own budget, separate from other concurrent requests.
+
+        Worker threads only share the scope if their tasks run in a copy of this context
+        (`contextvars.copy_context().run`).
+        """
+        scope = CallBudget(self.budget if budget is None else budget)
+        token = _SCOPED_BUDGET.set(scope)
+        try:
+            yield scope
+        finally:
+            _SCOPED_BUDGET.reset(token)
+
+    def _take_budget(self) -> None:
+        (_SCOPED_BUDGET.get() or self._run_budget).take()
+
+    def _is_rate_limited(self, error: Exception) -> bool:
+        """Whether Google turned the request away for quota, so it was certainly not applied."""
+        if not isinstance(error, HttpError):
+            return False
+        if error.resp.status == 429:
+            return True
+        content = error.content.decode("utf-8", "ignore") if isinstance(error.content, bytes) else str(error.content)
+        return error.resp.status == 403 and any(reason in content for reason in RATE_LIMIT_REASONS)
+
+    def _is_retryable(self, error: Exception, idempotent: bool) -> bool:
+        if self._is_rate_limited(error):
+            return True
+        # A timeout or server error may come after the change was applied; replaying it would apply it twice
+        if not idempotent:
+            return False
+        if isinstance(error, HttpError):
+            return error.resp.status in RETRYABLE_STATUSES
+        return isinstance(error, (ConnectionError, TimeoutError))
+
+    def _retry_delay(self, error: Exception, attempt: int) -> float:
+        """Jittered exponential backoff, honouring a Retry-After header when Google sends one."""
+        if isinstance(error, HttpError):
+            retry_after = error.resp.get("retry-after")
+            if retry_after and retry_after.isdigit():
+                return float(retry_after)
+        delay = min(self.max_delay, self.base_delay * (2 ** attempt))
+        return random.uniform(delay / 2, delay)
+
+    def execute(self, request: HttpRequest, api: str, idempotent: bool = True) -> Any:
+        """Executes a request built by a googleapiclient service.
+
+        Args:
+            request (HttpRequest): The request, e.g. `service.files().list(...)`.
+            api (str): Which quota the call counts against ("sheets", "forms" or "drive").
+            idempotent (bool): Whether sending the request twice has the same effect as once.
+                Requests that create something are only retried when Google rejected them for quota.
+
+        Returns:
+            Any: The decoded response body.
+        """
+        bucket = self.buckets.get(api)
+        # One logical call counts once against the budget, however many attempts it takes
+        self._take_budget()
+        attempt = 0
+        while True:
+            if bucket:
+                bucket.acquire()
+
+            try:
+                with profiler.span(getattr(request, "methodId", api)) as details:
+                    response = request.execute()
+                    if profiler.recording:
+                        details["payload_bytes"] = payload_size(getattr(request, "body", None)) + payload_size(response)
+                return response
+            except Exception as e:
+                if attempt >= self.max_retries or not self._is_retryable(e, idempotent):
+                    raise
+                time.sleep(self._retry_delay(e, attempt))
+                attempt += 1
+
+api_executor = ApiExecutor(
+    requests_per_minute={
+        "sheets": settings.SHEETS_REQUESTS_PER_MINUTE,
+        "forms": settings.FORMS_REQUESTS_PER_MINUTE,
+        "drive": settings.DRIVE_REQUESTS_PER_MINUTE,
+    },
+    max_retries=settings.API_MAX_RETRIES,
+    budget=settings.API_CALL_BUDGET
+)
@@ -0,0 +1,185 @@
+import json
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, TextIO, Tuple
+
+from pydantic import BaseModel, ConfigDict
+
+from src.application.ports.interfaces import QuizExporter
+from src.domain.models import Question, Quiz
+from src.infrastructure.config.settings import settings
+
+class CompiledForm(BaseModel):
+    """The forms.batchUpdate requests that fill a fresh form with a quiz, with size estimates."""
+    model_config = ConfigDict(frozen=True)
+
+    title: str
+    content_hash: str
+    requests: List[Dict[str, Any]]
+    request_count: int
+    payload_bytes: int # Size of the whole body as a single batchUpdate
+    batch_count: int # batchUpdate calls needed within FORM_BATCH_MAX_REQUESTS / FORM_BATCH_MAX_BYTES
+
+    @property
+    def body(self) -> Dict[str, Any]:
+        return {"requests": self.requests}
+
+def _encoded_size(value: Any) -> int:
+    return len(json.dumps(value, ensure_ascii=False).encode("utf-8"))
+
+class FormRequestCompiler:
+    """Turns quizzes into Forms API requests without touching the network.
+
+    Results are memoized by the quiz's content hash, so bulk runs and resumed builds reuse
+    bodies they already compiled. Callers must not modify the returned requests.
+    """
+
+    def __init__(self, max_entries: int = 256):
+        self.max_entries = max_entries
+        self._cache: "OrderedDict[Tuple, CompiledForm]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def question_item(self, q: Question) -> Dict[str, Any]:
+        """Builds the Forms API item for a short-answer quiz question."""
+        return {
+            "title": q.formatted_title,
+            "questionItem": {
+                "question": {
+                    "required": True,
+                    "grading": {
+                        "pointValue": q.points,
+                        "correctAnswers": {
+                            "answers": [{"value": q.formatted_answer_key}]
+                        }
+                    },
+                    "textQuestion": {} # Short Answer
+                }
+            }
+        }
+
+    def _requests(self, quiz: Quiz, title: str, from_template: bool) -> List[Dict[str, Any]]:
+        requests: List[Dict[str, Any]] = [
+            {
+                "updateFormInfo": {
+                    "info": {
+                        "title": title, # Set the display title
+                        "description": quiz.description
+                    },
+                    "updateMask": "title,description"
+                }
+            }
+        ]
+
+        # If we didn't use a template, we need to turn on Quiz mode and Verified Emails
+        if not from_template:
+            requests.append({
+                "updateSettings": {
+                    "settings": {
+                        "quizSettings": { "isQuiz": True },
+                        "emailCollectionType": "VERIFIED"
+                    },
+                    "updateMask": "quizSettings.isQuiz,emailCollectionType"
+                }
+            })
+
+        for index, q in enumerate(quiz.questions):
+            requests.append({
+                "createItem": {
+                    "item": self.question_item(q),
+                    "location": {
+                        "index": index
+                    }
+                }
+            })
+        return requests
+
+    def compile(self, quiz: Quiz, title: Optional[str] = None) -> CompiledForm:
+        """Compiles the requests that turn a fresh copy of the template (or a blank form) into the quiz.
+
+        Args:
+            quiz (Quiz): The quiz to compile.
+            title (Optional[str]): The form title, if it differs from the quiz's (e.g. a numbered duplicate).
+
+        Returns:
+            CompiledForm: The requests and their size estimates.
+        """
+        title = title or quiz.title
+        from_template = bool(settings.TEMPLATE_FORM_ID)
+        limits = (settings.FORM_BATCH_MAX_REQUESTS, settings.FORM_BATCH_MAX_BYTES)
+        key = (quiz.content_hash, title, from_template, limits)
+
+        with self._lock:
+            compiled = self._cache.get(key)
+            if compiled is not None:
+                self._cache.move_to_end(key)
+                return compiled
+
+        requests = self._requests(quiz, title, from_template)
+        compiled = CompiledForm(
+            title=title,
+            content_hash=quiz.content_hash,
+            requests=requests,
+            request_count=len(requests),
+            payload_bytes=_encoded_size({"requests": requests}),
+            batch_count=len(self.chunk(requests))
+        )
+
+        with self._lock:
+            self._cache[key] = compiled
+            if len(self._cache) > self.max_entries:
+                self._cache.popitem(last=False)
+        return compiled
+
+    def chunk(self, requests: List[Dict[str, Any]]) -> List[List[Dict[str, Any]]]:
+        """Splits requests, in order, into batches within the configured request count and payload size."""
+        chunks: List[List[Dict[str, Any]]] = []
+        current: List[Dict[str, Any]] = []
+        current_size = 0
+        for request in requests:
+            size = _encoded_size(request)
+            if current and (
+                len(current) >= settings.FORM_BATCH_MAX_REQUESTS
+                or current_size + size > settings.FORM_BATCH_MAX_BYTES
+            ):
+                chunks.append(current)
+                current, current_size = [], 0
+            current.append(request)
+            current_size += size
+        if current:
+            chunks.append(current)
+        return chunks
+
+# Shared so every form service in the process reuses the same compiled bodies
+form_compiler = FormRequestCompiler()
+
+class CompiledFormExporter(QuizExporter):
+    """Writes a JSON array with each quiz's compiled batchUpdate body and estimates, streamed quiz by quiz."""
+
+    def __init__(self, stream: TextIO, compiler: FormRequestCompiler = form_compiler):
+        self.stream = stream
+        self.compiler = compiler
+        # (quiz, compiled form) for every quiz written, for summaries
+        self.compiled: List[Tuple[Quiz, CompiledForm]] = []
+
+    def begin(self) -> None:
+        self.compiled = []
+        self.stream.write("[")
+
+    def write_quiz(self, quiz: Quiz) -> None:
+        compiled = self.compiler.compile(quiz)
+        self.stream.write(",\n" if self.compiled else "\n")
+        json.dump({
+            "week": quiz.metadata.week,
+            "year": quiz.metadata.year,
+            "language": quiz.language.value,
+            "title": compiled.title,
+            "content_hash": compiled.content_hash,
+            "request_count": compiled.request_count,
+            "payload_bytes": compiled.payload_bytes,
+            "batch_count": compiled.batch_count,
+            "body": compiled.body,
+        }, self.stream, ensure_ascii=False, indent=2)
+        self.compiled.append((quiz, compiled))
+
+    def finish(self) -> None:
+        self.stream.write("\n]\n")
@@ -0,0 +1,162 @@
+import logging
+import threading
+from typing import Any, Dict, Optional
+
+from google.oauth2.credentials import Credentials
+from googleapiclient.errors import HttpError
+
+from src.infrastructure.config.settings import settings
+from src.infrastructure.google.execution import api_executor
+from src.infrastructure.google.service_factory import get_service
+from src.infrastructure.profiling import profiler
+from src.infrastructure.storage.form_pool_store import FormPoolStore
+
+logger = logging.getLogger(__name__)
+
+# Drive name of a copy that is waiting in the pool
+POOLED_FORM_NAME = "Bible Quiz (blank, pooled)"
+
+class TemplateFormPool:
+    """Keeps blank copies of the template form ready, so creating a quiz only has to rename one.
+
+    Copies are made ahead of time into FORM_POOL_FOLDER_ID (or next to the template) and recorded
+    in the local store together with the template's Drive version. A copy made before the template
+    was last edited is trashed instead of handed out. After each claim the pool tops itself up on a
+    background thread.
+    """
+
+    def __init__(self, credentials: Credentials, template_id: str, size: int, folder_id: Optional[str] = None):
+        self._credentials = credentials
+        self.template_id = template_id
+        self.size = size
+        self.folder_id = folder_id
+        self.store = FormPoolStore(settings.LOCAL_STORE_PATH)
+        self._home_parent: Optional[str] = None
+        self._fill_lock = threading.Lock()
+        self._thread_lock = threading.Lock()
+        self._fill_thread: Optional[threading.Thread] = None
+
+    @property
+    def drive_service(self):
+        return get_service("drive", "v3", self._credentials)
+
+    def available(self) -> int:
+        """Returns how many blank copies are ready."""
+        return self.store.count(self.template_id)
+
+    @profiler.profiled("form_pool.claim")
+    def claim(self, title: str) -> Optional[str]:
+        """Takes a blank copy, renames it to title and returns its ID, or None if the pool is empty."""
+        try:
+            version = self._template_version()
+            while True:
+                pooled = self.store.claim(self.template_id)
+                if pooled is None:
+                    return None
+                if pooled.template_version != version:
+                    # Copied before the template was edited, so it carries the old settings
+                    self._discard(pooled.form_id)
+                    continue
+
+                request_args = {"fileId": pooled.form_id, "body": {"name": title}, "fields": "id"}
+                if self.folder_id and pooled.home_parent:
+                    # Move it out of the pool folder to where plain copies of the template land
+                    request_args["addParents"] = pooled.home_parent
+                    request_args["removeParents"] = self.folder_id
+                try:
+                    api_executor.execute(self.drive_service.files().update(**request_args), "drive")
+                    return pooled.form_id
+                except HttpError as e:
+                    # Someone deleted the copy in Drive; try the next one
+                    if e.resp.status == 404:
+                        continue
+                    # Anything else says nothing about the copy, so keep it for a later claim
+                    self.store.add(pooled.form_id, pooled.template_id, pooled.template_version, pooled.home_parent)
+                    raise
+        finally:
+            self.fill_in_background()
+
+    def _template_version(self) -> str:
+        """Returns a token that changes whenever the template form is edited."""
+        template = api_executor.execute(
+            self.drive_service.files().get(fileId=self.template_id, fields="version,modifiedTime"), "drive"
+        )
+        return f"{template.get('version')}|{template.get('modifiedTime')}"
+
+    def _discard(self, form_id: str) -> None:
+        """Moves a stale copy to the Drive trash."""
+        try:
+            api_executor.execute(
+                self.drive_service.files().update(fileId=form_id, body={"trashed": True}, fields="id"), "drive"
+            )
+        except HttpError as e:
+            # Already gone is as good as trashed
+            if e.resp.status != 404:
+                raise
+
+    def _get_home_parent(self) -> Optional[str]:
+        if self._home_parent is None and self.folder_id:
+            template = api_executor.execute(
+                self.drive_service.files().get(fileId=self.template_id, fields="parents"), "drive"
+            )
+            parents = template.get("parents") or []
+            self._home_parent = parents[0] if parents else None
+        return self._home_parent
+
+    @profiler.profiled("form_pool.fill")
+    def fill(self) -> int:
+        """Copies the template until the pool holds `size` blank forms. Returns how many were added."""
+        with self._fill_lock:
+            added = 0
+            home_parent = self._get_home_parent()
+            version = self._template_version()
+            # Stale copies stay in the store until a claim trashes them, so only current ones count
+            while self.store.count(self.template_id, version) < self.size:
+                body: Dict[str, Any] = {"name": POOLED_FORM_NAME}
+                if self.folder_id:
+                    body["parents"] = [self.folder_id]
+                new_file = api_executor.execute(
+                    self.drive_service.files().copy(fileId=self.template_id, body=body, fields="id"),
+                    "drive",
+                    idempotent=False
+                )
+                self.store.add(new_file["id"], self.template_id, version, home_parent)
+                added += 1
+            return added
+
+    def _fill_quietly(self) -> None:
+        # The top-up gets its own budget so it cannot use up the calls of the run that claimed
+        try:
+            with api_executor.budget_scope():
+                self.fill()
+        except Exception as e:
+            # A failed top-up only means the next create copies the template itself
+            logger.warning("Could not top up the form pool: %s", e)
+
+    def fill_in_background(self) -> None:
+        """Starts topping up the pool unless a top-up is already running.
+
+        The thread is not a daemon, so a short-lived CLI run finishes its copies before exiting
+        instead of leaving untracked forms in Drive.
+        """
+        with self._thread_lock:
+            if self._fill_thread is not None and self._fill_thread.is_alive():
+                return
+            self._fill_thread = threading.Thread(target=self._fill_quietly, name="form-pool-fill")
+            self._fill_thread.start()
+
+_POOLS: Dict[str, TemplateFormPool] = {}
+_POOLS_LOCK = threading.Lock()
+
+def get_template_pool(credentials: Credentials) -> Optional[TemplateFormPool]:
+    """Returns the process-wide pool for TEMPLATE_FORM_ID, or None if pooling is off (FORM_POOL_SIZE = 0)."""
+    if not settings.TEMPLATE_FORM_ID or settings.FORM_POOL_SIZE <= 0:
+        return None
+    with _POOLS_LOCK:
+        pool = _POOLS.get(settings.TEMPLATE_FORM_ID)
+        if pool is None:
+            pool = TemplateFormPool(
+                credentials, settings.TEMPLATE_FORM_ID, settings.FORM_POOL_SIZE, settings.FORM_POOL_FOLDER_ID
+            )
+            _POOLS[settings.TEMPLATE_FORM_ID] = pool
+        return pool
@@ -1,130 +1,376 @@
-from typing import List, Optional
-from googleapiclient.discovery import build
+import threading
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
 from google.oauth2.credentials import Credentials
+from googleapiclient.errors import HttpError
 
 from src.application.ports.interfaces import FormService
-from src.domain.models import Quiz, Question
+from src.domain.models import Quiz
 from src.infrastructure.config.settings import settings
+from src.infrastructure.google.execution import api_executor
+from src.infrastructure.google.form_compiler import form_compiler
+from src.infrastructure.google.form_pool import get_template_pool
+from src.infrastructure.google.service_factory import get_service
+from src.infrastructure.profiling import profiler
+from src.infrastructure.storage.form_ledger import FormBuild, FormLedger
 
 class GoogleFormService(FormService):
     """Implementation of FormService using Google Forms API."""
 
-    def __init__(self, credentials: Credentials):
-        self.forms_service = build("forms", "v1", credentials=credentials)
-        self.drive_service = build("drive", "v3", credentials=credentials)
+    def __init__(self, credentials: Credentials, reuse_existing: bool = True):
+        # API clients are not thread-safe, so each worker thread gets its own from the factory
+        self._credentials = credentials
+        # When set, re-running a week updates its existing form instead of creating a new one
+        self.reuse_existing = reuse_existing
+        self.ledger = FormLedger(settings.LOCAL_STORE_PATH)
+        # Blank template copies made ahead of time, when FORM_POOL_SIZE is set
+        self.pool = get_template_pool(credentials)
+        # Form titles already in Drive, per base title, cached for the session
+        self._taken_titles: Dict[str, Set[str]] = {}
+        self._titles_lock = threading.Lock()
 
-    def _get_unique_title(self, base_title: str) -> str:
-        """Checks if a form with the title exists and returns a unique one with a counter."""
-        current_title = base_title
-        counter = 1
-        
+    @property
+    def forms_service(self):
+        return get_service("forms", "v1", self._credentials)
+
+    @property
+    def drive_service(self):
+        return get_service("drive", "v3", self._credentials)
+
+    def _get_taken_titles(self, base_title: str) -> Set[str]:
+        """Lists every form title starting with base_title using a single (paginated) prefix query."""
+        # Escape single quotes in title for the query
+        safe_title = base_title.replace("'", "\\'")
+        query = f"name contains '{safe_title}' and mimeType = 'application/vnd.google-apps.form' and trashed = false"
+
+        titles: Set[str] = set()
+        page_token = None
         while True:
-            # Escape single quotes in title for the query
-            safe_title = current_title.replace("'", "\\'")
-            query = f"name = '{safe_title}' and mimeType = 'application/vnd.google-apps.form' and trashed = false"
-            
-            results = self.drive_service.files().list(
+            results = api_executor.execute(self.drive_service.files().list(
                 q=query,
                 spaces='drive',
-                fields='files(id, name)'
-            ).execute()
-            
-            if not results.get('files', []):
-                return current_title
-            
-            current_title = f"{base_title} ({counter})"
-            counter += 1
-
-    def create_form(self, quiz: Quiz) -> str:
-        """Creates a Google Form from a Quiz object.
-        
+                fields='nextPageToken, files(name)',
+                pageSize=1000,
+                pageToken=page_token
+            ), "drive")
+            titles.update(f['name'] for f in results.get('files', []))
+
+            page_token = results.get('nextPageToken')
+            if not page_token:
+                return titles
+
+    @profiler.profiled("forms._get_unique_title")
+    def _get_unique_title(self, base_title: str) -> str:
+        """Returns base_title, or base_title with the first free counter if copies already exist."""
+        if base_title not in self._taken_titles:
+            # Query outside the lock so workers allocating different titles don't wait on each other
+            titles = self._get_taken_titles(base_title)
+            with self._titles_lock:
+                self._taken_titles.setdefault(base_title, titles)
+
+        with self._titles_lock:
+            taken = self._taken_titles[base_title]
+            current_title = base_title
+            counter = 1
+            while current_title in taken:
+                current_title = f"{base_title} ({counter})"
+                counter += 1
+
+            # Reserve it so later calls in this session don't hand it out again
+            taken.add(current_title)
+            return current_title
+
+    def _item_signature(self, item: Dict[str, Any]) -> Optional[Tuple]:
+        """Reduces an item to the fields we manage, or None if it is not a short-answer question."""
+        question = item.get("questionItem", {}).get("question", {})
+        if "textQuestion" not in question:
+            return None
+        grading = question.get("grading", {})
+        answers = tuple(a.get("value") for a in grading.get("correctAnswers", {}).get("answers", []))
+        return (item.get("title"), grading.get("pointValue"), answers)
+
+    def _get_existing_form(self, form_id: str) -> Optional[Dict[str, Any]]:
+        """Fetches a previously created form, or None if it no longer exists."""
+        try:
+            return api_executor.execute(self.forms_service.forms().get(formId=form_id), "forms")
+        except HttpError as e:
+            if e.resp.status in (403, 404):
+                return None
+            raise
+
+    def _sync_form(
+        self,
+        form: Dict[str, Any],
+        quiz: Quiz,
+        title: str,
+        item_ids: List[str],
+        on_stage: Callable[[str], None]
+    ) -> List[str]:
+        """Brings an existing form in line with the quiz using the fewest item changes.
+
+        Only the question items this tool created (item_ids) are touched; headers, text blocks and
+        anything else added by hand or by the template stay where they are.
+
         Returns:
-            str: The URL of the created form.
+            List[str]: The IDs of the quiz's question items afterwards, in quiz order.
+        """
+        items = form.get("items", [])
+        tracked = set(item_ids)
+        managed = [index for index, item in enumerate(items) if item.get("itemId") in tracked]
+        desired_items = [form_compiler.question_item(q) for q in quiz.questions]
+        requests: List[Dict[str, Any]] = []
+
+        info = form.get("info", {})
+        changed_info = {
+            field: value
+            for field, value in (("title", title), ("description", quiz.description))
+            if info.get(field) != value
+        }
+        if changed_info:
+            requests.append({
+                "updateFormInfo": {
+                    "info": changed_info,
+                    "updateMask": ",".join(changed_info)
+                }
+            })
+
+        # Item ID for each question, filled in from the replies where an item has to be created
+        new_ids: List[Optional[str]] = [None] * len(desired_items)
+        created_for: List[int] = []
+
+        # Questions present on both sides: update in place, or replace if someone changed the question type
+        for position in range(min(len(managed), len(desired_items))):
+            index = managed[position]
+            current = self._item_signature(items[index])
+            if current == self._item_signature(desired_items[position]):
+                new_ids[position] = items[index].get("itemId")
+                continue
+            if current is None:
+                requests.append({"deleteItem": {"location": {"index": index}}})
+                requests.append({"createItem": {"item": desired_items[position], "location": {"index": index}}})
+                created_for.append(position)
+            else:
+                requests.append({
+                    "updateItem": {
+                        "item": desired_items[position],
+                        "location": {"index": index},
+                        "updateMask": "title,questionItem.question.grading"
+                    }
+                })
+                new_ids[position] = items[index].get("itemId")
+
+        # Surplus questions are deleted from the end so earlier indices stay valid
+        for index in reversed(managed[len(desired_items):]):
+            requests.append({"deleteItem": {"location": {"index": index}}})
+
+        # New questions go right after the last existing one, or at the end of the form
+        insert_at = managed[-1] + 1 if managed else len(items)
+        for offset, position in enumerate(range(len(managed), len(desired_items))):
+            requests.append({"createItem": {"item": desired_items[position], "location": {"index": insert_at + offset}}})
+            created_for.append(position)
+
+        if requests:
+            replies = self._apply_requests(form["formId"], requests, on_stage)
+            for position, item_id in zip(created_for, self._created_item_ids(replies)):
+                new_ids[position] = item_id
+        return [item_id for item_id in new_ids if item_id]
+
+    def _created_item_ids(self, replies: List[Dict[str, Any]]) -> List[str]:
+        """The IDs of the items created by a batch, in request order."""
+        return [reply["createItem"]["itemId"] for reply in replies if "createItem" in reply]
+
+    def _apply_requests(
+        self,
+        form_id: str,
+        requests: List[Dict[str, Any]],
+        on_stage: Callable[[str], None],
+        on_committed: Optional[Callable[[int, List[Dict[str, Any]]], None]] = None
+    ) -> List[Dict[str, Any]]:
+        """Sends requests back to back in size-bounded batches and returns their replies.
+
+        After each batch, on_committed gets the number of requests applied so far and their replies.
         """
+        chunks = form_compiler.chunk(requests)
+        replies: List[Dict[str, Any]] = []
+        for number, chunk in enumerate(chunks, start=1):
+            if len(chunks) > 1:
+                on_stage(f"Sending batch {number} of {len(chunks)}")
+            response = api_executor.execute(
+                self.forms_service.forms().batchUpdate(formId=form_id, body={"requests": chunk}),
+                "forms",
+                idempotent=False
+            )
+            replies.extend(response.get("replies", [{} for _ in chunk]))
+            if on_committed:
+                on_committed(len(replies), replies)
+        return replies
+
+    def _build_form(
+        self,
+        form_id: str,
+        title: str,
+        quiz: Quiz,
+        start: int,
+        item_ids: List[str],
+        template_id: Optional[str],
+        on_stage: Callable[[str], None]
+    ) -> List[str]:
+        """Applies the quiz's requests from index start on, recording progress after every batch.
+
+        Returns:
+            List[str]: The IDs of all the quiz's question items, in quiz order.
+        """
+        year, week, language = quiz.metadata.year, quiz.metadata.week, quiz.language
+        requests = form_compiler.compile(quiz, title).requests
+
+        def record(committed: int, replies: List[Dict[str, Any]]) -> None:
+            self.ledger.save_build(
+                year, week, language, form_id, title, quiz.content_hash, start + committed,
+                item_ids + self._created_item_ids(replies), template_id
+            )
+
+        if start:
+            on_stage(f"Resuming at request {start + 1} of {len(requests)}")
+        else:
+            on_stage(f"Adding {len(quiz.questions)} questions")
+        replies = self._apply_requests(form_id, requests[start:], on_stage, record)
+        return item_ids + self._created_item_ids(replies)
+
+    def _resume_form(self, build: FormBuild, quiz: Quiz, on_stage: Callable[[str], None]) -> Optional[List[str]]:
+        """Finishes a form an earlier run left part-built and returns its question item IDs, or None if that form is gone."""
+        on_stage("Resuming the interrupted form")
+        form = self._get_existing_form(build.form_id)
+        if form is None:
+            self.ledger.remove_build(build.year, build.week, build.language)
+            return None
+
+        # The recorded progress is trusted only if the form holds exactly the items it implies,
+        # the template's own plus those created so far; a batch that failed client-side may still have been applied
+        requests = form_compiler.compile(quiz, build.title).requests
+        created = sum(1 for r in requests[:build.committed_requests] if "createItem" in r)
+        template_items = self._count_template_items(build.template_id)
+        same_content = build.content_hash == quiz.content_hash or build.committed_requests == 0
+        if same_content and template_items is not None and len(form.get("items", [])) == template_items + created:
+            return self._build_form(
+                build.form_id, build.title, quiz, build.committed_requests, build.item_ids, build.template_id, on_stage
+            )
+
+        on_stage("Updating changed questions")
+        return self._sync_form(form, quiz, build.title, build.item_ids, on_stage)
+
+    def _count_template_items(self, template_id: Optional[str]) -> Optional[int]:
+        """Returns how many items a copy of the template starts with, or None if the template is gone."""
+        if not template_id:
+            return 0
+        template = self._get_existing_form(template_id)
+        return len(template.get("items", [])) if template else None
+
+    def _create_new_form(self, quiz: Quiz, on_stage: Callable[[str], None]) -> Tuple[str, str, List[str]]:
+        """Creates a brand-new form for the quiz and returns its ID, title and question item IDs."""
         # Ensure the title is unique
+        on_stage("Allocating a unique title")
         unique_title = self._get_unique_title(quiz.title)
         
         form_id = None
+        template_id = settings.TEMPLATE_FORM_ID or None
         
         # 1. Create or Copy the form
-        if settings.TEMPLATE_FORM_ID:
+        if self.pool:
+            # A blank copy made ahead of time only needs renaming; falls through if the pool is empty
+            on_stage("Taking a pre-copied template form")
+            form_id = self.pool.claim(unique_title)
+
+        if form_id is None and settings.TEMPLATE_FORM_ID:
             # Copy from template to preserve settings (Manual Release, Verified Email, etc.)
+            on_stage("Copying the template form")
             copy_body = {'name': unique_title}
-            new_file = self.drive_service.files().copy(
+            new_file = api_executor.execute(self.drive_service.files().copy(
                 fileId=settings.TEMPLATE_FORM_ID, 
                 body=copy_body
-            ).execute()
+            ), "drive", idempotent=False)
             form_id = new_file['id']
-        else:
+        elif form_id is None:
             # Fallback: Create new form if no template ID is provided
+            on_stage("Creating a blank form")
             form_body = {
                 "info": {
                     "title": unique_title,
                     "documentTitle": unique_title,
                 }
             }
-            form = self.forms_service.forms().create(body=form_body).execute()
+            form = api_executor.execute(self.forms_service.forms().create(body=form_body), "forms", idempotent=False)
             form_id = form.get("formId")
+            template_id = None
+
+        # 2. Remember the form before filling it, so a failure part way resumes here instead of copying again
+        year, week, language = quiz.metadata.year, quiz.metadata.week, quiz.language
+        self.ledger.save_build(year, week, language, form_id, unique_title, quiz.content_hash, 0, [], template_id)
+
+        # 3. Set title and description, then add questions in size-bounded batches
+        item_ids = self._build_form(form_id, unique_title, quiz, 0, [], template_id, on_stage)
         
-        # 2. Build update requests (title, description, questions)
-        update_requests = {
-            "requests": [
-                {
-                    "updateFormInfo": {
-                        "info": {
-                            "title": unique_title, # Set the display title
-                            "description": quiz.description
-                        },
-                        "updateMask": "title,description"
-                    }
-                }
-            ]
-        }
+        return form_id, unique_title, item_ids
+
+    @profiler.profiled("forms.create_form")
+    def create_form(self, quiz: Quiz, on_stage: Optional[Callable[[str], None]] = None) -> str:
+        """Creates a Google Form from a Quiz object, or updates the one created for it previously.
+
+        Large quizzes are sent in several batches. If a run fails part way, the next run for the
+        same week and language carries on with the same form.
+
+        Args:
+            quiz (Quiz): The quiz to publish.
+            on_stage (Optional[Callable[[str], None]]): Called with a short description as each stage starts.
         
-        # If we didn't use a template, we need to turn on Quiz mode and Verified Emails
-        if not settings.TEMPLATE_FORM_ID:
-            update_requests["requests"].append({
-                "updateSettings": {
-                    "settings": {
-                        "quizSettings": { "isQuiz": True },
-                        "emailCollectionType": "VERIFIED"
-                    },
-                    "updateMask": "quizSettings.isQuiz,emailCollectionType"
-                }
-            })
+        Returns:
+            str: The URL of the created form.
+        """
+        on_stage = on_stage or (lambda stage: None)
+        year, week, language = quiz.metadata.year, quiz.metadata.week, quiz.language
+        content_hash = quiz.content_hash
 
-        # 3. Add questions (batchUpdate)
-        for index, q in enumerate(quiz.questions):
-            update_requests["requests"].append({
-                "createItem": {
-                    "item": {
-                        "title": q.formatted_title,
-                        "questionItem": {
-                            "question": {
-                                "required": True,
-                                "grading": {
-                                    "pointValue": q.points,
-                                    "correctAnswers": {
-                                        "answers": [{"value": q.formatted_answer_key}]
-                                    }
-                                },
-                                "textQuestion": {} # Short Answer
-                            }
-                        }
-                    },
-                    "location": {
-                        "index": index
-                    }
-                }
-            })
+        build = self.ledger.get_build(year, week, language)
+        if build and not self.reuse_existing:
+            # A fresh form was asked for, so a half-built one is not carried on either
+            self.ledger.remove_build(year, week, language)
+            build = None
+        if build:
+            item_ids = self._resume_form(build, quiz, on_stage)
+            if item_ids is not None:
+                self.ledger.save(year, week, language, build.form_id, content_hash, build.title, item_ids)
+                self.ledger.remove_build(year, week, language)
+                return f"https://docs.google.com/forms/d/{build.form_id}/edit"
+
+        entry = self.ledger.get(year, week, language) if self.reuse_existing else None
+        if entry:
+            on_stage("Fetching the existing form")
+            form = self._get_existing_form(entry.form_id)
+            if form is None:
+                # Deleted in Drive since the last run; a new one is made below
+                self.ledger.remove(year, week, language)
+            elif entry.content_hash == content_hash:
+                # Nothing changed in the sheet since the last run
+                return f"https://docs.google.com/forms/d/{entry.form_id}/edit"
+            else:
+                on_stage("Updating changed questions")
+                item_ids = self._sync_form(form, quiz, entry.title, entry.item_ids, on_stage)
+                self.ledger.save(year, week, language, entry.form_id, content_hash, entry.title, item_ids)
+                return f"https://docs.google.com/forms/d/{entry.form_id}/edit"
 
-        self.forms_service.forms().batchUpdate(formId=form_id, body=update_requests).execute()
+        form_id, title, item_ids = self._create_new_form(quiz, on_stage)
+        self.ledger.save(year, week, language, form_id, content_hash, title, item_ids)
+        self.ledger.remove_build(year, week, language)
         
         return f"https://docs.google.com/forms/d/{form_id}/edit"
 
+    def prepare(self) -> None:
+        """Starts topping up the pool of blank template copies, if pooling is on."""
+        if self.pool:
+            self.pool.fill_in_background()
+
     def link_responses(self, form_id: str, spreadsheet_id: str) -> None:
         """
         Note: The Google Forms REST API (v1) does not currently support 
-        linking a form to a spreadsheet.
+        linking a form to a spreadsheet. Use the `ingest` command
+        (IngestResponsesUseCase) to copy responses into the response spreadsheets instead.
         """
         pass
@@ -0,0 +1,151 @@
+import re
+from typing import Any, Dict, Iterator, List, Optional, Set
+from google.oauth2.credentials import Credentials
+
+from src.application.ports.interfaces import ResponseSink, ResponseSource
+from src.domain.models import Language, QuizResponse
+from src.infrastructure.config.settings import settings
+from src.infrastructure.google.execution import api_executor
+from src.infrastructure.google.service_factory import get_service
+from src.infrastructure.storage.form_ledger import FormLedger
+
+# Columns written before the answers on every response row
+RESPONSE_COLUMNS = ["Timestamp", "Email Address", "Week", "Response ID", "Score"]
+_QUESTION_NUMBER = re.compile(r"^Q?(\d+)$")
+
+def _question_number(question_id: str) -> Optional[int]:
+    """Q7 -> 7, used to give every question a fixed column. Anything else has no column."""
+    match = _QUESTION_NUMBER.match(question_id)
+    return int(match.group(1)) if match else None
+
+class GoogleResponseSource(ResponseSource):
+    """Reads form submissions with the Forms API, one page at a time."""
+
+    def __init__(self, credentials: Credentials):
+        self._credentials = credentials
+        self.ledger = FormLedger(settings.LOCAL_STORE_PATH)
+
+    @property
+    def forms_service(self):
+        return get_service("forms", "v1", self._credentials)
+
+    def get_form_id(self, year: int, week: int, language: Language) -> Optional[str]:
+        entry = self.ledger.get(year, week, language)
+        return entry.form_id if entry else None
+
+    def _get_question_ids(self, form_id: str) -> Dict[str, str]:
+        """Maps the Forms API questionId of each item to our question ID, read from the 'Q1. ...' title."""
+        form = api_executor.execute(self.forms_service.forms().get(
+            formId=form_id,
+            fields="items(title,questionItem(question(questionId)))"
+        ), "forms")
+
+        question_ids = {}
+        for item in form.get("items", []):
+            google_id = item.get("questionItem", {}).get("question", {}).get("questionId")
+            if google_id:
+                question_ids[google_id] = item.get("title", "").split(".", 1)[0].strip()
+        return question_ids
+
+    def _to_response(self, raw: Dict[str, Any], week: int, language: Language, question_ids: Dict[str, str]) -> QuizResponse:
+        answers = {}
+        for google_id, answer in raw.get("answers", {}).items():
+            # Items added by hand or kept from the template are not quiz questions
+            if google_id not in question_ids:
+                continue
+            values = answer.get("textAnswers", {}).get("answers", [])
+            answers[question_ids[google_id]] = ", ".join(v.get("value", "") for v in values)
+
+        return QuizResponse(
+            response_id=raw["responseId"],
+            week=week,
+            language=language,
+            submitted_at=raw.get("lastSubmittedTime") or raw.get("createTime", ""),
+            email=raw.get("respondentEmail"),
+            answers=answers,
+            total_score=raw.get("totalScore")
+        )
+
+    def iter_responses(
+        self,
+        form_id: str,
+        week: int,
+        language: Language,
+        since: Optional[str] = None
+    ) -> Iterator[QuizResponse]:
+        question_ids = self._get_question_ids(form_id)
+        # The filter is applied server-side, so only new submissions are transferred
+        query_filter = f"timestamp > {since}" if since else None
+
+        page_token = None
+        while True:
+            page = api_executor.execute(self.forms_service.forms().responses().list(
+                formId=form_id,
+                filter=query_filter,
+                pageSize=settings.RESPONSE_PAGE_SIZE,
+                pageToken=page_token
+            ), "forms")
+            for raw in page.get("responses", []):
+                yield self._to_response(raw, week, language, question_ids)
+
+            page_token = page.get("nextPageToken")
+            if not page_token:
+                return
+
+class GoogleResponseSheetWriter(ResponseSink):
+    """Appends responses to each language's response spreadsheet (`<LANGUAGE>_RESPONSE_SPREADSHEET_ID`)."""
+
+    def __init__(self, credentials: Credentials):
+        self._credentials = credentials
+        self.spreadsheet_ids: Dict[Language, Optional[str]] = {
+            lang: getattr(settings, f"{lang.name}_RESPONSE_SPREADSHEET_ID", None) for lang in Language
+        }
+        # Widest header written per spreadsheet in this session
+        self._header_width: Dict[str, int] = {}
+
+    @property
+    def service(self):
+        return get_service("sheets", "v4", self._credentials)
+
+    def _to_row(self, response: QuizResponse, question_count: int) -> List[Any]:
+        answers = [""] * question_count
+        for question_id, text in response.answers.items():
+            number = _question_number(question_id)
+            if number:
+                answers[number - 1] = text
+        score = "" if response.total_score is None else response.total_score
+        return [response.submitted_at, response.email or "", response.week, response.response_id, score, *answers]
+
+    def _ensure_header(self, spreadsheet_id: str, question_count: int) -> None:
+        """Writes the header row once per session, widening it if a week has more questions."""
+        if self._header_width.get(spreadsheet_id, 0) >= question_count:
+            return
+        header = RESPONSE_COLUMNS + [f"Q{n}" for n in range(1, question_count + 1)]
+        api_executor.execute(self.service.spreadsheets().values().update(
+            spreadsheetId=spreadsheet_id,
+            range=f"'{settings.RESPONSE_SHEET_NAME}'!A1",
+            valueInputOption="RAW",
+            body={"values": [header]}
+        ), "sheets")
+        self._header_width[spreadsheet_id] = question_count
+
+    def append(self, language: Language, responses: List[QuizResponse]) -> None:
+        if not responses:
+            return
+        spreadsheet_id = self.spreadsheet_ids[language]
+        if not spreadsheet_id:
+            raise ValueError(f"Set {language.name}_RESPONSE_SPREADSHEET_ID in .env to ingest {language.display_name} responses.")
+
+        numbers: Set[int] = {
+            n for r in responses for n in map(_question_number, r.answers) if n
+        }
+        question_count = max(numbers, default=0)
+        self._ensure_header(spreadsheet_id, question_count)
+
+        api_executor.execute(self.service.spreadsheets().values().append(
+            spreadsheetId=spreadsheet_id,
+            range=f"'{settings.RESPONSE_SHEET_NAME}'!A1",
+            valueInputOption="RAW",
+            insertDataOption="INSERT_ROWS",
+            body={"values": [self._to_row(r, question_count) for r in responses]}
+        ), "sheets", idempotent=False)
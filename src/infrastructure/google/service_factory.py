@@ -0,0 +1,83 @@
+import json
+import threading
+from functools import lru_cache
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import google_auth_httplib2
+import httplib2
+from google.oauth2.credentials import Credentials
+from googleapiclient import discovery_cache
+from googleapiclient.discovery import Resource, build_from_document
+
+from src.infrastructure.config.settings import settings
+
+# httplib2 is not thread-safe, so transports and clients are kept per thread
+_local = threading.local()
+
+# When set, clients come from here instead of the real Google APIs (e.g. a local fake for benchmarks)
+_service_provider: Optional[Callable[[str, str, Credentials], Any]] = None
+
+def set_service_provider(provider: Optional[Callable[[str, str, Credentials], Any]]) -> None:
+    """Routes get_service to provider(api, version, credentials); pass None to restore the real APIs."""
+    global _service_provider
+    _service_provider = provider
+
+@lru_cache(maxsize=None)
+def _get_discovery_document(api: str, version: str) -> Dict[str, Any]:
+    """Loads and parses the discovery document bundled with google-api-python-client, once per process."""
+    document = discovery_cache.get_static_doc(api, version)
+    if document is None:
+        raise ValueError(f"No bundled discovery document found for {api} {version}.")
+    return json.loads(document)
+
+def preload_discovery_documents() -> None:
+    """Parses the discovery documents of every API the app uses, so the first client build is quick."""
+    for api, version in (("sheets", "v4"), ("forms", "v1"), ("drive", "v3")):
+        _get_discovery_document(api, version)
+
+class _ManagedAuthorizedHttp(google_auth_httplib2.AuthorizedHttp):
+    """An authorized transport that leaves token refreshes to the credential manager."""
+
+    def __init__(self, credentials: Credentials, http: httplib2.Http):
+        # No refresh-and-retry on 401: it would refresh the shared credentials outside the manager's lock
+        super().__init__(credentials, http=http, refresh_status_codes=())
+
+    def request(self, *args: Any, **kwargs: Any) -> Any:
+        # Imported here; the OAuth flow module is slow to load and only needed once a request is made
+        from src.infrastructure.google.auth import refresh_if_due
+
+        refresh_if_due(self.credentials)
+        return super().request(*args, **kwargs)
+
+def _get_transport(credentials: Credentials) -> google_auth_httplib2.AuthorizedHttp:
+    """Returns this thread's keep-alive authorized transport for the given credentials."""
+    transports: Dict[int, google_auth_httplib2.AuthorizedHttp] = _local.__dict__.setdefault("transports", {})
+    key = id(credentials)
+    if key not in transports:
+        # One connection pool shared by Sheets, Forms and Drive avoids repeated TLS handshakes
+        http = httplib2.Http(timeout=settings.HTTP_TIMEOUT_SECONDS)
+        transports[key] = _ManagedAuthorizedHttp(credentials, http)
+    return transports[key]
+
+def get_service(api: str, version: str, credentials: Credentials) -> Resource:
+    """Returns a Google API client for the current thread, building it only on first use.
+
+    Args:
+        api (str): The API name, e.g. "sheets".
+        version (str): The API version, e.g. "v4".
+        credentials (Credentials): The Google OAuth2 credentials.
+
+    Returns:
+        Resource: The API client.
+    """
+    if _service_provider is not None:
+        return _service_provider(api, version, credentials)
+
+    services: Dict[Tuple[str, str, int], Resource] = _local.__dict__.setdefault("services", {})
+    key = (api, version, id(credentials))
+    if key not in services:
+        services[key] = build_from_document(
+            _get_discovery_document(api, version),
+            http=_get_transport(credentials)
+        )
+    return services[key]
@@ -0,0 +1,113 @@
+from typing import Dict, Iterable, List, Set, Tuple
+from pydantic import BaseModel, ConfigDict
+
+from src.domain.models import Language
+from src.domain.question_table import QuestionTable
+
+def column_index(letters: str) -> int:
+    """"A" -> 0, "J" -> 9, "AA" -> 26."""
+    index = 0
+    for char in letters.upper():
+        index = index * 26 + (ord(char) - ord("A") + 1)
+    return index - 1
+
+def column_letter(index: int) -> str:
+    """0 -> "A", 9 -> "J", 26 -> "AA"."""
+    letters = ""
+    index += 1
+    while index:
+        index, remainder = divmod(index - 1, 26)
+        letters = chr(ord("A") + remainder) + letters
+    return letters
+
+class LanguageColumns(BaseModel):
+    """The columns holding one language's question and answer."""
+    model_config = ConfigDict(frozen=True)
+
+    question: str
+    answer: str
+
+class SheetSchema(BaseModel):
+    """Which column (by letter) holds each field of the source sheet. See docs/design/SHEET_SCHEMA.md."""
+    model_config = ConfigDict(frozen=True)
+
+    q_id: str = "A"
+    week: str = "B"
+    dates: str = "C"
+    portion: str = "D"
+    scripture: str = "G"
+    languages: Dict[Language, LanguageColumns]
+
+# Adding a language is a new entry here (and a Language member); no other code needs to change
+SHEET_SCHEMA = SheetSchema(languages={
+    Language.TAMIL: LanguageColumns(question="F", answer="H"),
+    Language.ENGLISH: LanguageColumns(question="I", answer="J"),
+    Language.MALAYALAM: LanguageColumns(question="K", answer="L"),
+    Language.TELUGU: LanguageColumns(question="M", answer="N"),
+})
+
+class CompiledSchema:
+    """A SheetSchema resolved to 0-based column positions, for reading rows without per-row lookups."""
+
+    def __init__(self, schema: SheetSchema):
+        self.q_id = column_index(schema.q_id)
+        self.week = column_index(schema.week)
+        self.dates = column_index(schema.dates)
+        self.portion = column_index(schema.portion)
+        self.scripture = column_index(schema.scripture)
+        self.language_columns: Dict[Language, Tuple[int, int]] = {
+            lang: (column_index(cols.question), column_index(cols.answer)) for lang, cols in schema.languages.items()
+        }
+        self.metadata_columns = (self.q_id, self.week, self.dates, self.portion)
+        self.row_width = 1 + max(
+            *self.metadata_columns, self.scripture, *(c for pair in self.language_columns.values() for c in pair)
+        )
+
+    @property
+    def languages(self) -> List[Language]:
+        return list(self.language_columns)
+
+    def columns_for(self, languages: Iterable[Language]) -> Set[int]:
+        """The columns needed for the metadata and the given languages' questions."""
+        columns = set(self.metadata_columns)
+        for lang in languages:
+            columns.add(self.scripture)
+            columns.update(self.language_columns[lang])
+        return columns
+
+    def read(self, rows: Iterable[List], points: int) -> Tuple[Dict[int, Tuple[str, str]], QuestionTable]:
+        """Indexes rows in a single pass: (dates, portion) per week and a QuestionTable for every language.
+
+        Rows may be shorter than the schema; Sheets trims trailing empty cells and a blank cell only
+        drops that language's question.
+        """
+        metadata: Dict[int, Tuple[str, str]] = {}
+        ids: List[str] = []
+        weeks: List[int] = []
+        scriptures: List[str] = []
+        texts: Dict[Language, List[str]] = {lang: [] for lang in self.language_columns}
+        answers: Dict[Language, List[str]] = {lang: [] for lang in self.language_columns}
+        # One (append text, append answer, question column, answer column) per language
+        accessors = [
+            (texts[lang].append, answers[lang].append, question, answer)
+            for lang, (question, answer) in self.language_columns.items()
+        ]
+        padding = [""] * self.row_width
+
+        for row in rows:
+            if len(row) <= self.week or not str(row[self.week]).strip().isdigit():
+                continue
+            week = int(row[self.week])
+            # The first row of a week carries the metadata
+            if week not in metadata and len(row) > max(self.dates, self.portion):
+                metadata[week] = (row[self.dates], row[self.portion])
+            row = row + padding[len(row):]
+            ids.append(str(row[self.q_id]))
+            weeks.append(week)
+            scriptures.append(str(row[self.scripture]))
+            for append_text, append_answer, question, answer in accessors:
+                append_text(str(row[question]))
+                append_answer(str(row[answer]))
+
+        table = QuestionTable(ids=ids, weeks=weeks, scriptures=scriptures, texts=texts, answers=answers, points=points)
+        return metadata, table
@@ -1,28 +1,106 @@
-from typing import List, Optional
-from googleapiclient.discovery import build
+import logging
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+import httplib2
+from google.auth.exceptions import TransportError
+from googleapiclient.errors import HttpError
 from google.oauth2.credentials import Credentials
 
 from src.application.ports.interfaces import SheetRepository
 from src.domain.models import Language, Question, QuizMetadata
+from src.domain.question_table import QuestionTable
 from src.infrastructure.config.settings import settings
+from src.infrastructure.google.execution import api_executor
+from src.infrastructure.google.service_factory import get_service
+from src.infrastructure.google.sheet_schema import SHEET_SCHEMA, CompiledSchema, column_letter
+from src.infrastructure.profiling import profiler
+from src.infrastructure.storage.sheet_snapshot import SheetSnapshotStore
+
+logger = logging.getLogger(__name__)
+
+# Errors that may mean Google could not be reached; see _is_unreachable
+_NETWORK_ERRORS = (HttpError, httplib2.HttpLib2Error, TransportError, OSError)
+
+def _is_unreachable(error: Exception) -> bool:
+    """Whether an error means Google was unreachable or failing, as opposed to refusing the request.
+
+    Only then may the local snapshot stand in; a 403 or 404 means the sheet itself is wrong or off limits.
+    """
+    if isinstance(error, HttpError):
+        return error.resp.status == 429 or error.resp.status >= 500
+    return True
+
+def _column_spans(columns: Iterable[int]) -> List[Tuple[int, int]]:
+    """Groups column positions into contiguous (first, last) spans, so each span is one range."""
+    spans: List[Tuple[int, int]] = []
+    for column in sorted(set(columns)):
+        if spans and spans[-1][1] == column - 1:
+            spans[-1] = (spans[-1][0], column)
+        else:
+            spans.append((column, column))
+    return spans
+
+def _row_runs(rows: List[int]) -> List[Tuple[int, int]]:
+    """Groups sheet row positions into contiguous [start, end) runs."""
+    runs: List[Tuple[int, int]] = []
+    for row in sorted(rows):
+        if runs and runs[-1][1] == row:
+            runs[-1] = (runs[-1][0], row + 1)
+        else:
+            runs.append((row, row + 1))
+    return runs
 
 class GoogleSheetRepository(SheetRepository):
     """Implementation of SheetRepository using Google Sheets API."""
 
     def __init__(self, credentials: Credentials):
-        self.service = build("sheets", "v4", credentials=credentials)
+        self._credentials = credentials
         self.spreadsheet_id = settings.SOURCE_SPREADSHEET_ID
+        self.snapshot_store = SheetSnapshotStore(settings.LOCAL_STORE_PATH)
+        self.schema = CompiledSchema(SHEET_SCHEMA)
+        # Identifies the tab locally without needing a network call to resolve its title
+        self._snapshot_key = f"{settings.SOURCE_SHEET_ID}|{settings.SOURCE_SHEET_NAME}"
         self._cached_sheet_name: Optional[str] = None
+        self._table: Optional[QuestionTable] = None
+        self._week_metadata: Dict[int, Tuple[str, str]] = {} # week -> (dates, portion)
+        self._table_loaded_at: float = 0.0
+        # Rows read so far, by week, and which language columns they include. A full read covers everything.
+        self._rows_by_week: Dict[int, List[List]] = {}
+        self._week_languages: Dict[int, Set[Language]] = {}
+        self._full_table = False
+        # Sheet row positions of each week, for the version they were read at
+        self._week_index: Dict[int, List[int]] = {}
+        self._week_index_version: Optional[str] = None
+        self._lock = threading.RLock()
+
+    @property
+    def service(self):
+        return get_service("sheets", "v4", self._credentials)
+
+    @property
+    def drive_service(self):
+        return get_service("drive", "v3", self._credentials)
+
+    def invalidate_cache(self) -> None:
+        """Drops the cached rows so the next read fetches the sheet again."""
+        with self._lock:
+            self._table = None
+            self._week_metadata = {}
+            self._table_loaded_at = 0.0
+            self._rows_by_week = {}
+            self._week_languages = {}
+            self._full_table = False
 
     def _get_sheet_name_by_id(self, sheet_id: int) -> str:
         """Finds the current title of a sheet by its GID (sheetId)."""
         if self._cached_sheet_name:
             return self._cached_sheet_name
 
-        spreadsheet = self.service.spreadsheets().get(
+        spreadsheet = api_executor.execute(self.service.spreadsheets().get(
             spreadsheetId=self.spreadsheet_id,
             fields="sheets(properties(title,sheetId))"
-        ).execute()
+        ), "sheets")
 
         for sheet in spreadsheet.get('sheets', []):
             if sheet['properties']['sheetId'] == sheet_id:
@@ -32,63 +110,242 @@ class GoogleSheetRepository(SheetRepository):
         # Fallback to config if ID not found
         return settings.SOURCE_SHEET_NAME
 
+    def _get_remote_version(self) -> str:
+        """Returns a token that changes whenever the spreadsheet is edited."""
+        file = api_executor.execute(self.drive_service.files().get(
+            fileId=self.spreadsheet_id,
+            fields="version,modifiedTime"
+        ), "drive")
+        return f"{file.get('version')}|{file.get('modifiedTime')}"
+
+    @profiler.profiled("sheets._get_all_rows")
     def _get_all_rows(self) -> List[List]:
+        """Returns all rows, reusing the local snapshot while the spreadsheet is unchanged."""
+        snapshot = self.snapshot_store.load(self.spreadsheet_id, self._snapshot_key)
+
+        try:
+            version = self._get_remote_version()
+            if snapshot and snapshot.version == version:
+                return snapshot.rows
+
+            rows = self._fetch_all_rows()
+        except _NETWORK_ERRORS as e:
+            if not snapshot or not _is_unreachable(e):
+                raise
+            # Offline: fall back to the last good copy
+            logger.warning(
+                "Could not reach Google Sheets (%s). Using the local snapshot from %s.",
+                e, f"{snapshot.synced_at:%Y-%m-%d %H:%M}"
+            )
+            return snapshot.rows
+
+        self.snapshot_store.save(self.spreadsheet_id, self._snapshot_key, version, rows)
+        return rows
+
+    def _fetch_all_rows(self) -> List[List]:
         """Fetches all rows from the spreadsheet using the most reliable sheet title."""
         # Use GID if provided, otherwise fallback to the configured name
         sheet_name = self._get_sheet_name_by_id(settings.SOURCE_SHEET_ID) if settings.SOURCE_SHEET_ID is not None else settings.SOURCE_SHEET_NAME
         
         # Wrap sheet name in single quotes to handle spaces and special characters
-        range_name = f"'{sheet_name}'!A:J"
-        result = self.service.spreadsheets().values().get(
+        range_name = f"'{sheet_name}'!A:{column_letter(self.schema.row_width - 1)}"
+        result = api_executor.execute(self.service.spreadsheets().values().get(
             spreadsheetId=self.spreadsheet_id,
             range=range_name
-        ).execute()
+        ), "sheets")
         return result.get("values", [])
 
-    def get_quiz_metadata(self, week: int) -> Optional[QuizMetadata]:
-        rows = self._get_all_rows()
-        if not rows or len(rows) < 2:
-            return None
-        
-        # Skip header, find the first row matching the week
-        for row in rows[1:]:
-            if len(row) > 1 and str(row[1]) == str(week):
-                return QuizMetadata(
-                    week=int(row[1]),
-                    dates=row[2],
-                    portion=row[3],
-                    year=settings.QUIZ_YEAR
+    def _data_filter(self, first_row: int, end_row: Optional[int], first_col: int, last_col: int) -> Dict[str, Any]:
+        """A filter for a block of cells (0-based rows, end exclusive; inclusive columns).
+
+        Addressed by GID when one is configured, which also saves the request that resolves the tab title.
+        """
+        if settings.SOURCE_SHEET_ID is not None:
+            grid_range = {
+                "sheetId": settings.SOURCE_SHEET_ID,
+                "startRowIndex": first_row,
+                "startColumnIndex": first_col,
+                "endColumnIndex": last_col + 1,
+            }
+            if end_row is not None:
+                grid_range["endRowIndex"] = end_row
+            return {"gridRange": grid_range}
+
+        last = f"{column_letter(last_col)}{end_row if end_row is not None else ''}"
+        return {"a1Range": f"'{settings.SOURCE_SHEET_NAME}'!{column_letter(first_col)}{first_row + 1}:{last}"}
+
+    def _batch_get(self, data_filters: List[Dict[str, Any]]) -> List[List[List]]:
+        """Reads several blocks in one request; returns their rows in the order of the filters."""
+        result = api_executor.execute(self.service.spreadsheets().values().batchGetByDataFilter(
+            spreadsheetId=self.spreadsheet_id,
+            body={"dataFilters": data_filters, "majorDimension": "ROWS"}
+        ), "sheets")
+        return [matched.get("valueRange", {}).get("values", []) for matched in result.get("valueRanges", [])]
+
+    def _get_week_index(self, version: str) -> Dict[int, List[int]]:
+        """Maps each week to its sheet row positions, reading only the Week column."""
+        if self._week_index_version == version:
+            return self._week_index
+
+        # Skip the header row
+        (column,) = self._batch_get([self._data_filter(1, None, self.schema.week, self.schema.week)])
+        index: Dict[int, List[int]] = {}
+        for offset, cells in enumerate(column):
+            if cells and str(cells[0]).strip().isdigit():
+                index.setdefault(int(cells[0]), []).append(offset + 1)
+
+        self._week_index = index
+        self._week_index_version = version
+        return index
+
+    @profiler.profiled("sheets._fetch_weeks")
+    def _fetch_weeks(self, weeks: List[int], languages: Set[Language], version: str) -> Dict[int, List[List]]:
+        """Reads only the given weeks' rows, and of those only the metadata and the languages' columns.
+
+        Returns full-width rows per week; columns that were not read are left empty.
+        """
+        index = self._get_week_index(version)
+        columns = self.schema.columns_for(languages)
+
+        blocks = [
+            (start, end, first_col)
+            for week in weeks
+            for start, end in _row_runs(index.get(week, []))
+            for first_col, last_col in _column_spans(columns)
+        ]
+        rows_at: Dict[int, List] = {}
+        if blocks:
+            spans = dict(_column_spans(columns))
+            values = self._batch_get([
+                self._data_filter(start, end, first_col, spans[first_col]) for start, end, first_col in blocks
+            ])
+            for (start, end, first_col), block in zip(blocks, values):
+                for offset, cells in enumerate(block):
+                    row = rows_at.setdefault(start + offset, [""] * self.schema.row_width)
+                    row[first_col:first_col + len(cells)] = cells
+
+        return {week: [rows_at[position] for position in index.get(week, []) if position in rows_at] for week in weeks}
+
+    def _merge_rows(self, rows_by_week: Dict[int, Tuple[List[List], Set[Language]]]) -> None:
+        """Adds narrowed reads (rows and the languages they include, by week) to the in-memory rows and re-indexes them."""
+        for week, (rows, languages) in rows_by_week.items():
+            self._rows_by_week[week] = rows
+            self._week_languages[week] = languages
+        self._build_table([row for week in sorted(self._rows_by_week) for row in self._rows_by_week[week]])
+
+    def _is_covered(self, weeks: List[int], languages: Set[Language]) -> bool:
+        if self._table is None or time.monotonic() - self._table_loaded_at >= settings.SHEET_CACHE_TTL_SECONDS:
+            return False
+        if self._full_table:
+            return True
+        return all(week in self._week_languages and languages <= self._week_languages[week] for week in weeks)
+
+    def _load_full(self, rows: List[List]) -> None:
+        self._rows_by_week = {}
+        self._week_languages = {}
+        self._build_table(rows[1:])
+        self._full_table = True
+
+    def prefetch(self, weeks: List[int], languages: List[Language]) -> None:
+        """Loads the given weeks and languages, reading only their rows and columns from the server.
+
+        A local whole-sheet snapshot of the current version is used as is; otherwise weeks already
+        read at this version come from the local store and only the rest is fetched.
+        """
+        wanted = set(languages)
+        with self._lock:
+            if self._is_covered(weeks, wanted):
+                return
+            if self._table is not None and not self._is_covered([], set()):
+                self.invalidate_cache()
+
+            try:
+                version = self._get_remote_version()
+            except _NETWORK_ERRORS as e:
+                if not _is_unreachable(e):
+                    raise
+                self._load_offline(weeks, wanted, e)
+                return
+
+            if self.snapshot_store.load_version(self.spreadsheet_id, self._snapshot_key) == version:
+                snapshot = self.snapshot_store.load(self.spreadsheet_id, self._snapshot_key)
+                if snapshot:
+                    self._load_full(snapshot.rows)
+                    return
+
+            # Ask for the union with languages already held, so a week's rows stay complete
+            missing = [week for week in weeks if not self._is_covered([week], wanted)]
+            stored = self.snapshot_store.load_weeks(self.spreadsheet_id, self._snapshot_key, missing)
+            for week in missing:
+                wanted |= self._week_languages.get(week, set())
+            fresh = {
+                week: (snapshot.rows, {Language(value) for value in snapshot.languages})
+                for week, snapshot in stored.items()
+                if snapshot.version == version and {lang.value for lang in wanted} <= set(snapshot.languages)
+            }
+            to_fetch = [week for week in missing if week not in fresh]
+            if to_fetch:
+                fetched = self._fetch_weeks(to_fetch, wanted, version)
+                self.snapshot_store.save_weeks(
+                    self.spreadsheet_id, self._snapshot_key, version, [lang.value for lang in wanted], fetched
                 )
-        return None
+                fresh.update({week: (rows, set(wanted)) for week, rows in fetched.items()})
+            self._merge_rows(fresh)
+
+    def _load_offline(self, weeks: List[int], languages: Set[Language], error: Exception) -> None:
+        """Falls back to the last good local copy of the whole sheet, or else of the requested weeks."""
+        snapshot = self.snapshot_store.load(self.spreadsheet_id, self._snapshot_key)
+        if snapshot:
+            logger.warning(
+                "Could not reach Google Sheets (%s). Using the local snapshot from %s.",
+                error, f"{snapshot.synced_at:%Y-%m-%d %H:%M}"
+            )
+            self._load_full(snapshot.rows)
+            return
+
+        stored = self.snapshot_store.load_weeks(self.spreadsheet_id, self._snapshot_key, weeks)
+        usable = {
+            week: s for week, s in stored.items() if {lang.value for lang in languages} <= set(s.languages)
+        }
+        if not usable:
+            raise error
+        oldest = min(s.synced_at for s in usable.values())
+        logger.warning(
+            "Could not reach Google Sheets (%s). Using locally stored weeks from %s.", error, f"{oldest:%Y-%m-%d %H:%M}"
+        )
+        self._merge_rows({week: (s.rows, {Language(value) for value in s.languages}) for week, s in usable.items()})
+
+    def _build_table(self, rows: List[List]) -> None:
+        """Indexes the sheet rows column-wise: metadata per week and a QuestionTable of all questions and languages."""
+        self._week_metadata, self._table = self.schema.read(rows, settings.DEFAULT_POINTS)
+        self._table_loaded_at = time.monotonic()
+
+    def get_question_table(self) -> QuestionTable:
+        """Returns every question in the sheet, fetching and indexing the whole sheet at most once per TTL.
+
+        For whole-history readers; single weeks are cheaper through prefetch/get_questions.
+        """
+        with self._lock:
+            if not self._full_table or not self._is_covered([], set()):
+                self._load_full(self._get_all_rows())
+            return self._loaded_table()
+
+    def _loaded_table(self) -> QuestionTable:
+        if self._table is None:
+            raise RuntimeError("The source sheet has not been loaded.")
+        return self._table
+
+    # Reads stay under the lock that prefetch took, so another thread's refresh cannot
+    # swap the table out between loading a week and reading it
+    def get_quiz_metadata(self, week: int) -> Optional[QuizMetadata]:
+        with self._lock:
+            self.prefetch([week], [])
+            if week not in self._week_metadata:
+                return None
+            dates, portion = self._week_metadata[week]
+        return QuizMetadata(week=week, dates=dates, portion=portion, year=settings.QUIZ_YEAR)
 
     def get_questions(self, week: int, language: Language) -> List[Question]:
-        rows = self._get_all_rows()
-        if not rows or len(rows) < 2:
-            return []
-        
-        questions = []
-        for row in rows[1:]:
-            # Ensure the row has enough columns and matches the week
-            if len(row) >= 10 and str(row[1]) == str(week):
-                q_id = str(row[0])
-                scripture = str(row[6])
-                
-                if language == Language.TAMIL:
-                    text = str(row[5])
-                    answer = str(row[7])
-                else:
-                    text = str(row[8])
-                    answer = str(row[9])
-                
-                # Basic validation: ensure text/answer is not empty
-                if text.strip() and answer.strip():
-                    questions.append(Question(
-                        id=q_id,
-                        week=week,
-                        text=text,
-                        answer=answer,
-                        scripture=scripture,
-                        points=settings.DEFAULT_POINTS
-                    ))
-        
-        return questions
+        with self._lock:
+            self.prefetch([week], [language])
+            return self._loaded_table().questions(week, language)
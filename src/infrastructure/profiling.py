@@ -0,0 +1,182 @@
+import functools
+import json
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Iterator, List, Optional, TypeVar
+
+from pydantic import BaseModel
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+class CallRecord(BaseModel):
+    """One timed call on the hot path."""
+    name: str
+    started_at: float # Seconds since the profiler was reset
+    duration_ms: float
+    payload_bytes: int = 0
+    thread_id: int
+
+class ProfileSummaryRow(BaseModel):
+    """Aggregated timings for all calls with the same name."""
+    name: str
+    count: int
+    total_ms: float
+    mean_ms: float
+    max_ms: float
+    payload_bytes: int
+
+class ProfileRecorder:
+    """Thread-safe store of CallRecords, timed from when it was created or last reset."""
+
+    def __init__(self) -> None:
+        self._records: List[CallRecord] = []
+        self._origin = time.perf_counter()
+        self._lock = threading.Lock()
+
+    def reset(self) -> None:
+        """Forgets all recorded calls."""
+        with self._lock:
+            self._records = []
+            self._origin = time.perf_counter()
+
+    def add(self, name: str, started: float, finished: float, payload_bytes: int) -> None:
+        """Records a call that ran between two `time.perf_counter()` readings."""
+        with self._lock:
+            self._records.append(CallRecord(
+                name=name,
+                started_at=started - self._origin,
+                duration_ms=(finished - started) * 1000,
+                payload_bytes=payload_bytes,
+                thread_id=threading.get_ident()
+            ))
+
+    @property
+    def records(self) -> List[CallRecord]:
+        with self._lock:
+            return list(self._records)
+
+    def summary(self) -> List[ProfileSummaryRow]:
+        """Aggregates the recorded calls by name, slowest total first."""
+        grouped: Dict[str, List[CallRecord]] = {}
+        for record in self.records:
+            grouped.setdefault(record.name, []).append(record)
+
+        rows = [
+            ProfileSummaryRow(
+                name=name,
+                count=len(records),
+                total_ms=sum(r.duration_ms for r in records),
+                mean_ms=sum(r.duration_ms for r in records) / len(records),
+                max_ms=max(r.duration_ms for r in records),
+                payload_bytes=sum(r.payload_bytes for r in records)
+            )
+            for name, records in grouped.items()
+        ]
+        return sorted(rows, key=lambda row: row.total_ms, reverse=True)
+
+    def write_trace(self, path: str) -> None:
+        """Writes the recorded calls in Chrome trace format (open in chrome://tracing or Perfetto)."""
+        events = [
+            {
+                "name": record.name,
+                "ph": "X",
+                "ts": record.started_at * 1_000_000,
+                "dur": record.duration_ms * 1000,
+                "pid": 1,
+                "tid": record.thread_id,
+                "args": {"payload_bytes": record.payload_bytes}
+            }
+            for record in self.records
+        ]
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"traceEvents": events}, f, indent=2)
+
+# The recorder of the request being served, when one was opened with Profiler.scope
+_SCOPED_RECORDER: ContextVar[Optional[ProfileRecorder]] = ContextVar("profile_recorder", default=None)
+
+class Profiler:
+    """Collects timings, counts and payload sizes for instrumented calls.
+
+    Calls are recorded process-wide once `enable` is called (a CLI run), and always inside a
+    `scope`, which keeps one request's calls apart from those of other requests running alongside.
+    """
+
+    def __init__(self) -> None:
+        self.enabled = False
+        self._recorder = ProfileRecorder()
+
+    def enable(self) -> None:
+        self.enabled = True
+
+    def reset(self) -> None:
+        """Forgets all calls recorded outside a scope."""
+        self._recorder.reset()
+
+    @property
+    def recording(self) -> bool:
+        """Whether calls made in the current context are being recorded."""
+        return self.enabled or _SCOPED_RECORDER.get() is not None
+
+    @contextmanager
+    def scope(self, recorder: Optional[ProfileRecorder] = None) -> Iterator[ProfileRecorder]:
+        """Records the calls made inside the block into their own recorder.
+
+        Pass the same recorder to several blocks to collect one request's calls across them.
+        Worker threads only share the scope if their tasks run in a copy of this context
+        (`contextvars.copy_context().run`).
+        """
+        scoped = recorder or ProfileRecorder()
+        token = _SCOPED_RECORDER.set(scoped)
+        try:
+            yield scoped
+        finally:
+            _SCOPED_RECORDER.reset(token)
+
+    @contextmanager
+    def span(self, name: str) -> Iterator[Dict[str, int]]:
+        """Times the enclosed block. Set `payload_bytes` on the yielded dict to record a size."""
+        details = {"payload_bytes": 0}
+        recorder = _SCOPED_RECORDER.get() or (self._recorder if self.enabled else None)
+        if recorder is None:
+            yield details
+            return
+
+        started = time.perf_counter()
+        try:
+            yield details
+        finally:
+            recorder.add(name, started, time.perf_counter(), details["payload_bytes"])
+
+    def profiled(self, name: str) -> Callable[[F], F]:
+        """Decorator form of `span`."""
+        def decorator(func: F) -> F:
+            @functools.wraps(func)
+            def wrapper(*args: Any, **kwargs: Any) -> Any:
+                with self.span(name):
+                    return func(*args, **kwargs)
+            return wrapper # type: ignore[return-value]
+        return decorator
+
+    @property
+    def records(self) -> List[CallRecord]:
+        return self._recorder.records
+
+    def summary(self) -> List[ProfileSummaryRow]:
+        """Aggregates the calls recorded outside a scope by name, slowest total first."""
+        return self._recorder.summary()
+
+    def write_trace(self, path: str) -> None:
+        """Writes the calls recorded outside a scope in Chrome trace format."""
+        self._recorder.write_trace(path)
+
+def payload_size(value: Optional[Any]) -> int:
+    """Approximate size in bytes of a request or response body."""
+    if value is None:
+        return 0
+    if isinstance(value, (str, bytes)):
+        return len(value)
+    return len(json.dumps(value, ensure_ascii=False))
+
+profiler = Profiler()
@@ -0,0 +1,195 @@
+import json
+import os
+import sqlite3
+from contextlib import closing, contextmanager
+from datetime import datetime
+from typing import Iterator, List, Optional
+
+from pydantic import BaseModel
+
+from src.domain.models import Language
+
+class LedgerEntry(BaseModel):
+    """The form last published for a (year, week, language) and the content it was built from."""
+    year: int
+    week: int
+    language: Language
+    form_id: str
+    content_hash: str
+    updated_at: datetime
+    title: str
+    item_ids: List[str] # The question items this tool created, in quiz order
+
+class FormBuild(BaseModel):
+    """A form whose questions are still being added, and how many of its batch requests have been applied."""
+    year: int
+    week: int
+    language: Language
+    form_id: str
+    title: str
+    content_hash: str
+    committed_requests: int
+    updated_at: datetime
+    item_ids: List[str] = [] # Question items created so far, in quiz order
+    template_id: Optional[str] = None # The form this one was copied from, if any
+
+class FormLedger:
+    """Remembers which form belongs to each week and language in the local SQLite store.
+
+    Forms that are only partly built are tracked separately, so an interrupted run can carry on
+    with the same form instead of copying the template again.
+    """
+
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        directory = os.path.dirname(db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        with self._connect() as conn:
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS form_ledger (
+                    year INTEGER NOT NULL,
+                    week INTEGER NOT NULL,
+                    language TEXT NOT NULL,
+                    form_id TEXT NOT NULL,
+                    content_hash TEXT NOT NULL,
+                    updated_at TEXT NOT NULL,
+                    title TEXT NOT NULL,
+                    item_ids TEXT NOT NULL,
+                    PRIMARY KEY (year, week, language)
+                )
+                """
+            )
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS form_builds (
+                    year INTEGER NOT NULL,
+                    week INTEGER NOT NULL,
+                    language TEXT NOT NULL,
+                    form_id TEXT NOT NULL,
+                    title TEXT NOT NULL,
+                    content_hash TEXT NOT NULL,
+                    committed_requests INTEGER NOT NULL,
+                    updated_at TEXT NOT NULL,
+                    item_ids TEXT NOT NULL,
+                    template_id TEXT,
+                    PRIMARY KEY (year, week, language)
+                )
+                """
+            )
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Opens a connection that commits if the block succeeds and is closed either way."""
+        with closing(sqlite3.connect(self.db_path)) as conn, conn:
+            yield conn
+
+    def get(self, year: int, week: int, language: Language) -> Optional[LedgerEntry]:
+        """Returns the recorded form for a week and language, if any."""
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT form_id, content_hash, updated_at, title, item_ids FROM form_ledger "
+                "WHERE year = ? AND week = ? AND language = ?",
+                (year, week, language.value)
+            ).fetchone()
+
+        if not row:
+            return None
+
+        form_id, content_hash, updated_at, title, item_ids = row
+        return LedgerEntry(
+            year=year,
+            week=week,
+            language=language,
+            form_id=form_id,
+            content_hash=content_hash,
+            updated_at=datetime.fromisoformat(updated_at),
+            title=title,
+            item_ids=json.loads(item_ids)
+        )
+
+    def save(
+        self,
+        year: int,
+        week: int,
+        language: Language,
+        form_id: str,
+        content_hash: str,
+        title: str,
+        item_ids: List[str]
+    ) -> None:
+        """Records (or replaces) the form for a week and language."""
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO form_ledger "
+                "(year, week, language, form_id, content_hash, updated_at, title, item_ids) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (year, week, language.value, form_id, content_hash, datetime.now().isoformat(),
+                 title, json.dumps(item_ids))
+            )
+
+    def remove(self, year: int, week: int, language: Language) -> None:
+        """Forgets the form for a week and language."""
+        with self._connect() as conn:
+            conn.execute(
+                "DELETE FROM form_ledger WHERE year = ? AND week = ? AND language = ?",
+                (year, week, language.value)
+            )
+
+    def get_build(self, year: int, week: int, language: Language) -> Optional[FormBuild]:
+        """Returns the unfinished form for a week and language, if a previous run stopped part way."""
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT form_id, title, content_hash, committed_requests, updated_at, item_ids, template_id FROM form_builds "
+                "WHERE year = ? AND week = ? AND language = ?",
+                (year, week, language.value)
+            ).fetchone()
+
+        if not row:
+            return None
+
+        form_id, title, content_hash, committed_requests, updated_at, item_ids, template_id = row
+        return FormBuild(
+            year=year,
+            week=week,
+            language=language,
+            form_id=form_id,
+            title=title,
+            content_hash=content_hash,
+            committed_requests=committed_requests,
+            updated_at=datetime.fromisoformat(updated_at),
+            item_ids=json.loads(item_ids),
+            template_id=template_id
+        )
+
+    def save_build(
+        self,
+        year: int,
+        week: int,
+        language: Language,
+        form_id: str,
+        title: str,
+        content_hash: str,
+        committed_requests: int,
+        item_ids: Optional[List[str]] = None,
+        template_id: Optional[str] = None
+    ) -> None:
+        """Records how far the form for a week and language has been built."""
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO form_builds "
+                "(year, week, language, form_id, title, content_hash, committed_requests, updated_at, item_ids, template_id) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (year, week, language.value, form_id, title, content_hash, committed_requests,
+                 datetime.now().isoformat(), json.dumps(item_ids or []), template_id)
+            )
+
+    def remove_build(self, year: int, week: int, language: Language) -> None:
+        """Forgets the unfinished form for a week and language."""
+        with self._connect() as conn:
+            conn.execute(
+                "DELETE FROM form_builds WHERE year = ? AND week = ? AND language = ?",
+                (year, week, language.value)
+            )
@@ -0,0 +1,89 @@
+import os
+import sqlite3
+from contextlib import closing, contextmanager
+from datetime import datetime
+from typing import Iterator, Optional
+
+from pydantic import BaseModel
+
+class PooledForm(BaseModel):
+    """A blank copy of the template form waiting to be used."""
+    form_id: str
+    template_id: str
+    template_version: str # Drive version of the template when it was copied
+    home_parent: Optional[str] # Folder the form moves to when claimed, if it sits in a pool folder
+    created_at: datetime
+
+class FormPoolStore:
+    """Tracks the pre-copied template forms in the local SQLite store."""
+
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        directory = os.path.dirname(db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        with self._connect() as conn:
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS form_pool (
+                    form_id TEXT PRIMARY KEY,
+                    template_id TEXT NOT NULL,
+                    template_version TEXT NOT NULL,
+                    home_parent TEXT,
+                    created_at TEXT NOT NULL
+                )
+                """
+            )
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Opens a connection that commits if the block succeeds and is closed either way."""
+        with closing(sqlite3.connect(self.db_path)) as conn, conn:
+            yield conn
+
+    def add(self, form_id: str, template_id: str, template_version: str, home_parent: Optional[str]) -> None:
+        """Records a new blank copy."""
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO form_pool (form_id, template_id, template_version, home_parent, created_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (form_id, template_id, template_version, home_parent, datetime.now().isoformat())
+            )
+
+    def count(self, template_id: str, template_version: Optional[str] = None) -> int:
+        """Returns how many blank copies of a template are available, optionally only those of one version."""
+        with self._connect() as conn:
+            if template_version is None:
+                return conn.execute(
+                    "SELECT COUNT(*) FROM form_pool WHERE template_id = ?", (template_id,)
+                ).fetchone()[0]
+            return conn.execute(
+                "SELECT COUNT(*) FROM form_pool WHERE template_id = ? AND template_version = ?",
+                (template_id, template_version)
+            ).fetchone()[0]
+
+    def claim(self, template_id: str) -> Optional[PooledForm]:
+        """Removes and returns the oldest copy of a template, so no other worker or process can take it."""
+        with self._connect() as conn:
+            # Take the write lock up front so the select and delete are one step
+            conn.execute("BEGIN IMMEDIATE")
+            row = conn.execute(
+                "SELECT form_id, template_version, home_parent, created_at FROM form_pool WHERE template_id = ? "
+                "ORDER BY created_at LIMIT 1",
+                (template_id,)
+            ).fetchone()
+            if row:
+                conn.execute("DELETE FROM form_pool WHERE form_id = ?", (row[0],))
+
+        if not row:
+            return None
+
+        form_id, template_version, home_parent, created_at = row
+        return PooledForm(
+            form_id=form_id,
+            template_id=template_id,
+            template_version=template_version,
+            home_parent=home_parent,
+            created_at=datetime.fromisoformat(created_at)
+        )
@@ -0,0 +1,80 @@
+import os
+import sqlite3
+from contextlib import closing, contextmanager
+from datetime import datetime
+from typing import Iterator, List, Optional
+
+from src.application.ports.interfaces import IngestionLog
+from src.domain.models import QuizResponse
+
+class SqliteIngestionLog(IngestionLog):
+    """Keeps the per-form high-water mark and the ID and submission time of ingested responses in the local SQLite store."""
+
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        directory = os.path.dirname(db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        with self._connect() as conn:
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS response_watermarks (
+                    form_id TEXT PRIMARY KEY,
+                    submitted_at TEXT NOT NULL,
+                    updated_at TEXT NOT NULL
+                )
+                """
+            )
+            # Responses after the watermark may already be written if an earlier run was interrupted
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS ingested_responses (
+                    form_id TEXT NOT NULL,
+                    response_id TEXT NOT NULL,
+                    submitted_at TEXT NOT NULL,
+                    PRIMARY KEY (form_id, response_id)
+                )
+                """
+            )
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Opens a connection that commits if the block succeeds and is closed either way."""
+        with closing(sqlite3.connect(self.db_path)) as conn, conn:
+            yield conn
+
+    def get_watermark(self, form_id: str) -> Optional[str]:
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT submitted_at FROM response_watermarks WHERE form_id = ?",
+                (form_id,)
+            ).fetchone()
+        return row[0] if row else None
+
+    def set_watermark(self, form_id: str, submitted_at: str) -> None:
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO response_watermarks (form_id, submitted_at, updated_at) VALUES (?, ?, ?)",
+                (form_id, submitted_at, datetime.now().isoformat())
+            )
+
+    def filter_new(self, form_id: str, responses: List[QuizResponse]) -> List[QuizResponse]:
+        if not responses:
+            return []
+        # One lookup per chunk rather than per response
+        placeholders = ",".join("?" * len(responses))
+        with self._connect() as conn:
+            seen = set(conn.execute(
+                f"SELECT response_id, submitted_at FROM ingested_responses WHERE form_id = ? AND response_id IN ({placeholders})",
+                (form_id, *(r.response_id for r in responses))
+            ))
+        # An edited submission keeps its ID but has a new submission time, so it counts as new
+        return [r for r in responses if (r.response_id, r.submitted_at) not in seen]
+
+    def mark_ingested(self, form_id: str, responses: List[QuizResponse]) -> None:
+        with self._connect() as conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO ingested_responses (form_id, response_id, submitted_at) VALUES (?, ?, ?)",
+                [(form_id, r.response_id, r.submitted_at) for r in responses]
+            )
@@ -0,0 +1,118 @@
+import os
+import sqlite3
+from contextlib import closing, contextmanager
+from datetime import datetime
+from typing import Iterator, List, Optional
+
+from src.application.ports.interfaces import ScoreStore
+from src.domain.grading import ResponseGrade
+from src.domain.models import Language, LeaderboardEntry, timestamp_key
+
+class SqliteScoreStore(ScoreStore):
+    """Keeps per-week scores and incrementally maintained season totals in the local SQLite store."""
+
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        directory = os.path.dirname(db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        with self._connect() as conn:
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS week_scores (
+                    year INTEGER NOT NULL,
+                    email TEXT NOT NULL,
+                    week INTEGER NOT NULL,
+                    language TEXT NOT NULL,
+                    score INTEGER NOT NULL,
+                    response_id TEXT NOT NULL,
+                    submitted_at TEXT NOT NULL,
+                    updated_at TEXT NOT NULL,
+                    PRIMARY KEY (year, email, week, language)
+                )
+                """
+            )
+            # One row per participant and language, updated by the difference whenever a week score changes
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS season_totals (
+                    year INTEGER NOT NULL,
+                    email TEXT NOT NULL,
+                    language TEXT NOT NULL,
+                    total_score INTEGER NOT NULL,
+                    quizzes_taken INTEGER NOT NULL,
+                    PRIMARY KEY (year, email, language)
+                )
+                """
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS season_totals_ranking "
+                "ON season_totals (year, language, total_score DESC)"
+            )
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Opens a connection that commits if the block succeeds and is closed either way."""
+        with closing(sqlite3.connect(self.db_path)) as conn, conn:
+            yield conn
+
+    def record_grades(self, year: int, grades: List[ResponseGrade]) -> None:
+        now = datetime.now().isoformat()
+        with self._connect() as conn:
+            for grade in grades:
+                response = grade.response
+                if not response.email:
+                    continue # Only verified emails can be tracked across weeks
+                email = response.email.strip().lower()
+                key = (year, email, response.week, response.language.value)
+
+                row = conn.execute(
+                    "SELECT score, submitted_at FROM week_scores WHERE year = ? AND email = ? AND week = ? AND language = ?",
+                    key
+                ).fetchone()
+                # An older submission (or the same one again) never replaces a newer score
+                if row and timestamp_key(row[1]) >= timestamp_key(response.submitted_at):
+                    continue
+                previous = row[0] if row else None
+                score = grade.total_score
+
+                conn.execute(
+                    "INSERT OR REPLACE INTO week_scores "
+                    "(year, email, week, language, score, response_id, submitted_at, updated_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    (*key, score, response.response_id, response.submitted_at, now)
+                )
+                conn.execute(
+                    """
+                    INSERT INTO season_totals (year, email, language, total_score, quizzes_taken)
+                    VALUES (?, ?, ?, ?, 1)
+                    ON CONFLICT (year, email, language) DO UPDATE SET
+                        total_score = total_score + excluded.total_score - ?,
+                        quizzes_taken = quizzes_taken + ?
+                    """,
+                    (year, email, response.language.value, score, previous or 0, 0 if row else 1)
+                )
+
+    def get_leaderboard(self, year: int, language: Optional[Language] = None, limit: int = 20) -> List[LeaderboardEntry]:
+        with self._connect() as conn:
+            if language:
+                rows = conn.execute(
+                    "SELECT email, total_score, quizzes_taken FROM season_totals "
+                    "WHERE year = ? AND language = ? ORDER BY total_score DESC, email LIMIT ?",
+                    (year, language.value, limit)
+                ).fetchall()
+            else:
+                rows = conn.execute(
+                    "SELECT email, SUM(total_score) AS total, SUM(quizzes_taken) FROM season_totals "
+                    "WHERE year = ? GROUP BY email ORDER BY total DESC, email LIMIT ?",
+                    (year, limit)
+                ).fetchall()
+
+        # Equal totals share a rank (1, 2, 2, 4)
+        entries: List[LeaderboardEntry] = []
+        for position, (email, total_score, quizzes_taken) in enumerate(rows, start=1):
+            tied = entries and entries[-1].total_score == total_score
+            rank = entries[-1].rank if tied else position
+            entries.append(LeaderboardEntry(rank=rank, email=email, total_score=total_score, quizzes_taken=quizzes_taken))
+        return entries
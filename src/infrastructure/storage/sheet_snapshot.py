@@ -0,0 +1,149 @@
+import json
+import os
+import sqlite3
+from contextlib import closing, contextmanager
+from datetime import datetime
+from typing import Dict, Iterator, List, Optional
+
+from pydantic import BaseModel
+
+class SheetSnapshot(BaseModel):
+    """A locally stored copy of the source sheet rows."""
+    version: str
+    synced_at: datetime
+    rows: List[List]
+
+class WeekSnapshot(BaseModel):
+    """A locally stored copy of one week's rows, read with only some language columns."""
+    version: str
+    synced_at: datetime
+    languages: List[str]
+    rows: List[List]
+
+class SheetSnapshotStore:
+    """Persists sheet rows in a local SQLite database, tagged with the Drive version they came from.
+
+    Whole-sheet snapshots and single-week reads are kept separately, so a narrowed read of one
+    week never replaces the full copy.
+    """
+
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        directory = os.path.dirname(db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        with self._connect() as conn:
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS sheet_snapshots (
+                    spreadsheet_id TEXT NOT NULL,
+                    sheet_key TEXT NOT NULL,
+                    version TEXT NOT NULL,
+                    synced_at TEXT NOT NULL,
+                    rows_json TEXT NOT NULL,
+                    PRIMARY KEY (spreadsheet_id, sheet_key)
+                )
+                """
+            )
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS sheet_week_rows (
+                    spreadsheet_id TEXT NOT NULL,
+                    sheet_key TEXT NOT NULL,
+                    week INTEGER NOT NULL,
+                    version TEXT NOT NULL,
+                    languages TEXT NOT NULL,
+                    synced_at TEXT NOT NULL,
+                    rows_json TEXT NOT NULL,
+                    PRIMARY KEY (spreadsheet_id, sheet_key, week)
+                )
+                """
+            )
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Opens a connection that commits if the block succeeds and is closed either way."""
+        with closing(sqlite3.connect(self.db_path)) as conn, conn:
+            yield conn
+
+    def load(self, spreadsheet_id: str, sheet_key: str) -> Optional[SheetSnapshot]:
+        """Returns the last saved snapshot for a sheet, if any."""
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT version, synced_at, rows_json FROM sheet_snapshots "
+                "WHERE spreadsheet_id = ? AND sheet_key = ?",
+                (spreadsheet_id, sheet_key)
+            ).fetchone()
+
+        if not row:
+            return None
+
+        version, synced_at, rows_json = row
+        return SheetSnapshot(
+            version=version,
+            synced_at=datetime.fromisoformat(synced_at),
+            rows=json.loads(rows_json)
+        )
+
+    def load_version(self, spreadsheet_id: str, sheet_key: str) -> Optional[str]:
+        """Returns the version of the saved snapshot without reading its rows."""
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT version FROM sheet_snapshots WHERE spreadsheet_id = ? AND sheet_key = ?",
+                (spreadsheet_id, sheet_key)
+            ).fetchone()
+        return row[0] if row else None
+
+    def save(self, spreadsheet_id: str, sheet_key: str, version: str, rows: List[List]) -> None:
+        """Replaces the stored snapshot for a sheet."""
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO sheet_snapshots "
+                "(spreadsheet_id, sheet_key, version, synced_at, rows_json) VALUES (?, ?, ?, ?, ?)",
+                (spreadsheet_id, sheet_key, version, datetime.now().isoformat(), json.dumps(rows, ensure_ascii=False))
+            )
+
+    def load_weeks(self, spreadsheet_id: str, sheet_key: str, weeks: List[int]) -> Dict[int, WeekSnapshot]:
+        """Returns the saved rows for each requested week that has any."""
+        if not weeks:
+            return {}
+        placeholders = ", ".join("?" for _ in weeks)
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT week, version, languages, synced_at, rows_json FROM sheet_week_rows "
+                f"WHERE spreadsheet_id = ? AND sheet_key = ? AND week IN ({placeholders})",
+                (spreadsheet_id, sheet_key, *weeks)
+            ).fetchall()
+
+        return {
+            week: WeekSnapshot(
+                version=version,
+                synced_at=datetime.fromisoformat(synced_at),
+                languages=json.loads(languages),
+                rows=json.loads(rows_json)
+            )
+            for week, version, languages, synced_at, rows_json in rows
+        }
+
+    def save_weeks(
+        self,
+        spreadsheet_id: str,
+        sheet_key: str,
+        version: str,
+        languages: List[str],
+        rows_by_week: Dict[int, List[List]]
+    ) -> None:
+        """Replaces the stored rows of each given week."""
+        synced_at = datetime.now().isoformat()
+        with self._connect() as conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO sheet_week_rows "
+                "(spreadsheet_id, sheet_key, week, version, languages, synced_at, rows_json) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (spreadsheet_id, sheet_key, week, version, json.dumps(languages), synced_at,
+                     json.dumps(rows, ensure_ascii=False))
+                    for week, rows in rows_by_week.items()
+                ]
+            )
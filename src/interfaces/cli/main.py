@@ -1,27 +1,103 @@
 import typer
-from typing import Optional
+from pathlib import Path
+from typing import TYPE_CHECKING, List, Optional, Set
 from rich.console import Console
 from rich.table import Table
 from rich.panel import Panel
 
-from src.infrastructure.google.auth import get_google_credentials
-from src.infrastructure.google.sheets import GoogleSheetRepository
-from src.infrastructure.google.forms import GoogleFormService
-from src.application.preview_quiz import PreviewQuizUseCase
-from src.application.create_quiz import CreateQuizUseCase
-from src.domain.models import Language
+from src.domain.language import Language
+from src.infrastructure.export.formats import ExportFormat
+
+if TYPE_CHECKING:
+    from src.application.preview_quiz import PreviewResult
+
+# Google client libraries, use cases and Gradio are slow to import, so each command
+# imports what it needs inside its body. Keep this module's top-level imports light;
+# benchmarks/startup.py enforces the budget for `--help`.
 
 app = typer.Typer(help="Bible Quiz Automation CLI")
 console = Console()
 
+def _report_profile(profile: bool, trace: Optional[Path]) -> None:
+    """Prints the timing summary and/or writes the JSON trace, if requested."""
+    from src.infrastructure.profiling import profiler
+
+    if profile:
+        table = Table(title="API Call Profile", show_header=True, header_style="bold magenta")
+        table.add_column("Call")
+        table.add_column("Count", justify="right")
+        table.add_column("Total (ms)", justify="right")
+        table.add_column("Mean (ms)", justify="right")
+        table.add_column("Max (ms)", justify="right")
+        table.add_column("Payload", justify="right")
+        for row in profiler.summary():
+            table.add_row(
+                row.name,
+                str(row.count),
+                f"{row.total_ms:.1f}",
+                f"{row.mean_ms:.1f}",
+                f"{row.max_ms:.1f}",
+                f"{row.payload_bytes:,} B"
+            )
+        console.print(table)
+
+    if trace:
+        profiler.write_trace(str(trace))
+        console.print(f"[dim]Trace written to {trace}[/dim]")
+
+def _render_preview(result: "PreviewResult") -> None:
+    """Prints the metadata, descriptions and question tables of a PreviewResult."""
+    # Display Metadata
+    console.print(Panel(
+        f"[bold cyan]Week {result.metadata.week} | {result.metadata.dates} | {result.metadata.portion}[/bold cyan]",
+        title="Bible Quiz Metadata",
+        border_style="cyan"
+    ))
+
+    for quiz in result.quizzes:
+        lang_name = quiz.language.display_name
+
+        # Display Description Preview
+        console.print(Panel(
+            quiz.description,
+            title=f"{lang_name} Description Preview",
+            border_style="green",
+            padding=(1, 2)
+        ))
+
+        table = Table(title=f"{lang_name} Questions Preview", show_header=True, header_style="bold magenta")
+        table.add_column("ID", style="dim", width=6)
+        table.add_column("Question")
+        table.add_column("Answer Key", style="green")
+
+        for q in quiz.questions:
+            table.add_row(
+                q.id,
+                q.text,
+                q.formatted_answer_key
+            )
+
+        console.print(table)
+        console.print("\n")
+
 @app.command()
 def preview(
     week: int = typer.Option(..., help="The week number to preview"),
-    lang: Optional[Language] = typer.Option(None, help="Specific language to preview (EN/TA). If omitted, previews all.")
+    lang: Optional[Language] = typer.Option(None, help="Specific language to preview (EN/TA/ML/TE). If omitted, previews all."),
+    profile: bool = typer.Option(False, help="Show a timing summary of Google API calls"),
+    trace: Optional[Path] = typer.Option(None, help="Write a JSON trace of Google API calls to this file")
 ):
     """
     Fetches and displays a preview of the quiz for a given week.
     """
+    from src.infrastructure.google.auth import get_google_credentials
+    from src.infrastructure.google.sheets import GoogleSheetRepository
+    from src.application.preview_quiz import PreviewQuizUseCase
+    from src.infrastructure.profiling import profiler
+
+    if profile or trace:
+        profiler.enable()
+
     try:
         # Move credentials fetching outside status to avoid hiding OAuth browser/URL messages
         creds = get_google_credentials()
@@ -35,56 +111,155 @@ def preview(
             console.print(f"[bold red]Error:[/bold red] No data found for Week {week}.")
             raise typer.Exit(code=1)
         
-        # Display Metadata
-        console.print(Panel(
-            f"[bold cyan]Week {result.metadata.week} | {result.metadata.dates} | {result.metadata.portion}[/bold cyan]",
-            title="Bible Quiz Metadata",
-            border_style="cyan"
-        ))
-        
-        for quiz in result.quizzes:
-            lang_name = "English" if quiz.language == Language.ENGLISH else "Tamil"
-            
-            # Display Description Preview
-            console.print(Panel(
-                quiz.description,
-                title=f"{lang_name} Description Preview",
-                border_style="green",
-                padding=(1, 2)
-            ))
-            
-            table = Table(title=f"{lang_name} Questions Preview", show_header=True, header_style="bold magenta")
-            table.add_column("ID", style="dim", width=6)
-            table.add_column("Question")
-            table.add_column("Answer Key", style="green")
-            
-            for q in quiz.questions:
-                table.add_row(
-                    q.id,
-                    q.text,
-                    q.formatted_answer_key
-                )
-            
-            console.print(table)
-            console.print("\n")
-            
+        _render_preview(result)
+
         console.print("[bold green]Preview successful![/bold green] Run the 'create' command when ready.")
 
     except Exception as e:
         console.print(f"[bold red]Unexpected Error:[/bold red] {str(e)}")
         raise typer.Exit(code=1)
+    finally:
+        _report_profile(profile, trace)
+
+def _parse_weeks(spec: str) -> List[int]:
+    """Parses a week specification like '1-13' or '1,3,5-8' into a sorted list of weeks."""
+    weeks: Set[int] = set()
+    for part in spec.split(","):
+        part = part.strip()
+        if not part:
+            continue
+        if "-" in part:
+            start, end = (int(p) for p in part.split("-", 1))
+            if start > end:
+                raise ValueError(f"Week range '{part}' runs backwards.")
+            weeks.update(range(start, end + 1))
+        else:
+            weeks.add(int(part))
+    return sorted(weeks)
+
+def _resolve_weeks(week: Optional[int], weeks: Optional[str]) -> List[int]:
+    """Returns the weeks chosen with exactly one of --week or --weeks, exiting with an error otherwise."""
+    if week is not None and weeks is None:
+        return [week]
+    if weeks is not None and week is None:
+        try:
+            return _parse_weeks(weeks)
+        except ValueError:
+            raise typer.BadParameter(f"Invalid week range '{weeks}'. Use a form like '1-13' or '1,3,5-8'.")
+
+    console.print("[bold red]Error:[/bold red] Provide either --week or --weeks.")
+    raise typer.Exit(code=1)
+
+def _create_batch(weeks: List[int], lang: Optional[Language], new_form: bool) -> None:
+    """Creates forms for many weeks using a worker pool, after a single confirmation."""
+    from rich.progress import Progress
+    from src.infrastructure.google.auth import get_google_credentials
+    from src.infrastructure.google.sheets import GoogleSheetRepository
+    from src.infrastructure.google.forms import GoogleFormService
+    from src.application.bulk_create_quiz import BulkCreateQuizUseCase
+    from src.infrastructure.config.settings import settings
+
+    creds = get_google_credentials()
+
+    with console.status(f"[bold blue]Loading data for {len(weeks)} weeks...[/bold blue]"):
+        sheet_repo = GoogleSheetRepository(creds)
+        form_service = GoogleFormService(creds, reuse_existing=not new_form)
+        use_case = BulkCreateQuizUseCase(sheet_repo, form_service, max_workers=settings.BULK_MAX_WORKERS)
+        previews = use_case.prepare(weeks, language=lang)
+
+    if not previews:
+        console.print("[bold red]Error:[/bold red] No data found for the selected weeks.")
+        raise typer.Exit(code=1)
+
+    table = Table(title="Batch Preview", show_header=True, header_style="bold magenta")
+    table.add_column("Week", style="dim", width=6)
+    table.add_column("Dates")
+    table.add_column("Portion")
+    table.add_column("Questions", style="green")
+    for preview in previews:
+        counts = ", ".join(
+            f"{q.language.display_name}: {len(q.questions)}"
+            for q in preview.quizzes
+        )
+        table.add_row(str(preview.metadata.week), preview.metadata.dates, preview.metadata.portion, counts)
+    console.print(table)
+
+    found_weeks = {preview.metadata.week for preview in previews}
+    missing_weeks = [w for w in weeks if w not in found_weeks]
+    if missing_weeks:
+        console.print(f"[yellow]No data found for weeks: {', '.join(map(str, missing_weeks))}[/yellow]")
+
+    total_jobs = sum(len(preview.quizzes) for preview in previews)
+    confirm = typer.confirm(f"\nDo you want to proceed with creating {total_jobs} forms?")
+    if not confirm:
+        console.print("[bold yellow]Aborted.[/bold yellow]")
+        return
+
+    with Progress(console=console) as progress:
+        task = progress.add_task("[bold green]Creating Google Forms...[/bold green]", total=total_jobs)
+        result = use_case.execute(previews, on_progress=lambda job: progress.advance(task))
+
+    summary = Table(title="Batch Summary", show_header=True, header_style="bold magenta")
+    summary.add_column("Week", style="dim", width=6)
+    summary.add_column("Language")
+    summary.add_column("Result")
+    for job in result.jobs:
+        lang_name = job.language.display_name
+        outcome = f"[green]{job.form_url}[/green]" if job.succeeded else f"[red]Failed: {job.error}[/red]"
+        summary.add_row(str(job.week), lang_name, outcome)
+    console.print(summary)
+
+    failed = len(result.failed_jobs)
+    console.print(f"\n[bold]{total_jobs - failed} succeeded, {failed} failed.[/bold]")
+    if failed:
+        raise typer.Exit(code=1)
 
 @app.command()
 def create(
-    week: int = typer.Option(..., help="The week number to create forms for"),
-    lang: Optional[Language] = typer.Option(None, help="Specific language to create (EN/TA). If omitted, creates all.")
+    week: Optional[int] = typer.Option(None, help="The week number to create forms for"),
+    weeks: Optional[str] = typer.Option(None, help="Batch mode: a range of weeks to create, e.g. '1-13' or '1,3,5-8'"),
+    lang: Optional[Language] = typer.Option(None, help="Specific language to create (EN/TA/ML/TE). If omitted, creates all."),
+    new_form: bool = typer.Option(False, help="Always create a fresh form instead of updating the one created on a previous run"),
+    profile: bool = typer.Option(False, help="Show a timing summary of Google API calls"),
+    trace: Optional[Path] = typer.Option(None, help="Write a JSON trace of Google API calls to this file")
 ):
     """
-    Creates the Google Forms for a given week after user confirmation.
+    Creates the Google Forms for a given week (or range of weeks) after user confirmation.
+
+    Re-running a week updates its existing form with only the changed questions.
     """
+    from src.infrastructure.profiling import profiler
+
+    week_list = _resolve_weeks(week, weeks)
+
+    if profile or trace:
+        profiler.enable()
+
     try:
+        if weeks is not None:
+            _create_batch(week_list, lang, new_form)
+            return
+        (week,) = week_list
+
+        from src.infrastructure.google.auth import get_google_credentials
+        from src.infrastructure.google.sheets import GoogleSheetRepository
+        from src.infrastructure.google.forms import GoogleFormService
+        from src.application.preview_quiz import PreviewQuizUseCase
+        from src.application.create_quiz import CreateQuizUseCase
+
+        # Move credentials fetching outside status to avoid hiding OAuth browser/URL messages
+        creds = get_google_credentials()
+
+        with console.status(f"[bold blue]Loading data for Week {week}...[/bold blue]"):
+            sheet_repo = GoogleSheetRepository(creds)
+            preview_result = PreviewQuizUseCase(sheet_repo).execute(week, language=lang)
+
+        if not preview_result:
+            console.print(f"[bold red]Error:[/bold red] No data found for Week {week}.")
+            raise typer.Exit(code=1)
+
         # First, show the preview for the selected language(s)
-        preview(week, lang=lang)
+        _render_preview(preview_result)
         
         # Confirmation
         confirm = typer.confirm("\nDo you want to proceed with creating these forms?")
@@ -92,31 +267,366 @@ def create(
             console.print("[bold yellow]Aborted.[/bold yellow]")
             return
 
+        # Publish exactly what was previewed, without reading the sheet again
         with console.status("[bold green]Creating Google Forms...[/bold green]"):
-            creds = get_google_credentials()
-            sheet_repo = GoogleSheetRepository(creds)
-            form_service = GoogleFormService(creds)
+            form_service = GoogleFormService(creds, reuse_existing=not new_form)
             use_case = CreateQuizUseCase(sheet_repo, form_service)
             
-            result = use_case.execute(week, language=lang)
+            result = use_case.publish(preview_result)
         
-        if not result:
-            console.print(f"[bold red]Error:[/bold red] Failed to create forms for Week {week}.")
-            raise typer.Exit(code=1)
-        
-        console.print("\n[bold green]Success! Forms created successfully:[/bold green]")
+        if result.created_forms:
+            console.print("\n[bold green]Success! Forms created successfully:[/bold green]")
         for l, url in result.created_forms:
-            lang_name = "English" if l == Language.ENGLISH else "Tamil"
+            lang_name = l.display_name
             console.print(f"  • [bold]{lang_name}:[/bold] {url}")
+
+        if result.failed_forms:
+            console.print("\n[bold red]Some forms could not be created:[/bold red]")
+        for l, error in result.failed_forms:
+            lang_name = l.display_name
+            console.print(f"  • [bold]{lang_name}:[/bold] {error}")
+
+        if not result.created_forms:
+            raise typer.Exit(code=1)
             
         console.print("\n[yellow]Final Steps (Manual):[/yellow]")
         console.print("  1. Open each form and go to [bold]Settings -> Quizzes[/bold].")
         console.print("  2. Set [bold]Release grades[/bold] to [bold]'Later, after manual review'[/bold].")
-        console.print("  3. Go to [bold]Responses[/bold] tab and click [bold]Link to Sheets[/bold] to connect your response spreadsheet.")
+        console.print(f"  3. After submissions come in, run [bold]ingest --week {week}[/bold] to copy them into your response spreadsheets.")
+
+    except typer.Exit:
+        raise
+    except Exception as e:
+        console.print(f"[bold red]Unexpected Error:[/bold red] {str(e)}")
+        raise typer.Exit(code=1)
+    finally:
+        _report_profile(profile, trace)
+
+@app.command()
+def export(
+    output: Path = typer.Option(..., help="File to write the export to"),
+    week: Optional[int] = typer.Option(None, help="The week number to export"),
+    weeks: Optional[str] = typer.Option(None, help="A range of weeks to export, e.g. '1-52' or '1,3,5-8'"),
+    lang: Optional[Language] = typer.Option(None, help="Specific language to export (EN/TA/ML/TE). If omitted, exports all."),
+    fmt: ExportFormat = typer.Option(ExportFormat.HTML, "--format", help="json, csv, html (printable quiz) or answer-key (printable answer key)")
+):
+    """
+    Writes the quiz for a week (or range of weeks) to a file for paper or offline use.
+
+    Only the source sheet is read; no forms are created.
+    """
+    week_list = _resolve_weeks(week, weeks)
+
+    try:
+        from src.infrastructure.google.auth import get_google_credentials
+        from src.infrastructure.google.sheets import GoogleSheetRepository
+        from src.infrastructure.export.renderers import create_exporter
+        from src.application.export_quiz import ExportQuizUseCase
+
+        # Move credentials fetching outside status to avoid hiding OAuth browser/URL messages
+        creds = get_google_credentials()
+
+        # CSV needs newline="" so the csv module controls line endings
+        with open(output, "w", encoding="utf-8", newline="" if fmt == ExportFormat.CSV else None) as stream:
+            with console.status(f"[bold blue]Exporting {len(week_list)} week(s)...[/bold blue]") as status:
+                use_case = ExportQuizUseCase(GoogleSheetRepository(creds), create_exporter(fmt, stream))
+                result = use_case.execute(
+                    week_list,
+                    language=lang,
+                    on_progress=lambda w: status.update(f"[bold blue]Exported Week {w}...[/bold blue]")
+                )
+
+        if result.missing_weeks:
+            console.print(f"[yellow]No data found for weeks: {', '.join(map(str, result.missing_weeks))}[/yellow]")
+        if not result.exported_weeks:
+            console.print("[bold red]Error:[/bold red] No data found for the selected weeks.")
+            raise typer.Exit(code=1)
+
+        console.print(f"[bold green]Exported {result.quiz_count} quizzes to {output}.[/bold green]")
+
+    except typer.Exit:
+        raise
+    except Exception as e:
+        console.print(f"[bold red]Unexpected Error:[/bold red] {str(e)}")
+        raise typer.Exit(code=1)
+
+@app.command(name="compile")
+def compile_forms(
+    output: Path = typer.Option(..., help="JSON file to write the compiled requests to"),
+    week: Optional[int] = typer.Option(None, help="The week number to compile"),
+    weeks: Optional[str] = typer.Option(None, help="A range of weeks to compile, e.g. '1-52' or '1,3,5-8'"),
+    lang: Optional[Language] = typer.Option(None, help="Specific language to compile (EN/TA/ML/TE). If omitted, compiles all.")
+):
+    """
+    Writes the exact Forms API batchUpdate body each quiz would be published with, plus size estimates.
+
+    Only the source sheet is read; no forms are created or changed.
+    """
+    week_list = _resolve_weeks(week, weeks)
+
+    try:
+        from src.infrastructure.google.auth import get_google_credentials
+        from src.infrastructure.google.sheets import GoogleSheetRepository
+        from src.infrastructure.google.form_compiler import CompiledFormExporter
+        from src.application.export_quiz import ExportQuizUseCase
+
+        # Move credentials fetching outside status to avoid hiding OAuth browser/URL messages
+        creds = get_google_credentials()
+
+        with open(output, "w", encoding="utf-8") as stream:
+            with console.status(f"[bold blue]Compiling {len(week_list)} week(s)...[/bold blue]") as status:
+                exporter = CompiledFormExporter(stream)
+                result = ExportQuizUseCase(GoogleSheetRepository(creds), exporter).execute(
+                    week_list,
+                    language=lang,
+                    on_progress=lambda w: status.update(f"[bold blue]Compiled Week {w}...[/bold blue]")
+                )
+
+        if result.missing_weeks:
+            console.print(f"[yellow]No data found for weeks: {', '.join(map(str, result.missing_weeks))}[/yellow]")
+        if not result.exported_weeks:
+            console.print("[bold red]Error:[/bold red] No data found for the selected weeks.")
+            raise typer.Exit(code=1)
+
+        table = Table(title="Compiled Forms", show_header=True, header_style="bold magenta")
+        table.add_column("Week", style="dim", width=6)
+        table.add_column("Language")
+        table.add_column("Requests", justify="right")
+        table.add_column("Payload", justify="right")
+        table.add_column("Batches", justify="right")
+        for quiz, compiled in exporter.compiled:
+            table.add_row(
+                str(quiz.metadata.week),
+                quiz.language.display_name,
+                str(compiled.request_count),
+                f"{compiled.payload_bytes / 1024:.1f} KB",
+                str(compiled.batch_count)
+            )
+        console.print(table)
+        console.print(f"[bold green]Compiled {result.quiz_count} quizzes to {output}.[/bold green]")
+
+    except typer.Exit:
+        raise
+    except Exception as e:
+        console.print(f"[bold red]Unexpected Error:[/bold red] {str(e)}")
+        raise typer.Exit(code=1)
+
+@app.command()
+def ingest(
+    week: Optional[int] = typer.Option(None, help="The week number to ingest responses for"),
+    weeks: Optional[str] = typer.Option(None, help="A range of weeks to ingest, e.g. '1-13' or '1,3,5-8'"),
+    lang: Optional[Language] = typer.Option(None, help="Specific language to ingest (EN/TA/ML/TE). If omitted, ingests all."),
+    profile: bool = typer.Option(False, help="Show a timing summary of Google API calls"),
+    trace: Optional[Path] = typer.Option(None, help="Write a JSON trace of Google API calls to this file")
+):
+    """
+    Copies new form responses into each language's response spreadsheet.
+
+    Each run picks up where the previous one stopped, so only new submissions are transferred.
+    New responses are also graded and added to the season leaderboard.
+    """
+    from src.infrastructure.profiling import profiler
+
+    week_list = _resolve_weeks(week, weeks)
+
+    if profile or trace:
+        profiler.enable()
+
+    try:
+        from src.infrastructure.google.auth import get_google_credentials
+        from src.infrastructure.google.sheets import GoogleSheetRepository
+        from src.infrastructure.google.responses import GoogleResponseSource, GoogleResponseSheetWriter
+        from src.infrastructure.storage.ingestion_log import SqliteIngestionLog
+        from src.infrastructure.storage.score_store import SqliteScoreStore
+        from src.application.ingest_responses import IngestResponsesUseCase
+        from src.infrastructure.config.settings import settings
+
+        # Move credentials fetching outside status to avoid hiding OAuth browser/URL messages
+        creds = get_google_credentials()
+
+        use_case = IngestResponsesUseCase(
+            GoogleResponseSource(creds),
+            GoogleResponseSheetWriter(creds),
+            SqliteIngestionLog(settings.LOCAL_STORE_PATH),
+            chunk_size=settings.RESPONSE_WRITE_CHUNK_SIZE,
+            sheet_repo=GoogleSheetRepository(creds),
+            score_store=SqliteScoreStore(settings.LOCAL_STORE_PATH),
+            match_threshold=settings.GRADING_MATCH_THRESHOLD,
+            review_threshold=settings.GRADING_REVIEW_THRESHOLD
+        )
+
+        with console.status("[bold blue]Ingesting responses...[/bold blue]") as status:
+            result = use_case.execute(
+                settings.QUIZ_YEAR,
+                week_list,
+                language=lang,
+                on_chunk=lambda job: status.update(
+                    f"[bold blue]Week {job.week} ({job.language.value}): {job.ingested:,} responses ingested...[/bold blue]"
+                )
+            )
 
+        summary = Table(title="Ingestion Summary", show_header=True, header_style="bold magenta")
+        summary.add_column("Week", style="dim", width=6)
+        summary.add_column("Language")
+        summary.add_column("Result")
+        for job in result.jobs:
+            lang_name = job.language.display_name
+            if job.error:
+                outcome = f"[red]Failed: {job.error}[/red]"
+            elif not job.form_id:
+                outcome = "[dim]No form created yet[/dim]"
+            else:
+                outcome = f"[green]{job.ingested:,} new responses[/green]"
+            summary.add_row(str(job.week), lang_name, outcome)
+        console.print(summary)
+
+        console.print(f"\n[bold]{result.total_ingested:,} new responses ingested.[/bold]")
+        if result.failed_jobs:
+            raise typer.Exit(code=1)
+
+    except typer.Exit:
+        raise
     except Exception as e:
         console.print(f"[bold red]Unexpected Error:[/bold red] {str(e)}")
         raise typer.Exit(code=1)
+    finally:
+        _report_profile(profile, trace)
+
+@app.command()
+def grade(
+    week: int = typer.Option(..., help="The week number to grade"),
+    lang: Optional[Language] = typer.Option(None, help="Specific language to grade (EN/TA/ML/TE). If omitted, grades all."),
+    limit: int = typer.Option(50, help="Maximum number of answers to list for manual review"),
+    profile: bool = typer.Option(False, help="Show a timing summary of Google API calls"),
+    trace: Optional[Path] = typer.Option(None, help="Write a JSON trace of Google API calls to this file")
+):
+    """
+    Grades the week's form responses against the answer keys and lists answers that need a manual look.
+    """
+    from src.infrastructure.profiling import profiler
+
+    if profile or trace:
+        profiler.enable()
+
+    try:
+        from src.infrastructure.google.auth import get_google_credentials
+        from src.infrastructure.google.sheets import GoogleSheetRepository
+        from src.infrastructure.google.responses import GoogleResponseSource
+        from src.application.grade_responses import GradeResponsesUseCase
+        from src.domain.grading import GradeStatus
+        from src.infrastructure.config.settings import settings
+
+        # Move credentials fetching outside status to avoid hiding OAuth browser/URL messages
+        creds = get_google_credentials()
+
+        with console.status(f"[bold blue]Grading responses for Week {week}...[/bold blue]"):
+            use_case = GradeResponsesUseCase(
+                GoogleSheetRepository(creds),
+                GoogleResponseSource(creds),
+                match_threshold=settings.GRADING_MATCH_THRESHOLD,
+                review_threshold=settings.GRADING_REVIEW_THRESHOLD
+            )
+            results = use_case.execute(settings.QUIZ_YEAR, week, language=lang)
+
+        if not results:
+            console.print(f"[bold red]Error:[/bold red] No forms have been created for Week {week}.")
+            raise typer.Exit(code=1)
+
+        summary = Table(title=f"Week {week} Grading Summary", show_header=True, header_style="bold magenta")
+        summary.add_column("Language")
+        summary.add_column("Responses", justify="right")
+        summary.add_column("Average Score", justify="right")
+        summary.add_column("Needs Review", justify="right", style="yellow")
+        for result in results:
+            lang_name = result.language.display_name
+            count = len(result.responses)
+            average = sum(r.total_score for r in result.responses) / count if count else 0.0
+            summary.add_row(lang_name, f"{count:,}", f"{average:.1f}", f"{len(result.needs_review):,}")
+        console.print(summary)
+
+        review = Table(title="Answers Needing Review", show_header=True, header_style="bold magenta")
+        review.add_column("Language")
+        review.add_column("Email")
+        review.add_column("ID", style="dim", width=6)
+        review.add_column("Answer")
+        review.add_column("Similarity", justify="right")
+        shown = total = 0
+        for result in results:
+            lang_name = result.language.display_name
+            for response in result.needs_review:
+                for item in response.grades:
+                    if item.status != GradeStatus.NEEDS_REVIEW:
+                        continue
+                    total += 1
+                    if shown < limit:
+                        review.add_row(lang_name, response.response.email or "-", item.question_id, item.answer, f"{item.similarity:.2f}")
+                        shown += 1
+
+        if total:
+            console.print(review)
+            if total > shown:
+                console.print(f"[dim]... and {total - shown:,} more. Use --limit to show more.[/dim]")
+        else:
+            console.print("[bold green]Every answer was graded automatically.[/bold green]")
+
+    except typer.Exit:
+        raise
+    except Exception as e:
+        console.print(f"[bold red]Unexpected Error:[/bold red] {str(e)}")
+        raise typer.Exit(code=1)
+    finally:
+        _report_profile(profile, trace)
+
+@app.command()
+def leaderboard(
+    lang: Optional[Language] = typer.Option(None, help="Rank one language (EN/TA/ML/TE). If omitted, scores are summed across languages."),
+    limit: int = typer.Option(20, help="Number of participants to show")
+):
+    """
+    Shows the season leaderboard built from ingested responses.
+    """
+    from src.infrastructure.storage.score_store import SqliteScoreStore
+    from src.infrastructure.config.settings import settings
+
+    entries = SqliteScoreStore(settings.LOCAL_STORE_PATH).get_leaderboard(settings.QUIZ_YEAR, language=lang, limit=limit)
+    if not entries:
+        console.print("[yellow]No scores yet. Run the 'ingest' command after responses come in.[/yellow]")
+        return
+
+    scope = "All Languages" if lang is None else lang.display_name
+    table = Table(title=f"{settings.QUIZ_YEAR} Leaderboard ({scope})", show_header=True, header_style="bold magenta")
+    table.add_column("Rank", justify="right", width=6)
+    table.add_column("Participant")
+    table.add_column("Score", justify="right", style="green")
+    table.add_column("Quizzes", justify="right")
+    for entry in entries:
+        table.add_row(str(entry.rank), entry.email, str(entry.total_score), str(entry.quizzes_taken))
+    console.print(table)
+
+@app.command()
+def pool(
+    size: Optional[int] = typer.Option(None, help="Copies to keep ready (defaults to FORM_POOL_SIZE)")
+):
+    """
+    Fills the pool of blank template form copies used to speed up 'create'.
+    """
+    from src.infrastructure.google.auth import get_google_credentials
+    from src.infrastructure.google.form_pool import TemplateFormPool
+    from src.infrastructure.config.settings import settings
+
+    target = settings.FORM_POOL_SIZE if size is None else size
+    if not settings.TEMPLATE_FORM_ID or target <= 0:
+        console.print("[yellow]The form pool is off. Set TEMPLATE_FORM_ID and FORM_POOL_SIZE in .env, or pass --size.[/yellow]")
+        return
+
+    try:
+        form_pool = TemplateFormPool(get_google_credentials(), settings.TEMPLATE_FORM_ID, target, settings.FORM_POOL_FOLDER_ID)
+        with console.status(f"[bold blue]Copying the template until {target} blank forms are ready...[/bold blue]"):
+            added = form_pool.fill()
+        console.print(f"[bold green]Pool ready:[/bold green] {form_pool.available()} blank forms ({added} new).")
+    except Exception as e:
+        console.print(f"[bold red]Error filling the form pool:[/bold red] {str(e)}")
+        raise typer.Exit(code=1)
 
 @app.command()
 def ui(
@@ -126,8 +636,9 @@ def ui(
     Launches the Gradio Web UI for a more interactive experience.
     """
     try:
-        from src.interfaces.ui.gradio_app import demo
+        from src.interfaces.ui.gradio_app import demo, start_warmup
         console.print("[bold blue]Starting Gradio UI...[/bold blue]")
+        start_warmup()
         demo.launch(share=share)
     except Exception as e:
         console.print(f"[bold red]Error launching UI:[/bold red] {str(e)}")
@@ -1,36 +1,94 @@
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
 import gradio as gr
 import pandas as pd
-from typing import Optional, List, Tuple, Dict, Any
+from typing import Optional, List, Tuple, Dict, Any, Iterator
 
 from src.infrastructure.google.auth import get_google_credentials
 from src.infrastructure.google.sheets import GoogleSheetRepository
 from src.infrastructure.google.forms import GoogleFormService
-from src.application.preview_quiz import PreviewQuizUseCase
-from src.application.create_quiz import CreateQuizUseCase
+from src.infrastructure.google.execution import api_executor
+from src.infrastructure.google.service_factory import preload_discovery_documents
+from src.infrastructure.config.settings import settings
+from src.infrastructure.profiling import ProfileRecorder, profiler
+from src.infrastructure.storage.score_store import SqliteScoreStore
+from src.application.preview_quiz import PreviewQuizUseCase, PreviewResult
+from src.application.create_quiz import CreateQuizUseCase, CreateQuizResult
 from src.domain.models import Language, Quiz
 
 # Global containers for initialized use cases
 # Initializing them globally prevents re-auth checks on every button click
 _PREVIEW_USE_CASE: Optional[PreviewQuizUseCase] = None
 _CREATE_USE_CASE: Optional[CreateQuizUseCase] = None
+# Several queued events can run at once, so only one of them may build the services
+_SERVICES_LOCK = threading.Lock()
+
+# Background warm-up started at launch (see start_warmup)
+_WARMUP_LOCK = threading.Lock()
+_WARMUP_THREAD: Optional[threading.Thread] = None
+_WARMUP_DONE = threading.Event()
+_WARMUP_STATUS = "⚪ Not connected yet. The first action will connect to Google."
 
 def initialize_services():
     """Initializes and returns the use cases. Handled as a singleton."""
     global _PREVIEW_USE_CASE, _CREATE_USE_CASE
     
-    if _PREVIEW_USE_CASE is None or _CREATE_USE_CASE is None:
-        try:
-            creds = get_google_credentials()
-            sheet_repo = GoogleSheetRepository(creds)
-            form_service = GoogleFormService(creds)
-            
-            _PREVIEW_USE_CASE = PreviewQuizUseCase(sheet_repo)
-            _CREATE_USE_CASE = CreateQuizUseCase(sheet_repo, form_service)
-        except Exception as e:
-            raise RuntimeError(f"Failed to connect to Google Services: {str(e)}")
+    with _SERVICES_LOCK:
+        if _PREVIEW_USE_CASE is None or _CREATE_USE_CASE is None:
+            try:
+                creds = get_google_credentials()
+                sheet_repo = GoogleSheetRepository(creds)
+                form_service = GoogleFormService(creds)
+                
+                _PREVIEW_USE_CASE = PreviewQuizUseCase(sheet_repo)
+                _CREATE_USE_CASE = CreateQuizUseCase(sheet_repo, form_service)
+            except Exception as e:
+                raise RuntimeError(f"Failed to connect to Google Services: {str(e)}")
     
     return _PREVIEW_USE_CASE, _CREATE_USE_CASE
 
+def current_week(today: Optional[date] = None) -> int:
+    """The quiz week containing today, counting 7-day weeks from 1 January of QUIZ_YEAR (week 1 outside that year)."""
+    today = today or date.today()
+    if today.year != settings.QUIZ_YEAR:
+        return 1
+    return (today.timetuple().tm_yday - 1) // 7 + 1
+
+def _warm_up() -> None:
+    """Loads credentials, services and this week's and next week's data, and tops up the form pool,
+    so the first click is as fast as later ones."""
+    global _WARMUP_STATUS
+    try:
+        _WARMUP_STATUS = "⏳ Connecting to Google services..."
+        preview_use_case, create_use_case = initialize_services()
+        preload_discovery_documents()
+        create_use_case.form_service.prepare()
+
+        week = current_week()
+        _WARMUP_STATUS = f"⏳ Loading Weeks {week} and {week + 1}..."
+        preview_use_case.sheet_repo.prefetch([week, week + 1], list(Language))
+        _WARMUP_STATUS = f"🟢 Ready. Weeks {week} and {week + 1} are loaded."
+    except Exception as e:
+        _WARMUP_STATUS = f"🟠 Could not warm up ({str(e)}). The first action will connect instead."
+    finally:
+        _WARMUP_DONE.set()
+
+def start_warmup() -> None:
+    """Starts the warm-up in a background thread. Only the first call in a process does anything."""
+    global _WARMUP_THREAD
+    with _WARMUP_LOCK:
+        if _WARMUP_THREAD is None:
+            _WARMUP_THREAD = threading.Thread(target=_warm_up, name="warm-up", daemon=True)
+            _WARMUP_THREAD.start()
+
+def watch_warmup() -> Iterator[str]:
+    """Streams the warm-up status to the page until it finishes."""
+    while _WARMUP_THREAD is not None and not _WARMUP_DONE.wait(timeout=0.5):
+        yield _WARMUP_STATUS
+    yield _WARMUP_STATUS
+
 def format_questions_to_df(quiz: Quiz) -> pd.DataFrame:
     """Converts quiz questions to a Pandas DataFrame for display."""
     data = []
@@ -42,28 +100,73 @@ def format_questions_to_df(quiz: Quiz) -> pd.DataFrame:
         })
     return pd.DataFrame(data)
 
-def handle_preview(week: int, lang_choice: str):
-    """Action for the Preview button."""
+def format_profile_to_df(recorder: ProfileRecorder) -> pd.DataFrame:
+    """Converts the API call timings of one action to a Pandas DataFrame for display."""
+    data = []
+    for row in recorder.summary():
+        data.append({
+            "Call": row.name,
+            "Count": row.count,
+            "Total (ms)": round(row.total_ms, 1),
+            "Mean (ms)": round(row.mean_ms, 1),
+            "Max (ms)": round(row.max_ms, 1),
+            "Payload (bytes)": row.payload_bytes
+        })
+    return pd.DataFrame(data)
+
+def _language_from_choice(lang_choice: str) -> Optional[Language]:
+    """Maps the language selection to a Language; "All" maps to None."""
+    return next((lang for lang in Language if lang.display_name == lang_choice), None)
+
+def _empty_language_outputs() -> Tuple:
+    """An empty (table, description) pair for every language tab."""
+    return tuple(value for _ in Language for value in (pd.DataFrame(), ""))
+
+def format_progress(title: str, stages: List[str]) -> str:
+    """Renders the stages reached so far as a Markdown checklist; the last one is in progress."""
+    lines = [f"- ✅ {stage}" for stage in stages[:-1]]
+    lines.extend(f"- ⏳ {stage}..." for stage in stages[-1:])
+    return f"### ⏳ {title}\n" + "\n".join(lines)
+
+def handle_preview(week: int, lang_choice: str, last_preview: Optional[PreviewResult]) -> Iterator[tuple]:
+    """Action for the Preview button. Streams progress, then the loaded preview."""
+    # This click's API timings, apart from other users' actions; shown in the timing panel
+    recorder = ProfileRecorder()
+    # While loading, keep the current tables and the previous preview untouched
+    unchanged = (gr.update(), *(gr.update() for _ in range(2 * len(Language))), last_preview, gr.update())
+    title = f"Loading Week {week}"
+
+    stages = ["Connecting to Google services"]
+    yield (format_progress(title, stages), *unchanged)
+    try:
+        with profiler.scope(recorder):
+            initialize_services()
+    except Exception as e:
+        yield (f"### ❌ Initialization/Auth Error\n{str(e)}", "", *_empty_language_outputs(), None, format_profile_to_df(recorder))
+        return
+
+    stages.append(f"Fetching Week {week} from Google Sheets")
+    yield (format_progress(title, stages), *unchanged)
+    # Scopes are opened per step, since the generator may resume on a different thread after each yield
+    with profiler.scope(recorder):
+        outputs = _run_preview(week, lang_choice)
+    yield (*outputs, format_profile_to_df(recorder))
+
+def _run_preview(week: int, lang_choice: str):
+    """Loads the preview and returns the values for the preview outputs."""
     try:
         preview_use_case, _ = initialize_services()
-        
-        lang = None
-        if lang_choice == "English":
-            lang = Language.ENGLISH
-        elif lang_choice == "Tamil":
-            lang = Language.TAMIL
-            
-        result = preview_use_case.execute(week, language=lang)
+
+        # Each click has its own API call budget, apart from other users' requests running alongside
+        with api_executor.budget_scope():
+            result = preview_use_case.execute(week, language=_language_from_choice(lang_choice))
         
         if not result:
             return (
                 f"### ❌ Error\nNo data found for Week {week}.",
                 "", # Metadata
-                pd.DataFrame(), # EN Table
-                "", # EN Desc
-                pd.DataFrame(), # TA Table
-                "", # TA Desc
-                0   # Reset last_preview_week
+                *_empty_language_outputs(), # Table and description per language
+                None # Reset last_preview
             )
         
         metadata_md = (
@@ -72,80 +175,138 @@ def handle_preview(week: int, lang_choice: str):
             f"**Portion:** {result.metadata.portion}"
         )
         
-        en_df = pd.DataFrame()
-        en_desc = ""
-        ta_df = pd.DataFrame()
-        ta_desc = ""
-        
-        for quiz in result.quizzes:
-            if quiz.language == Language.ENGLISH:
-                en_df = format_questions_to_df(quiz)
-                en_desc = quiz.description
-            elif quiz.language == Language.TAMIL:
-                ta_df = format_questions_to_df(quiz)
-                ta_desc = quiz.description
+        quizzes = {quiz.language: quiz for quiz in result.quizzes}
+        language_outputs = []
+        for lang in Language:
+            quiz = quizzes.get(lang)
+            language_outputs.extend([format_questions_to_df(quiz), quiz.description] if quiz else [pd.DataFrame(), ""])
                 
         return (
             "### ✅ Preview loaded successfully.",
             metadata_md,
-            en_df,
-            en_desc,
-            ta_df,
-            ta_desc,
-            week # Update last_preview_week
+            *language_outputs,
+            result # Update last_preview
         )
     except Exception as e:
-        return (f"### ❌ Initialization/Auth Error\n{str(e)}", "", pd.DataFrame(), "", pd.DataFrame(), "", 0)
+        return (f"### ❌ Initialization/Auth Error\n{str(e)}", "", *_empty_language_outputs(), None)
 
-def handle_create_request(week: int, last_preview_week: int, lang_choice: str):
-    """Validates week match and performs creation if valid."""
-    if week != last_preview_week:
-        return (
-            f"### ⚠️ Week Mismatch\nYou have changed the week to **{week}**, but the current preview is for Week **{last_preview_week}**.\n\n"
+def handle_create_request(week: int, last_preview: Optional[PreviewResult], lang_choice: str) -> Iterator[tuple]:
+    """Action for the Generate button. Streams each form's progress, then the created links."""
+    recorder = ProfileRecorder()
+    preview, error_md = _select_preview(week, last_preview, lang_choice)
+    if not preview:
+        yield error_md, format_profile_to_df(recorder)
+        return
+
+    title = f"Creating forms for Week {week}"
+    yield format_progress(title, ["Connecting to Google services"]), gr.update()
+    try:
+        with profiler.scope(recorder):
+            _, create_use_case = initialize_services()
+    except Exception as e:
+        yield f"### ❌ Initialization/Auth Error\n{str(e)}", format_profile_to_df(recorder)
+        return
+
+    # Stage updates arrive from the publishing threads; this generator relays them to the browser
+    events: "queue.Queue[Tuple[Language, str]]" = queue.Queue()
+    stages: Dict[Language, List[str]] = {quiz.language: [] for quiz in preview.quizzes}
+    def publish() -> CreateQuizResult:
+        # The budget and timings are scoped on the worker, since this generator may resume on a different thread
+        with api_executor.budget_scope(), profiler.scope(recorder):
+            return create_use_case.publish(preview, lambda lang, stage: events.put((lang, stage)))
+
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        future = pool.submit(publish)
+        while not future.done() or not events.empty():
+            try:
+                lang, stage = events.get(timeout=0.2)
+            except queue.Empty:
+                continue
+            stages[lang].append(stage)
+            sections = [
+                format_progress(f"{title} — {l.display_name}", s or ["Waiting to start"])
+                for l, s in stages.items()
+            ]
+            yield "\n\n".join(sections), gr.update()
+
+    try:
+        result = future.result()
+    except Exception as e:
+        yield f"### ❌ Error\n{str(e)}", format_profile_to_df(recorder)
+        return
+    yield _format_create_result(week, result), format_profile_to_df(recorder)
+
+def _select_preview(
+    week: int,
+    last_preview: Optional[PreviewResult],
+    lang_choice: str
+) -> Tuple[Optional[PreviewResult], str]:
+    """Checks that the preview matches the selection; returns the quizzes to publish or an error message."""
+    if last_preview is None:
+        return None, (
+            f"### ⚠️ No Preview\nPlease click **Preview Quiz Data** for Week {week} first to verify the questions before generating forms."
+        )
+    if week != last_preview.metadata.week:
+        return None, (
+            f"### ⚠️ Week Mismatch\nYou have changed the week to **{week}**, but the current preview is for Week **{last_preview.metadata.week}**.\n\n"
             f"Please click **Preview Quiz Data** for Week {week} first to verify the questions before generating forms."
         )
     
-    try:
-        _, create_use_case = initialize_services()
-        
-        lang = None
-        if lang_choice == "English":
-            lang = Language.ENGLISH
-        elif lang_choice == "Tamil":
-            lang = Language.TAMIL
-            
-        result = create_use_case.execute(week, language=lang)
-        
-        if not result:
-            return f"### ❌ Error\nFailed to create forms for Week {week}."
-        
-        output_md = f"### 🎉 Success! Forms created for Week {week}:\n"
-        for l, url in result.created_forms:
-            lang_name = "English" if l == Language.ENGLISH else "Tamil"
-            output_md += f"- **{lang_name}:** [Open Google Form]({url})\n"
-            
-        output_md += "\n#### ⚠️ Next Steps (Manual):\n"
-        output_md += "1. Open each form and go to **Settings -> Quizzes**.\n"
-        output_md += "2. Set **Release grades** to **'Later, after manual review'**.\n"
-        output_md += "3. Go to **Responses** tab and click **Link to Sheets** to connect your response spreadsheet."
-        
+    preview = last_preview.select(_language_from_choice(lang_choice))
+    if not preview:
+        return None, (
+            f"### ⚠️ Language Mismatch\nThe current preview does not include **{lang_choice}**.\n\n"
+            f"Please click **Preview Quiz Data** again with this language selected before generating forms."
+        )
+    return preview, ""
+
+def _format_create_result(week: int, result: CreateQuizResult) -> str:
+    """Renders the created form links and any per-language failures as Markdown."""
+    output_md = ""
+    if result.created_forms:
+        output_md += f"### 🎉 Success! Forms created for Week {week}:\n"
+    for l, url in result.created_forms:
+        lang_name = l.display_name
+        output_md += f"- **{lang_name}:** [Open Google Form]({url})\n"
+
+    if result.failed_forms:
+        output_md += f"\n### ❌ Some forms could not be created for Week {week}:\n"
+    for l, error in result.failed_forms:
+        lang_name = l.display_name
+        output_md += f"- **{lang_name}:** {error}\n"
+
+    if not result.created_forms:
         return output_md
-    except Exception as e:
-        return f"### ❌ Initialization/Auth Error\n{str(e)}"
+        
+    output_md += "\n#### ⚠️ Next Steps (Manual):\n"
+    output_md += "1. Open each form and go to **Settings -> Quizzes**.\n"
+    output_md += "2. Set **Release grades** to **'Later, after manual review'**.\n"
+    output_md += f"3. After submissions come in, run `ingest --week {week}` to copy them into your response spreadsheets."
+    
+    return output_md
+
+def handle_leaderboard(lang_choice: str) -> pd.DataFrame:
+    """Action for the Refresh Leaderboard button. Reads the local score store only; no Google calls."""
+    lang = _language_from_choice(lang_choice)
+    entries = SqliteScoreStore(settings.LOCAL_STORE_PATH).get_leaderboard(settings.QUIZ_YEAR, language=lang, limit=100)
+    return pd.DataFrame([
+        {"Rank": e.rank, "Participant": e.email, "Score": e.total_score, "Quizzes": e.quizzes_taken}
+        for e in entries
+    ])
 
 # Build Gradio UI
 with gr.Blocks(title="Bible Quiz Automation", theme=gr.themes.Soft()) as demo:
-    # State to track the last week that was successfully previewed
-    last_preview_week = gr.State(value=0)
+    # State holding the last successful preview; Generate publishes exactly this content
+    last_preview = gr.State(value=None)
 
     gr.Markdown("# 📖 Bible Quiz Automation")
     gr.Markdown("Automate the creation of Google Forms for weekly Bible Quizzes.")
     
     with gr.Row():
         with gr.Column(scale=1):
-            week_input = gr.Number(label="Week Number", value=1, precision=0)
+            week_input = gr.Number(label="Week Number", value=current_week, precision=0)
             lang_input = gr.Radio(
-                choices=["All", "English", "Tamil"], 
+                choices=["All", *(lang.display_name for lang in Language)], 
                 label="Language Selection", 
                 value="All"
             )
@@ -153,31 +314,58 @@ with gr.Blocks(title="Bible Quiz Automation", theme=gr.themes.Soft()) as demo:
             create_btn = gr.Button("🚀 2. Generate Google Forms", variant="primary")
             
         with gr.Column(scale=2):
+            readiness_display = gr.Markdown(_WARMUP_STATUS)
             status_output = gr.Markdown("Ready. Start by selecting a week and clicking Preview.")
             metadata_display = gr.Markdown("")
 
+    # (table, description) for each language, in Language order
+    language_displays = []
     with gr.Tabs() as tabs:
-        with gr.Tab("English Preview", id=0):
-            en_desc_display = gr.Markdown("*Preview not loaded*")
-            en_table_display = gr.Dataframe(label="English Questions")
-            
-        with gr.Tab("Tamil Preview", id=1):
-            ta_desc_display = gr.Markdown("*Preview not loaded*")
-            ta_table_display = gr.Dataframe(label="Tamil Questions")
+        for index, lang in enumerate(Language):
+            with gr.Tab(f"{lang.display_name} Preview", id=index):
+                desc_display = gr.Markdown("*Preview not loaded*")
+                table_display = gr.Dataframe(label=f"{lang.display_name} Questions")
+                language_displays.extend([table_display, desc_display])
+
+        with gr.Tab("🏆 Leaderboard", id=len(Language)):
+            gr.Markdown("Season standings from ingested responses (run the `ingest` command to update). Uses the language selection above.")
+            leaderboard_btn = gr.Button("🔄 Refresh Leaderboard", variant="secondary")
+            leaderboard_display = gr.Dataframe(label="Top 100 participants")
+
+    with gr.Accordion("⏱️ API Timings", open=False):
+        profile_display = gr.Dataframe(label="Google API calls for the last action")
 
     # Wire up the buttons
+    # Each click streams its progress; the queue caps how many run at once per button
     preview_btn.click(
         fn=handle_preview,
-        inputs=[week_input, lang_input],
-        outputs=[status_output, metadata_display, en_table_display, en_desc_display, ta_table_display, ta_desc_display, last_preview_week]
+        inputs=[week_input, lang_input, last_preview],
+        outputs=[status_output, metadata_display, *language_displays, last_preview, profile_display],
+        concurrency_limit=settings.UI_PREVIEW_CONCURRENCY,
+        concurrency_id="preview"
     )
     
     # Combined Validation and Creation
     create_btn.click(
         fn=handle_create_request,
-        inputs=[week_input, last_preview_week, lang_input],
-        outputs=[status_output]
+        inputs=[week_input, last_preview, lang_input],
+        outputs=[status_output, profile_display],
+        concurrency_limit=settings.UI_CREATE_CONCURRENCY,
+        concurrency_id="create"
     )
 
+    leaderboard_btn.click(
+        fn=handle_leaderboard,
+        inputs=[lang_input],
+        outputs=[leaderboard_display]
+    )
+
+    # Polling only waits on an event, so it does not count against the preview slots
+    demo.load(fn=watch_warmup, outputs=[readiness_display], concurrency_limit=None)
+
+# Queue clicks instead of tying up a server worker per request; extra clicks wait with a queue position
+demo.queue(max_size=settings.UI_QUEUE_MAX_SIZE, default_concurrency_limit=settings.UI_PREVIEW_CONCURRENCY)
+
 if __name__ == "__main__":
+    start_warmup()
     demo.launch()
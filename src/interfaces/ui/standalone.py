@@ -4,7 +4,7 @@ import webview
 import sys
 import os
 import logging
-from src.interfaces.ui.gradio_app import demo
+from src.interfaces.ui.gradio_app import demo, start_warmup
 
 # Setup logging to a file in the project root
 logging.basicConfig(
@@ -17,6 +17,8 @@ def launch_gradio():
     """Starts the Gradio server and returns the local URL."""
     try:
         logging.info("Attempting to launch Gradio server...")
+        # Connect to Google while the server and window start up
+        start_warmup()
         # launch() returns the FastAPI app, local URL, and share URL
         result = demo.launch(
             prevent_thread_lock=True, 